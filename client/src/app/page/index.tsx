@@ -28,7 +28,7 @@ import { DateTimeContext } from "@com.mgmtp.a12.widgets/widgets-core/lib/common/
 
 import { DEFAULT_TRANSLATIONS, LocaleWithName } from "../../localization";
 
-import { ThemeContextProvider, THEMES, useThemeContext } from "../themeContext";
+import { ThemeContextProvider, useThemeContext } from "../themeContext";
 
 import { AuthenticatedPage } from "./AuthenticatedPage";
 
@@ -100,10 +100,10 @@ export const BasePage = (): React.ReactNode => {
 };
 
 const ThemedPageWrapper: React.FC = () => {
-    const theme = useThemeContext((context) => context.theme);
+    const theme = useThemeContext((context) => context.themeObject);
     return (
         <StyleSheetManager shouldForwardProp={shouldForwardProp}>
-            <ThemeProvider theme={THEMES[theme]}>
+            <ThemeProvider theme={theme}>
                 <GlobalStyles />
                 <BasePage />
             </ThemeProvider>
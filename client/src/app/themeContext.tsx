@@ -7,11 +7,42 @@ import { createContext, useContextSelector } from "@com.mgmtp.a12.widgets/widget
 
 interface ThemeContextType {
     theme: string;
+    themeObject: DefaultThemeType;
+    themeNames: string[];
     setTheme(theme: string): void;
 }
 
 export const THEME_KEY = "theme";
 
+/**
+ * URL that serves `{ [displayName]: theme }` at runtime, set at build time via the
+ * `RUNTIME_THEMES_URL` environment variable. Empty when themes are only bundled.
+ */
+declare const __RUNTIME_THEMES_URL__: string;
+
+/**
+ * `type` of a window message that replaces a theme at runtime:
+ * `{ type: THEME_MESSAGE_TYPE, name: "Acme", theme: {...} }`.
+ */
+export const THEME_MESSAGE_TYPE = "a12-theme:apply";
+
+/**
+ * Hook exposed as `window.__A12_THEME_HOOK__` so automation can push an updated theme
+ * into the running page without a rebuild or reload.
+ */
+export interface ThemeHook {
+    getTheme(): string;
+    /** Incremented after each applied theme has been rendered. */
+    getRevision(): number;
+    applyTheme(name: string, theme: DefaultThemeType): void;
+}
+
+declare global {
+    interface Window {
+        __A12_THEME_HOOK__?: ThemeHook;
+    }
+}
+
 function convertFileNameToDisplayName(filePath: string): string {
     return filePath
         .replace(/(?:^\.\/|\.json$)/g, "")
@@ -45,6 +76,8 @@ export function getThemeNames(): string[] {
 
 const ThemeContext = createContext<ThemeContextType>({
     theme: "Flat",
+    themeObject: flatTheme,
+    themeNames: ["Flat"],
     setTheme: () => {}
 });
 ThemeContext.displayName = "ThemeContext";
@@ -53,13 +86,80 @@ export const ThemeContextProvider: React.FC<Container> = ({ children }) => {
     const themeNames = getThemeNames();
     const storedTheme = localStorage.getItem(THEME_KEY) ?? themeNames[0];
     const [theme, setTheme] = React.useState(themeNames.includes(storedTheme) ? storedTheme : themeNames[0]);
+    const [runtimeThemes, setRuntimeThemes] = React.useState<{ [key: string]: DefaultThemeType }>({});
+    const [overrides, setOverrides] = React.useState<{ [key: string]: DefaultThemeType }>({});
+    const [revision, setRevision] = React.useState(0);
+
+    const themeRef = React.useRef(theme);
+    const renderedRevisionRef = React.useRef(0);
+    themeRef.current = theme;
+
+    React.useEffect(() => {
+        renderedRevisionRef.current = revision;
+    }, [revision]);
+
+    React.useEffect(() => {
+        if (!__RUNTIME_THEMES_URL__) {
+            return;
+        }
+        fetch(__RUNTIME_THEMES_URL__, { cache: "no-store" })
+            .then((response) => (response.ok ? response.json() : {}))
+            .then((themes: { [key: string]: DefaultThemeType }) => {
+                setRuntimeThemes(themes);
+                const stored = localStorage.getItem(THEME_KEY);
+                if (stored && stored in themes) {
+                    setTheme(stored);
+                }
+            })
+            .catch(() => {
+                // Keep the bundled themes
+            });
+    }, []);
+
+    React.useEffect(() => {
+        const applyTheme = (name: string, themeObject: DefaultThemeType) => {
+            setOverrides((current) => ({ ...current, [name]: themeObject }));
+            setTheme(name);
+            setRevision((current) => current + 1);
+        };
+
+        const handleMessage = (event: MessageEvent) => {
+            if (event.origin !== window.location.origin) {
+                return;
+            }
+            const data = event.data as { type?: string; name?: string; theme?: DefaultThemeType } | null;
+            if (data?.type === THEME_MESSAGE_TYPE && data.name && data.theme) {
+                applyTheme(data.name, data.theme);
+            }
+        };
+
+        window.__A12_THEME_HOOK__ = {
+            getTheme: () => themeRef.current,
+            getRevision: () => renderedRevisionRef.current,
+            applyTheme
+        };
+        window.addEventListener("message", handleMessage);
+
+        return () => {
+            window.removeEventListener("message", handleMessage);
+            delete window.__A12_THEME_HOOK__;
+        };
+    }, []);
+
+    const allThemeNames = React.useMemo(
+        () => Object.keys({ ...THEMES, ...runtimeThemes, ...overrides }),
+        [runtimeThemes, overrides]
+    );
+    const themeObject = overrides[theme] ?? runtimeThemes[theme] ?? THEMES[theme] ?? THEMES[themeNames[0]];
 
     const themeContextValue: ThemeContextType = React.useMemo(() => {
         return {
             theme,
+            themeObject,
+            themeNames: allThemeNames,
             setTheme
         };
-    }, [theme]);
+    }, [theme, themeObject, allThemeNames]);
 
     return <ThemeContext.Provider value={themeContextValue}>{children}</ThemeContext.Provider>;
 };
@@ -6,7 +6,7 @@ import { SizeContext } from "@com.mgmtp.a12.widgets/widgets-core/lib/layout/size
 import { List } from "@com.mgmtp.a12.widgets/widgets-core/lib/list";
 import { PopUpMenu } from "@com.mgmtp.a12.widgets/widgets-core/lib/pop-up-menu";
 
-import { getThemeNames, THEME_KEY, THEMES, useThemeContext } from "../app/themeContext";
+import { THEME_KEY, useThemeContext } from "../app/themeContext";
 
 interface ThemeItemProps {
     theme: string;
@@ -32,7 +32,7 @@ export default function ThemeChooser(): React.ReactNode | null {
     const size = useContext(SizeContext);
     const mobileMode = size.currentSize === "xs" || size.currentSize === "sm";
 
-    const { theme: currentTheme, setTheme } = useThemeContext((context) => context);
+    const { theme: currentTheme, themeNames, setTheme } = useThemeContext((context) => context);
     const handleSelect = React.useCallback(
         (theme: string) => {
             setTheme(theme);
@@ -41,7 +41,7 @@ export default function ThemeChooser(): React.ReactNode | null {
         [setTheme]
     );
 
-    if (getThemeNames().length <= 1) {
+    if (themeNames.length <= 1) {
         return null;
     }
 
@@ -56,7 +56,7 @@ export default function ThemeChooser(): React.ReactNode | null {
                 />
             }>
             <List>
-                {Object.keys(THEMES).map((item) => (
+                {themeNames.map((item) => (
                     <ThemeItem theme={item} key={item} isActive={currentTheme === item} onSelect={handleSelect} />
                 ))}
             </List>
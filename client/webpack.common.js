@@ -88,7 +88,9 @@ module.exports = {
         new Webpack.DefinePlugin({
             // Check if we can enable it in the official release
             // __A12_MODEL_VERSIONS__: JSON.stringify(collectA12ModelVersions()),
-            minify: true
+            minify: true,
+            // Endpoint the themes are loaded from at runtime (set by the theming MCP server's static mode)
+            __RUNTIME_THEMES_URL__: JSON.stringify(process.env.RUNTIME_THEMES_URL ?? "")
         }),
         new CopyWebpackPlugin({
             patterns: [
@@ -13,6 +13,13 @@ Dns.setDefaultResultOrder("ipv4first");
 module.exports = merge({}, common, {
     mode: "development",
     devtool: "eval-source-map",
+    // Persist compiled modules between dev-server starts (warm standby for the theming MCP server)
+    cache: {
+        type: "filesystem",
+        buildDependencies: {
+            config: [__filename, require.resolve("./webpack.common.js")]
+        }
+    },
     devServer: {
         hot: true,
         port: package.webpackPort,
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the MCP tool hot paths.
+
+Runs the real tool handlers against a local stand-in A12 app (see
+stub_frontend.py) in headless Chromium, so no backend, frontend build or
+network access is needed. Every case runs for a number of iterations and is
+reported as p50/p90/p99; get_screenshots is additionally broken down per
+workflow step from its timing trace, so a slow BrowserAutomation step shows
+up by name.
+
+Cases:
+- round_scan: BrowserAutomation.get_next_round_number over a directory with
+  many rounds
+- theme_validation: ThemeManager.validate_theme_file plus a patch validated
+  against default.json
+- create_environment: the tool with both services already running (reattach)
+- get_screenshots: a full screenshot round
+- get_screenshots_hot_reload: a round re-captured from the live session
+
+Usage:
+    python benchmarks/run_benchmarks.py                   # Run and print results
+    python benchmarks/run_benchmarks.py --save-baseline   # Store results as baseline
+    python benchmarks/run_benchmarks.py --compare         # Exit 1 on regressions
+
+Requires the Playwright Chromium build (`playwright install chromium`).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+BENCHMARKS_DIR = Path(__file__).parent.resolve()
+MCP_SERVER_DIR = BENCHMARKS_DIR.parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baselines" / f"{sys.platform}.json"
+CUSTOMER_NAME = "benchmark"
+
+CASES = [
+    "round_scan",
+    "theme_validation",
+    "create_environment",
+    "get_screenshots",
+    "get_screenshots_hot_reload",
+]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Percentile with linear interpolation between the closest ranks.
+
+    Args:
+        values: Samples (need not be sorted)
+        q: Percentile in [0, 100]
+
+    Returns:
+        float: The percentile, 0.0 for no samples
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+    """Summary statistics of timing samples in milliseconds.
+
+    Args:
+        samples_ms: Durations in milliseconds
+
+    Returns:
+        dict[str, float]: n, min, mean, p50, p90, p99 and max
+    """
+    if not samples_ms:
+        return {"n": 0}
+
+    return {
+        "n": len(samples_ms),
+        "min": round(min(samples_ms), 2),
+        "mean": round(sum(samples_ms) / len(samples_ms), 2),
+        "p50": round(percentile(samples_ms, 50), 2),
+        "p90": round(percentile(samples_ms, 90), 2),
+        "p99": round(percentile(samples_ms, 99), 2),
+        "max": round(max(samples_ms), 2),
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float = 0.25,
+    min_delta_ms: float = 5.0
+) -> list[str]:
+    """Find metrics whose median got slower than the baseline allows.
+
+    A metric regresses when its p50 exceeds the baseline p50 by more than
+    tolerance (relative) and min_delta_ms (absolute); the absolute floor
+    keeps sub-millisecond noise from failing the run.
+
+    Args:
+        results: Current summaries by metric name
+        baseline: Baseline summaries by metric name
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+        min_delta_ms: Slowdowns below this are ignored
+
+    Returns:
+        list[str]: One message per regressed metric
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference or not current.get("n") or not reference.get("n"):
+            continue
+
+        delta = current["p50"] - reference["p50"]
+        if delta > min_delta_ms and current["p50"] > reference["p50"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50 {current['p50']:.1f} ms vs baseline {reference['p50']:.1f} ms "
+                f"(+{delta / reference['p50'] * 100:.0f}%)"
+            )
+    return regressions
+
+
+def _free_port() -> int:
+    """Return a TCP port that is currently free on localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _prepare_workspace(workspace: Path) -> dict[str, str]:
+    """Point the server at a throwaway workspace and free local ports.
+
+    Must run before any server module is imported, since the constants
+    are read from the environment on import.
+
+    Returns:
+        dict[str, str]: The frontend and backend URLs
+    """
+    themes_dir = workspace / "themes"
+    themes_dir.mkdir(parents=True)
+    shutil.copy(MCP_SERVER_DIR.parent / "client" / "src" / "themes" / "default.json", themes_dir / "default.json")
+
+    urls = {
+        "FRONTEND_URL": f"http://localhost:{_free_port()}",
+        "BACKEND_URL": f"http://localhost:{_free_port()}",
+    }
+    os.environ.update(urls)
+    os.environ.update({
+        "SCREENSHOTS_DIR": str(workspace / "screenshots"),
+        "THEMES_DIR": str(themes_dir),
+        "MCP_CACHE_DIR": str(workspace / ".cache"),
+        "HEADLESS": "true",
+        "SLOW_MO": "0",
+    })
+    sys.path.insert(0, str(MCP_SERVER_DIR / "src"))
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    return urls
+
+
+async def _time_async(func: Callable[[], Awaitable], iterations: int, warmup: int) -> tuple[list[float], list]:
+    """Run an async callable repeatedly, returning durations (ms) and results."""
+    for _ in range(warmup):
+        await func()
+
+    samples, results = [], []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        results.append(await func())
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, results
+
+
+def _time_sync(func: Callable[[], object], iterations: int, warmup: int) -> list[float]:
+    """Run a callable repeatedly, returning durations in milliseconds."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _step_summaries(case: str, outputs: list) -> dict[str, dict]:
+    """Per-step percentiles from the trace summaries of tool outputs."""
+    per_step: dict[str, list[float]] = {}
+    for output in outputs:
+        for step, duration_ms in (output.trace_summary or {}).items():
+            per_step.setdefault(step, []).append(duration_ms)
+    return {f"{case}/{step}": summarize(samples) for step, samples in per_step.items()}
+
+
+async def run_suite(cases: list[str], iterations: int, warmup: int, scan_rounds: int, api_latency: float) -> dict[str, dict]:
+    """Start the stub app and time the selected cases.
+
+    Returns:
+        dict[str, dict]: Summary per case (and per get_screenshots step)
+    """
+    from config.constants import FRONTEND_URL, BACKEND_URL, SCREENSHOTS_DIR, THEMES_DIR
+    from server import CreateEnvironmentInput, GetScreenshotsInput
+    from services.browser_automation import BrowserAutomation
+    from services.browser_pool import BrowserPool
+    from services.live_session import LiveSessionManager
+    from services.process_manager import ProcessManager
+    from services.theme_manager import ThemeManager
+    from stub_frontend import StubFrontend
+    from tools.create_environment import create_environment_handler
+    from tools.get_screenshots import get_screenshots_handler
+
+    results: dict[str, dict] = {}
+
+    if "round_scan" in cases:
+        scan_dir = SCREENSHOTS_DIR / "round-scan"
+        scan_dir.mkdir(parents=True)
+        for round_number in range(1, scan_rounds + 1):
+            for state in range(1, 5):
+                (scan_dir / f"ROUND{round_number:02d}_{state:02d}.png").touch()
+        # Cheap enough to run ten times as often as the browser cases
+        samples = _time_sync(lambda: BrowserAutomation.get_next_round_number(scan_dir), iterations * 10, warmup)
+        results["round_scan"] = summarize(samples)
+
+    if "theme_validation" in cases:
+        theme_path = ThemeManager.create_theme_file("validation")
+        base_theme = ThemeManager.get_base_theme_content()
+        patches = [{"path": "colors", "value": base_theme["colors"]}] if "colors" in base_theme else []
+
+        def validate():
+            ThemeManager.validate_theme_file(theme_path)
+            ThemeManager.apply_patches(ThemeManager.load_theme("validation"), patches, base_theme)
+
+        results["theme_validation"] = summarize(_time_sync(validate, iterations * 10, warmup))
+
+    browser_cases = [case for case in cases if case.startswith(("create_environment", "get_screenshots"))]
+    if not browser_cases:
+        return results
+
+    stub = StubFrontend(THEMES_DIR, api_latency=api_latency)
+    await stub.start(FRONTEND_URL, BACKEND_URL)
+    try:
+        if "create_environment" in cases:
+            samples, _ = await _time_async(
+                lambda: create_environment_handler(CreateEnvironmentInput(customer_name=CUSTOMER_NAME)),
+                iterations, warmup
+            )
+            results["create_environment"] = summarize(samples)
+        else:
+            ThemeManager.create_theme_file(CUSTOMER_NAME)
+
+        for case, hot_reload in (("get_screenshots", False), ("get_screenshots_hot_reload", True)):
+            if case not in cases:
+                continue
+
+            async def capture():
+                output = await get_screenshots_handler(
+                    GetScreenshotsInput(customer_name=CUSTOMER_NAME, hot_reload=hot_reload)
+                )
+                if not output.success:
+                    raise RuntimeError(f"{case} failed: {output.message}")
+                return output
+
+            samples, outputs = await _time_async(capture, iterations, warmup)
+            results[case] = summarize(samples)
+            results.update(_step_summaries(case, outputs))
+            await LiveSessionManager.close_all()
+
+    finally:
+        await LiveSessionManager.close_all()
+        await BrowserPool.shutdown()
+        await ProcessManager.close_http_session()
+        await stub.stop()
+
+    return results
+
+
+def _print_results(results: dict[str, dict]):
+    print(f"{'metric':<60} {'n':>5} {'p50':>10} {'p90':>10} {'p99':>10}")
+    for name, stats in results.items():
+        if stats.get("n"):
+            print(f"{name:<60} {stats['n']:>5} {stats['p50']:>10.2f} {stats['p90']:>10.2f} {stats['p99']:>10.2f}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES, help="Cases to run (default: all)")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per browser case")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed iterations before each case")
+    parser.add_argument("--scan-rounds", type=int, default=99, help="Rounds in the round_scan directory")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="Seconds the stub delays each /api call")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare with the baseline, exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative p50 slowdown")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON to this file")
+    parser.add_argument("--log-level", default="ERROR", help="Log level of the server modules")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper(), format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    workspace = Path(tempfile.mkdtemp(prefix="a12-bench-"))
+    try:
+        _prepare_workspace(workspace)
+        results = asyncio.run(run_suite(
+            args.cases, args.iterations, args.warmup, args.scan_rounds, args.api_latency
+        ))
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    _print_results(results)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "iterations": args.iterations,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    exit_code = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            return 1
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline.get("results", {}), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            exit_code = 1
+        else:
+            print(f"No regressions against {args.baseline}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Baseline written: {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Local stand-in for the A12 frontend and backend used by the benchmarks.
+
+This module serves a single-page app with the parts of the A12 UI that
+BrowserAutomation drives, so its hot paths can be timed offline:
+- The login form (username, password, submit button)
+- The header with the palette `button.header-trigger` theme menu, listing
+  the theme files like the client's ThemeChooser
+- The person list with its `button[aria-label="Add"]` toolbar button
+- The person form with `a12-FirstName-*` style inputs and a Save button
+- `window.__A12_THEME_HOOK__` for hot theme re-captures
+- A small in-memory /api for login and persons (with optional latency)
+
+The same app answers on the frontend and the backend port, so the
+environment health checks pass as well.
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config.constants import RUNTIME_THEMES_PATH
+from services.static_frontend import StaticFrontendServer
+
+logger = logging.getLogger(__name__)
+
+_INDEX_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>A12 Stub</title>
+<style>
+    body { margin: 0; font-family: sans-serif; background: var(--background, #fff); }
+    header { display: flex; gap: 8px; padding: 8px; background: var(--primary, #1d4f91); }
+    header button, .toolbar button, form button { padding: 6px 12px; }
+    .menu { position: absolute; top: 48px; left: 8px; margin: 0; padding: 4px; list-style: none;
+            background: #fff; border: 1px solid #ccc; }
+    .menu li { padding: 4px 8px; cursor: pointer; }
+    main { padding: 16px; }
+    label { display: block; margin: 8px 0; }
+</style>
+</head>
+<body>
+<div id="root"></div>
+<script>
+(() => {
+    const THEME_KEY = "theme";
+    const SESSION_KEY = "stub-session";
+    const FIELDS = [
+        ["FirstName", "F3", "text"],
+        ["LastName", "F4", "text"],
+        ["EmailAddress", "F5", "text"],
+        ["DateOfBirth", "F6", "text"],
+        ["PlaceOfBirth", "F7", "text"],
+        ["Nationality", "F8", "text"]
+    ];
+    const root = document.getElementById("root");
+    let themes = {};
+    let overrides = {};
+    let theme = localStorage.getItem(THEME_KEY) || "Default";
+    let revision = 0;
+    let view = "list";
+
+    const el = (tag, attrs = {}, ...children) => {
+        const node = document.createElement(tag);
+        Object.entries(attrs).forEach(([key, value]) => {
+            if (key.startsWith("on")) node.addEventListener(key.slice(2), value);
+            else node.setAttribute(key, value);
+        });
+        children.forEach((child) => node.append(child));
+        return node;
+    };
+
+    const applyColors = () => {
+        const colors = ((overrides[theme] || themes[theme] || {}).colors) || {};
+        document.body.style.setProperty("--primary", colors.primaryColor || "#1d4f91");
+        document.body.style.setProperty("--background", colors.backgroundColor || "#fff");
+    };
+
+    const headerTrigger = (icon, text, onclick) =>
+        el("button", { type: "button", class: "header-trigger", title: text, onclick },
+            el("i", {}, el("span", { "aria-hidden": "true" }, icon)),
+            el("span", {}, text));
+
+    const renderHeader = () => {
+        const names = Object.keys({ ...themes, ...overrides });
+        const header = el("header");
+        header.append(headerTrigger("palette", theme.toUpperCase(), () => {
+            const menu = el("ul", { class: "menu", role: "menu" });
+            names.forEach((name) => menu.append(el("li", {
+                role: "menuitem",
+                onclick: () => {
+                    theme = name;
+                    localStorage.setItem(THEME_KEY, name);
+                    render();
+                }
+            }, name)));
+            document.body.append(menu);
+        }));
+        header.append(headerTrigger("account_circle", "ADMIN", () => {}));
+        return header;
+    };
+
+    const renderList = async (main) => {
+        const persons = await (await fetch("/api/persons")).json();
+        main.append(el("div", { class: "toolbar" },
+            el("button", { type: "button", "aria-label": "Add", "data-role": "button", onclick: () => { view = "form"; render(); } },
+                el("span", {}, "Add"))));
+        const table = el("table");
+        persons.forEach((p) => table.append(el("tr", {},
+            el("td", {}, p.FirstName || ""), el("td", {}, p.LastName || ""), el("td", {}, p.EmailAddress || ""))));
+        main.append(table);
+    };
+
+    const renderForm = (main) => {
+        const form = el("form", {
+            onsubmit: async (event) => {
+                event.preventDefault();
+                const person = {};
+                FIELDS.forEach(([name, id]) => { person[name] = document.getElementById(`a12-${name}-${id}`).value; });
+                await fetch("/api/persons", { method: "POST", body: JSON.stringify(person) });
+                view = "list";
+                render();
+            }
+        });
+        FIELDS.forEach(([name, id, type]) => form.append(el("label", {}, name,
+            el("input", { id: `a12-${name}-${id}`, name, type }))));
+        form.append(el("button", { type: "submit" }, "Save"));
+        main.append(form);
+    };
+
+    const renderLogin = () => {
+        root.append(el("form", {
+            onsubmit: async (event) => {
+                event.preventDefault();
+                const response = await fetch("/api/login", {
+                    method: "POST",
+                    body: JSON.stringify({ username: document.getElementById("username").value })
+                });
+                if (response.ok) {
+                    localStorage.setItem(SESSION_KEY, "1");
+                    render();
+                }
+            }
+        },
+            el("input", { id: "username", name: "username", type: "text", placeholder: "Username" }),
+            el("input", { id: "password", name: "password", type: "password" }),
+            el("button", { type: "submit" }, "Login")));
+    };
+
+    async function render() {
+        document.querySelectorAll(".menu").forEach((menu) => menu.remove());
+        root.replaceChildren();
+        if (!localStorage.getItem(SESSION_KEY)) {
+            renderLogin();
+            return;
+        }
+        applyColors();
+        root.append(renderHeader());
+        const main = el("main");
+        root.append(main);
+        if (view === "form") renderForm(main);
+        else await renderList(main);
+    }
+
+    window.__A12_THEME_HOOK__ = {
+        getTheme: () => theme,
+        getRevision: () => revision,
+        applyTheme: (name, data) => {
+            overrides[name] = data;
+            theme = name;
+            render().then(() => requestAnimationFrame(() => { revision += 1; }));
+        }
+    };
+
+    fetch("__RUNTIME_THEMES_PATH__")
+        .then((response) => response.json())
+        .then((loaded) => { themes = loaded; })
+        .finally(render);
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class StubFrontend:
+    """The stand-in app, served on the frontend and backend URLs."""
+
+    def __init__(self, themes_dir: Path, api_latency: float = 0.0):
+        """Initialize the stub.
+
+        Args:
+            themes_dir: Directory with the theme JSON files listed in the menu
+            api_latency: Seconds every /api call is delayed by, to mimic the backend
+        """
+        self.themes_dir = themes_dir
+        self.api_latency = api_latency
+        self.persons: list[dict] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def create_app(self) -> web.Application:
+        """Build the aiohttp application.
+
+        Returns:
+            web.Application: The stub app
+        """
+        index = _INDEX_HTML.replace("__RUNTIME_THEMES_PATH__", RUNTIME_THEMES_PATH)
+
+        async def index_page(request: web.Request) -> web.Response:
+            return web.Response(text=index, content_type="text/html")
+
+        async def runtime_themes(request: web.Request) -> web.Response:
+            themes = await asyncio.to_thread(StaticFrontendServer.load_runtime_themes, self.themes_dir)
+            return web.json_response(themes)
+
+        async def login(request: web.Request) -> web.Response:
+            await asyncio.sleep(self.api_latency)
+            return web.json_response({"ok": True})
+
+        async def list_persons(request: web.Request) -> web.Response:
+            await asyncio.sleep(self.api_latency)
+            return web.json_response(self.persons)
+
+        async def add_person(request: web.Request) -> web.Response:
+            await asyncio.sleep(self.api_latency)
+            self.persons.append(json.loads(await request.text()))
+            return web.json_response({"ok": True}, status=201)
+
+        app = web.Application()
+        app.router.add_get(RUNTIME_THEMES_PATH, runtime_themes)
+        app.router.add_post("/api/login", login)
+        app.router.add_get("/api/persons", list_persons)
+        app.router.add_post("/api/persons", add_person)
+        app.router.add_get("/{path:.*}", index_page)
+        return app
+
+    async def start(self, *urls: str):
+        """Serve the app on the host and port of every given URL.
+
+        Args:
+            *urls: URLs to serve on (frontend and backend)
+        """
+        runner = web.AppRunner(self.create_app(), access_log=None)
+        await runner.setup()
+        try:
+            for url in urls:
+                parsed = urlparse(url)
+                await web.TCPSite(runner, parsed.hostname or "localhost", parsed.port or 80).start()
+        except Exception:
+            await runner.cleanup()
+            raise
+
+        self._runner = runner
+        logger.info(f"Stub frontend serving on {', '.join(urls)}")
+
+    async def stop(self):
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
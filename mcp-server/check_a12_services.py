@@ -54,6 +54,7 @@ async def main():
     print(f"  Backend process tracked: {ProcessManager._backend_process is not None}")
     print(f"  Frontend process tracked: {ProcessManager._frontend_process is not None}")
     print()
+    await ProcessManager.close_http_session()
 
     print("=" * 80)
     if env_running:
@@ -32,6 +32,8 @@ os.environ['SLOW_MO'] = '200'  # Slow down for easier watching
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from services.browser_automation import BrowserAutomation
+from services.round_index import RoundIndex
+from services.screenshot_store import ScreenshotStore
 from config.constants import (
     FRONTEND_URL,
     DEFAULT_USERNAME,
@@ -70,8 +72,8 @@ async def main():
     # Create screenshots directory
     customer_screenshots_dir.mkdir(parents=True, exist_ok=True)
 
-    # Determine round number (same logic as MCP server)
-    round_number = BrowserAutomation.get_next_round_number(customer_screenshots_dir)
+    # Reserve the round number (same logic as MCP server)
+    round_number = RoundIndex.allocate(customer_screenshots_dir, manual=True)
     print(f"Round Number: {round_number}")
     print()
 
@@ -86,6 +88,10 @@ async def main():
             customer_name=CUSTOMER_NAME,
             round_number=round_number
         )
+        RoundIndex.finish(
+            customer_screenshots_dir, round_number, success,
+            [{"name": Path(path).name, "sha256": ScreenshotStore.digest_of(Path(path))} for path in screenshot_paths]
+        )
 
         print()
         print("=" * 80)
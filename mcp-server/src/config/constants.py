@@ -21,26 +21,162 @@ TEST_USERS = {
 }
 
 # Paths
-SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
+SCREENSHOTS_DIR = Path(os.getenv("SCREENSHOTS_DIR", str(PROJECT_ROOT / "screenshots")))
 CLIENT_DIR = PROJECT_ROOT / "client"
-THEMES_DIR = CLIENT_DIR / "src" / "themes"
+THEMES_DIR = Path(os.getenv("THEMES_DIR", str(CLIENT_DIR / "src" / "themes")))
 BASE_THEME_FILE = THEMES_DIR / "default.json"
+CACHE_DIR = Path(os.getenv("MCP_CACHE_DIR", str(PROJECT_ROOT / "mcp-server" / ".cache")))
+SESSION_CACHE_DIR = CACHE_DIR / "sessions"
+PALETTE_CACHE_DIR = CACHE_DIR / "palettes"
+LOG_DIR = CACHE_DIR / "logs"
+ENVIRONMENT_CHECKPOINT_FILE = CACHE_DIR / "environment.json"
+TRACE_DIR = CACHE_DIR / "traces"  # Service startup traces
 
 # Screenshot naming patterns
 TARGET_PATTERN = "TARGET_{:02d}.png"
 ROUND_PATTERN = "ROUND{:02d}_{:02d}.png"
 ROUND_REGEX = r"ROUND(\d{2})_\d{2}\.png"
+ROUND_INDEX_FILENAME = "rounds.json"  # Per-customer round manifest
+DIFF_PATTERN = "DIFF{:02d}_{:02d}.png"
+DIFFS_DIRNAME = "diffs"  # Subdirectory of the customer screenshots dir
+PATCHES_DIRNAME = "patches"  # Subdirectory of the customer screenshots dir
+PATCH_LOG_PATTERN = "ROUND{:02d}.jsonl"
+TRACES_DIRNAME = "traces"  # Subdirectory of the customer screenshots dir
+TRACE_PATTERN = "ROUND{:02d}.trace"  # Suffix .json (chrome) or .jsonl (otel) is added on export
+
+# Content-addressed screenshot store: ROUND screenshots are stored once per
+# content hash in SCREENSHOTS_DIR/.store and linked under their ROUND names
+SCREENSHOT_STORE_ENABLED = os.getenv("SCREENSHOT_STORE_ENABLED", "true").lower() == "true"
+SCREENSHOT_STORE_DIRNAME = ".store"
+# Variants encoded on capture ("webp" lossless, "avif", "preview"); others are encoded on request
+SCREENSHOT_VARIANTS = [v.strip() for v in os.getenv("SCREENSHOT_VARIANTS", "preview").split(",") if v.strip()]
+SCREENSHOT_PREVIEW_EDGE = 480  # Longest edge of preview images (px)
+SCREENSHOT_AVIF_QUALITY = int(os.getenv("SCREENSHOT_AVIF_QUALITY", "80"))
+
+# Images returned inline to the MCP client (get_image, get_screenshots include_images)
+IMAGE_CACHE_DIR = CACHE_DIR / "images"  # Resized renditions, keyed by source hash and options
+IMAGE_DEFAULT_MAX_EDGE = 1024  # Longest edge of returned images (px)
+IMAGE_DEFAULT_QUALITY = 75     # JPEG/WebP quality of returned images
+# Named regions: element boxes recorded on capture (union of all visible matches)
+IMAGE_REGION_SELECTORS = {
+    "header": "header, [role='banner']",
+    "form": "form, [role='form'], input[id^='a12-']",
+    "list": "table, [role='grid'], [role='table'], [role='list']",
+}
+IMAGE_FALLBACK_HEADER_RATIO = 0.08  # Header height as a fraction of image width when no boxes were recorded
+
+# Person data for deterministic rounds
+FIXTURE_SEED = 1212  # Faker seed, so every round gets the same persons
+FIXTURE_REFERENCE_DATE = "2024-01-15"  # Birth dates are drawn relative to this day, not today
+
+# Selector strategies that matched, learned per frontend build
+SELECTOR_CACHE_FILE = CACHE_DIR / "selectors.json"
+SELECTOR_CACHE_BUILDS = 5  # Builds kept in the cache
+
+# Perceptual-hash index for nearest-match lookup (find_similar)
+SIMILARITY_INDEX_FILENAME = "similarity.json"  # Per-customer index next to the images
+SIMILARITY_HASH_SIZE = 8        # Hash grid edge; pHash/dHash have SIZE*SIZE bits
+SIMILARITY_HIST_BINS = 4        # Color histogram bins per channel (BINS**3 total)
+# Weights of the pHash, dHash and color-histogram distances in the combined score
+SIMILARITY_WEIGHTS = {"phash": 0.5, "dhash": 0.25, "histogram": 0.25}
+
+# Screenshot comparison
+COMPARE_WORK_WIDTH = 512       # Width both images are downscaled to before diffing (px)
+COMPARE_PIXEL_THRESHOLD = 16   # Max channel difference (0-255) still counted as unchanged
+DIFF_IMAGE_MAX_EDGE = 384      # Longest edge of the diff image returned to the agent (px)
+
+# Palette extraction from TARGET screenshots
+PALETTE_SAMPLE_EDGE = 128      # Longest edge targets are downsampled to before clustering (px)
+PALETTE_SIZE = 8               # Number of dominant colors extracted
 
 # Timeouts (in seconds)
 BACKEND_STARTUP_TIMEOUT = 180  # 3 minutes
 FRONTEND_STARTUP_TIMEOUT = 120  # 2 minutes
-HEALTH_CHECK_INTERVAL = 5      # Check every 5 seconds
+HEALTH_CHECK_INTERVAL = 5      # Upper bound of the health probe backoff
+HEALTH_CHECK_INITIAL_INTERVAL = 0.25  # First probe delay, doubled up to HEALTH_CHECK_INTERVAL
 PAGE_LOAD_TIMEOUT = 10000      # 10 seconds for Playwright (in milliseconds) - faster for MCP
 
+# Readiness waits: upper bound per workflow step (in milliseconds)
+READINESS_TIMEOUTS = {
+    "navigate_to_login": 15000,
+    "login": 10000,
+    "select_theme": 5000,
+    "create_new_person": 10000,
+    "fill_person_form": 10000,
+    "save_and_return": 10000,
+    "open_first_person": 10000,
+    "return_to_list": 10000,
+    "settle": 3000,
+    "fonts": 5000,
+    "hot_reload": 3000,
+    "default": 5000,
+}
+DOM_QUIET_PERIOD = 150         # DOM must be mutation-free this long to count as rendered (ms)
+
+# Timing traces: "chrome" (trace-event JSON for chrome://tracing / Perfetto) or "otel" (JSONL spans)
+TRACE_FORMAT = os.getenv("TRACE_FORMAT", "chrome").lower()
+
 # Browser settings
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"  # Default: visible browser
 SLOW_MO = int(os.getenv("SLOW_MO", "50"))  # Slow down by 50ms (reduced for speed)
+THEME_STORAGE_KEY = "theme"  # localStorage key the client reads its initial theme from (THEME_KEY in themeContext.tsx)
+
+# Deterministic capture (same theme content, same pixels): seeded form data left
+# unsaved, frozen clock, fixed locale/timezone, no animations, transitions or
+# caret, web fonts loaded
+DETERMINISTIC_CAPTURE = os.getenv("DETERMINISTIC_CAPTURE", "true").lower() == "true"
+DETERMINISTIC_CLOCK = "2024-01-15T09:00:00+00:00"  # Page clock is frozen at this time
+DETERMINISTIC_CONTEXT_OPTIONS = {
+    "locale": "en-US",
+    "timezone_id": "UTC",
+    "reduced_motion": "reduce",
+}
+
+# Session reuse (cached cookies/localStorage instead of logging in every round)
+SESSION_REUSE_ENABLED = os.getenv("SESSION_REUSE_ENABLED", "true").lower() == "true"
+SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", "1800"))  # Seconds; matches Keycloak SSO idle timeout
+
+# Browser pool settings (a warm browser shared across tool calls)
+BROWSER_POOL_ENABLED = os.getenv("BROWSER_POOL_ENABLED", "true").lower() == "true"
+BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "50"))  # Recycle browser after N contexts
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "3"))  # Themes captured at once by get_screenshots_batch
+JOB_MAX_CONCURRENCY = int(os.getenv("JOB_MAX_CONCURRENCY", "4"))  # Scheduled tool calls running at once (others queue)
+JOB_HISTORY_SIZE = 50  # Finished jobs kept for list_jobs
+
+# Live sessions parked by hot_reload/reuse_state (each holds a browser context open)
+LIVE_SESSION_IDLE_TIMEOUT = int(os.getenv("LIVE_SESSION_IDLE_TIMEOUT", "900"))  # Seconds unused before it is closed
+LIVE_SESSION_MAX = int(os.getenv("LIVE_SESSION_MAX", "4"))  # Parked at once; the least recently used is closed first
 
 # Process commands
 GRADLE_BACKEND_CMD = ["gradle", "noClientComposeUp"]
 NPM_START_CMD = ["npm", "start"]
+NPM_BUILD_CMD = ["npm", "run", "webpack"]
+
+# Frontend mode: "dev" runs the webpack dev server, "static" builds the
+# production bundle once and serves it from inside the MCP server
+FRONTEND_MODE = os.getenv("FRONTEND_MODE", "dev").lower()
+STATIC_BUNDLE_DIR = CLIENT_DIR / "build" / "webpack"
+RUNTIME_THEMES_PATH = "/themes.json"  # Served by the static frontend, read by themeContext.tsx
+FRONTEND_BUILD_TIMEOUT = 600   # Production bundle build (seconds)
+
+# Log lines that announce a service is up (matched against its stdout/stderr).
+# A match triggers an immediate health probe; the probe still decides readiness.
+BACKEND_READY_PATTERN = os.getenv(
+    "BACKEND_READY_PATTERN",
+    r"Started \S+ in [\d.]+ seconds|BUILD SUCCESSFUL"
+)
+FRONTEND_READY_PATTERN = os.getenv(
+    "FRONTEND_READY_PATTERN",
+    r"compiled successfully|compiled with \d+ warnings?"
+)
+
+# Service output (drained from the process pipes)
+LOG_BUFFER_LINES = int(os.getenv("LOG_BUFFER_LINES", "2000"))  # Recent lines kept in memory per service
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))  # Rotate LOG_DIR/<service>.log at this size
+LOG_BACKUP_COUNT = 3           # Rotated log files kept per service
+
+# Warm standby: reattach to running services, restart checkpointed backend
+# containers with `docker start` instead of the full Gradle compose task
+WARM_STANDBY_ENABLED = os.getenv("WARM_STANDBY_ENABLED", "true").lower() == "true"
+COMPOSE_PROJECT_NAME = os.getenv("COMPOSE_PROJECT_NAME", "ai-theming")  # rootProject.name in settings.gradle
+WEBPACK_CACHE_DIR = CLIENT_DIR / "node_modules" / ".cache" / "webpack"  # Persistent dev-server compile cache
@@ -3,16 +3,25 @@
 This server provides tools for automating the theme development workflow:
 - create_environment: Set up development environment for a customer theme
 - get_screenshots: Capture UI screenshots for comparison with targets
+- get_screenshots_batch: Capture screenshots for several themes concurrently
+- compare_screenshots: Score a round's screenshots against the targets
+- update_theme: Patch individual theme values
+- get_service_logs: Tail or grep backend and frontend output
+- list_rounds: Round metadata from the customer's round index
+- get_image: A screenshot as a downscaled, cropped image
+- find_similar: Nearest screenshots by perceptual hash
+- list_jobs: Running and queued tool calls
+- cancel_job: Cancel a queued or running tool call
 """
 
 import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, Optional
 
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool, TextContent, ImageContent
 from pydantic import BaseModel, Field
 
 # Configure logging - ONLY to file (not console) for stdio transport
@@ -42,6 +51,9 @@ except Exception as e:
 # Initialize MCP server
 app = Server("a12-theme-mcp")
 
+sys.path.insert(0, str(Path(__file__).parent))
+from config.constants import BATCH_MAX_CONCURRENCY
+
 
 # ============================================================================
 # Tool Input/Output Schemas
@@ -63,6 +75,29 @@ class CreateEnvironmentOutput(BaseModel):
     current_round: int
     frontend_url: str
     message: str
+    palette: list[dict] = Field(
+        default_factory=list,
+        description="Dominant colors of the TARGET screenshots with area coverage"
+    )
+    suggested_colors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Proposed theme values by dotted path, derived from the palette"
+    )
+    startup_timings: dict[str, dict] = Field(
+        default_factory=dict,
+        description=(
+            "Startup timings per service started by this server (mode; seconds since "
+            "start: spawn_s, log_ready_s, http_ready_s; plus probes and ready)"
+        )
+    )
+    startup_modes: dict[str, str] = Field(
+        default_factory=dict,
+        description="Per service: reattached, warm_start (from standby) or cold_start"
+    )
+    standby_time_to_ready: dict[str, dict] = Field(
+        default_factory=dict,
+        description="Checkpointed seconds to ready per service and startup mode"
+    )
 
 
 class GetScreenshotsInput(BaseModel):
@@ -71,6 +106,46 @@ class GetScreenshotsInput(BaseModel):
         ...,
         description="Name of the customer/theme (must match existing environment)"
     )
+    hot_reload: bool = Field(
+        default=False,
+        description=(
+            "Apply the current theme file in place to the customer's live browser "
+            "session and re-capture, skipping rebuild, reload and login. Falls back "
+            "to the full workflow when no live session exists."
+        )
+    )
+    reuse_state: bool = Field(
+        default=False,
+        description=(
+            "Like hot_reload, but also keep a page parked at the filled, unsaved "
+            "person form so later rounds re-capture ROUNDXX_03 and ROUNDXX_04 "
+            "without creating another person in the backend."
+        )
+    )
+    include_images: bool = Field(
+        default=False,
+        description="Also return the screenshots as downscaled images"
+    )
+    image_max_edge: int = Field(
+        default=768,
+        ge=64,
+        le=4096,
+        description="Longest edge of returned images in pixels"
+    )
+    image_region: Literal["full", "header", "form", "list"] = Field(
+        default="full",
+        description="Region returned images are cropped to"
+    )
+    image_format: Literal["jpeg", "webp", "png"] = Field(
+        default="jpeg",
+        description="Encoding of returned images"
+    )
+    image_quality: int = Field(
+        default=75,
+        ge=1,
+        le=100,
+        description="JPEG/WebP quality of returned images"
+    )
 
 
 class GetScreenshotsOutput(BaseModel):
@@ -80,6 +155,344 @@ class GetScreenshotsOutput(BaseModel):
     screenshots: list[str]
     screenshots_dir: str
     message: str
+    wait_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Milliseconds spent in readiness waits per workflow step"
+    )
+    trace_summary: dict[str, float] = Field(
+        default_factory=dict,
+        description="Milliseconds per traced span (workflow steps, form fields, captures, waits)"
+    )
+    trace_file: Optional[str] = Field(
+        None,
+        description="Full trace of the round (Chrome trace-event JSON or OpenTelemetry-style JSONL)"
+    )
+    deterministic: bool = Field(
+        False,
+        description=(
+            "True if the round was rendered deterministically and wrote nothing to the backend, "
+            "so an unchanged theme gives byte-identical screenshots"
+        )
+    )
+    nondeterministic_reason: Optional[str] = Field(
+        None,
+        description="Why the round is not reproducible (e.g. a person was created through the form)"
+    )
+
+
+class GetScreenshotsBatchInput(BaseModel):
+    """Input schema for get_screenshots_batch tool."""
+    customer_names: list[str] = Field(
+        ...,
+        min_length=1,
+        description="Names of the customers/themes to capture (must match existing environments)"
+    )
+    max_concurrency: int = Field(
+        BATCH_MAX_CONCURRENCY,
+        ge=1,
+        description="Maximum number of themes captured at the same time"
+    )
+
+
+class GetScreenshotsBatchOutput(BaseModel):
+    """Output schema for get_screenshots_batch tool."""
+    success: bool
+    results: dict[str, GetScreenshotsOutput]
+    elapsed_seconds: float
+    message: str
+
+
+class CompareScreenshotsInput(BaseModel):
+    """Input schema for compare_screenshots tool."""
+    customer_name: str = Field(
+        ...,
+        description="Name of the customer/theme"
+    )
+    round_number: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Round to compare (default: latest round)"
+    )
+    grid_size: int = Field(
+        8,
+        ge=1,
+        le=32,
+        description="Rows and columns of the difference heatmap"
+    )
+
+
+class ScreenshotComparison(BaseModel):
+    """Comparison result for one ROUND/TARGET screenshot pair."""
+    index: int
+    round_file: str
+    target_file: str
+    similarity: float = Field(description="1.0 means pixel-identical after downscaling")
+    changed_ratio: float = Field(description="Fraction of pixels that differ noticeably")
+    heatmap: list[list[float]] = Field(description="Mean difference (0-1) per grid region, row-major")
+    worst_regions: list[dict]
+    round_size: list[int] = Field(default_factory=list, description="Width and height of the ROUND file")
+    target_size: list[int] = Field(default_factory=list, description="Width and height of the TARGET file")
+    compared_size: list[int] = Field(
+        default_factory=list,
+        description="Width and height compared, after scaling both to a common width (top-aligned overlap)"
+    )
+    height_mismatch: float = Field(
+        0.0,
+        description="Height difference at the common width as a fraction of the taller image (not compared)"
+    )
+    diff_image: Optional[str]
+
+
+class CompareScreenshotsOutput(BaseModel):
+    """Output schema for compare_screenshots tool."""
+    success: bool
+    round_number: int
+    comparisons: list[ScreenshotComparison]
+    message: str
+
+
+class ThemePatch(BaseModel):
+    """A single change to a theme file."""
+    path: str = Field(
+        ...,
+        description="JSON pointer (/colors/primaryColor) or dotted path (colors.primaryColor)"
+    )
+    op: Literal["replace", "add", "remove"] = Field(
+        "replace",
+        description="replace an existing value, add a new key, or remove a key"
+    )
+    value: Any = Field(
+        None,
+        description="New value (required for replace and add)"
+    )
+
+
+class UpdateThemeInput(BaseModel):
+    """Input schema for update_theme tool."""
+    customer_name: str = Field(
+        ...,
+        description="Name of the customer/theme"
+    )
+    patches: list[ThemePatch] = Field(
+        ...,
+        min_length=1,
+        description="Changes to apply atomically, in order"
+    )
+
+
+class UpdateThemeOutput(BaseModel):
+    """Output schema for update_theme tool."""
+    success: bool
+    theme_path: str
+    round_number: int
+    applied: list[dict]
+    warnings: list[str]
+    patch_log: Optional[str]
+    message: str
+
+
+class GetServiceLogsInput(BaseModel):
+    """Input schema for get_service_logs tool."""
+    service: Literal["backend", "frontend"] = Field(
+        ...,
+        description="Service whose output to read"
+    )
+    lines: int = Field(
+        100,
+        ge=1,
+        le=1000,
+        description="Maximum number of most recent lines to return"
+    )
+    pattern: Optional[str] = Field(
+        None,
+        description="Only return lines matching this regular expression"
+    )
+    ignore_case: bool = Field(
+        False,
+        description="Match pattern case-insensitively"
+    )
+    stream: Optional[Literal["stdout", "stderr"]] = Field(
+        None,
+        description="Only return lines from this stream"
+    )
+
+
+class GetServiceLogsOutput(BaseModel):
+    """Output schema for get_service_logs tool."""
+    success: bool
+    service: str
+    lines: list[str]
+    buffered_lines: int
+    total_lines: int
+    log_file: Optional[str]
+    message: str
+
+
+class ListRoundsInput(BaseModel):
+    """Input schema for list_rounds tool."""
+    customer_name: str = Field(
+        ...,
+        description="Name of the customer/theme"
+    )
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Only return the most recent rounds"
+    )
+    status: Optional[Literal["capturing", "complete", "failed"]] = Field(
+        None,
+        description="Only return rounds with this status"
+    )
+
+
+class ListRoundsOutput(BaseModel):
+    """Output schema for list_rounds tool."""
+    success: bool
+    customer_name: str
+    next_round: int
+    rounds: list[dict] = Field(
+        default_factory=list,
+        description=(
+            "Per round, oldest first: round, status, started_at/finished_at, "
+            "duration_s, screenshots (name, sha256), theme_revision and trace_file"
+        )
+    )
+    message: str
+
+
+class GetImageInput(BaseModel):
+    """Input schema for get_image tool."""
+    customer_name: str = Field(
+        ...,
+        description="Name of the customer/theme"
+    )
+    file: str = Field(
+        ...,
+        description="Image in the customer directory, e.g. ROUND03_04.png, TARGET_01.png or diffs/DIFF03_04.png"
+    )
+    max_edge: int = Field(
+        1024,
+        ge=64,
+        le=4096,
+        description="Longest edge of the returned image in pixels"
+    )
+    region: Literal["full", "header", "form", "list"] = Field(
+        "full",
+        description="Region to crop to"
+    )
+    format: Literal["jpeg", "webp", "png"] = Field(
+        "jpeg",
+        description="Encoding of the returned image"
+    )
+    quality: int = Field(
+        75,
+        ge=1,
+        le=100,
+        description="JPEG/WebP quality"
+    )
+
+
+class GetImageOutput(BaseModel):
+    """Output schema for get_image tool."""
+    success: bool
+    file: str
+    region: Optional[str] = None
+    width: int = 0
+    height: int = 0
+    source_size: list[int] = Field(default_factory=list)
+    box: list[int] = Field(
+        default_factory=list,
+        description="Cropped box [left, top, right, bottom] in source pixels"
+    )
+    bytes: int = 0
+    cache_hit: bool = False
+    message: str
+
+
+class FindSimilarInput(BaseModel):
+    """Input schema for find_similar tool."""
+    customer_name: str = Field(
+        ...,
+        description="Name of the customer/theme the query image belongs to"
+    )
+    file: str = Field(
+        ...,
+        description="Query image in the customer directory, e.g. TARGET_03.png or ROUND05_03.png"
+    )
+    scope: Literal["customer", "all"] = Field(
+        "customer",
+        description="Search this customer's screenshots or those of all customers"
+    )
+    kind: Literal["round", "target", "all"] = Field(
+        "round",
+        description="Which screenshots to match against"
+    )
+    limit: int = Field(
+        5,
+        ge=1,
+        le=50,
+        description="Maximum number of matches"
+    )
+
+
+class FindSimilarOutput(BaseModel):
+    """Output schema for find_similar tool."""
+    success: bool
+    customer_name: str
+    file: str
+    matches: list[dict] = Field(
+        default_factory=list,
+        description=(
+            "Most similar first: customer, file, round, similarity (0-1), "
+            "phash_distance, dhash_distance and histogram_similarity"
+        )
+    )
+    searched: int = 0
+    elapsed_ms: float = 0.0
+    message: str
+
+
+class ListJobsInput(BaseModel):
+    """Input schema for list_jobs tool."""
+    state: Optional[Literal["queued", "running", "done", "failed", "cancelled"]] = Field(
+        None,
+        description="Only return jobs in this state"
+    )
+
+
+class ListJobsOutput(BaseModel):
+    """Output schema for list_jobs tool."""
+    success: bool
+    running: int
+    queued: int
+    max_concurrency: int
+    jobs: list[dict] = Field(
+        default_factory=list,
+        description=(
+            "Finished, running and queued jobs, oldest first: job_id, tool, keys, "
+            "state, position (queued jobs), wait_s, run_s and error"
+        )
+    )
+    message: str
+
+
+class CancelJobInput(BaseModel):
+    """Input schema for cancel_job tool."""
+    job_id: str = Field(
+        ...,
+        description="ID of the job (from list_jobs or the queue progress message)"
+    )
+
+
+class CancelJobOutput(BaseModel):
+    """Output schema for cancel_job tool."""
+    success: bool
+    job_id: str
+    state: Optional[str] = Field(
+        None,
+        description="State the job was in when cancelled (queued or running)"
+    )
+    message: str
 
 
 # ============================================================================
@@ -121,17 +534,404 @@ async def list_tools() -> list[Tool]:
                     "customer_name": {
                         "type": "string",
                         "description": "Name of the customer/theme"
+                    },
+                    "hot_reload": {
+                        "type": "boolean",
+                        "description": (
+                            "Push the current theme into the live browser session and "
+                            "re-capture without rebuild or reload (default: false)"
+                        ),
+                        "default": False
+                    },
+                    "reuse_state": {
+                        "type": "boolean",
+                        "description": (
+                            "Keep the form and list pages parked and re-capture them on later "
+                            "rounds without creating another person (default: false)"
+                        ),
+                        "default": False
+                    },
+                    "include_images": {
+                        "type": "boolean",
+                        "description": (
+                            "Also return the screenshots as downscaled images, so no separate "
+                            "file read is needed (default: false)"
+                        ),
+                        "default": False
+                    },
+                    "image_max_edge": {
+                        "type": "integer",
+                        "minimum": 64,
+                        "maximum": 4096,
+                        "description": "Longest edge of returned images in pixels (default: 768)"
+                    },
+                    "image_region": {
+                        "type": "string",
+                        "enum": ["full", "header", "form", "list"],
+                        "description": "Region returned images are cropped to (default: full)"
+                    },
+                    "image_format": {
+                        "type": "string",
+                        "enum": ["jpeg", "webp", "png"],
+                        "description": "Encoding of returned images (default: jpeg)"
+                    },
+                    "image_quality": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "description": "JPEG/WebP quality of returned images (default: 75)"
+                    }
+                },
+                "required": ["customer_name"]
+            }
+        ),
+        Tool(
+            name="get_screenshots_batch",
+            description=(
+                "Capture a screenshot round for several customer themes concurrently. "
+                "Each theme runs in its own isolated browser context; returns "
+                "per-customer results."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": 1,
+                        "description": "Names of the customers/themes"
+                    },
+                    "max_concurrency": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": f"Maximum themes captured at once (default: {BATCH_MAX_CONCURRENCY})"
+                    }
+                },
+                "required": ["customer_names"]
+            }
+        ),
+        Tool(
+            name="compare_screenshots",
+            description=(
+                "Compare a round's screenshots (ROUNDXX_YY.png) with the matching "
+                "TARGET_YY.png files. Returns a similarity score, a per-region "
+                "difference heatmap and a small diff image per pair."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_name": {
+                        "type": "string",
+                        "description": "Name of the customer/theme"
+                    },
+                    "round_number": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Round to compare (default: latest round)"
+                    },
+                    "grid_size": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 32,
+                        "description": "Rows and columns of the heatmap (default: 8)"
+                    }
+                },
+                "required": ["customer_name"]
+            }
+        ),
+        Tool(
+            name="update_theme",
+            description=(
+                "Change individual values in a customer's theme file without rewriting it. "
+                "Patches use JSON pointers or dotted paths (e.g. colors.interaction.hover.color), "
+                "are applied atomically and validated against the default theme."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_name": {
+                        "type": "string",
+                        "description": "Name of the customer/theme"
+                    },
+                    "patches": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "path": {
+                                    "type": "string",
+                                    "description": "JSON pointer or dotted path"
+                                },
+                                "op": {
+                                    "type": "string",
+                                    "enum": ["replace", "add", "remove"],
+                                    "description": "Operation (default: replace)"
+                                },
+                                "value": {
+                                    "description": "New value (required for replace and add)"
+                                }
+                            },
+                            "required": ["path"]
+                        }
+                    }
+                },
+                "required": ["customer_name", "patches"]
+            }
+        ),
+        Tool(
+            name="get_service_logs",
+            description=(
+                "Tail or grep the recent output of the backend or frontend started by "
+                "create_environment. Reads from an in-memory buffer of recent lines; "
+                "the full output is in the rotated log file that is returned."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "service": {
+                        "type": "string",
+                        "enum": ["backend", "frontend"],
+                        "description": "Service whose output to read"
+                    },
+                    "lines": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "description": "Maximum number of recent lines (default: 100)"
+                    },
+                    "pattern": {
+                        "type": "string",
+                        "description": "Regular expression lines must match"
+                    },
+                    "ignore_case": {
+                        "type": "boolean",
+                        "description": "Match pattern case-insensitively (default: false)"
+                    },
+                    "stream": {
+                        "type": "string",
+                        "enum": ["stdout", "stderr"],
+                        "description": "Only lines from this stream"
+                    }
+                },
+                "required": ["service"]
+            }
+        ),
+        Tool(
+            name="list_rounds",
+            description=(
+                "List the screenshot rounds of a customer from its round index: status, "
+                "timing, screenshot names and hashes, theme revision and trace file. "
+                "Does not read the image files."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_name": {
+                        "type": "string",
+                        "description": "Name of the customer/theme"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Only the most recent rounds"
+                    },
+                    "status": {
+                        "type": "string",
+                        "enum": ["capturing", "complete", "failed"],
+                        "description": "Only rounds with this status"
                     }
                 },
                 "required": ["customer_name"]
             }
+        ),
+        Tool(
+            name="get_image",
+            description=(
+                "Return a screenshot (ROUND, TARGET or diff image) as an image, downscaled "
+                "to max_edge, optionally cropped to the header, form or list region, and "
+                "encoded as JPEG/WebP. Much cheaper than reading the full-resolution PNG; "
+                "renditions are cached."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_name": {
+                        "type": "string",
+                        "description": "Name of the customer/theme"
+                    },
+                    "file": {
+                        "type": "string",
+                        "description": "Image file, e.g. ROUND03_04.png, TARGET_01.png or diffs/DIFF03_04.png"
+                    },
+                    "max_edge": {
+                        "type": "integer",
+                        "minimum": 64,
+                        "maximum": 4096,
+                        "description": "Longest edge in pixels (default: 1024)"
+                    },
+                    "region": {
+                        "type": "string",
+                        "enum": ["full", "header", "form", "list"],
+                        "description": "Region to crop to (default: full)"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["jpeg", "webp", "png"],
+                        "description": "Image encoding (default: jpeg)"
+                    },
+                    "quality": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "description": "JPEG/WebP quality (default: 75)"
+                    }
+                },
+                "required": ["customer_name", "file"]
+            }
+        ),
+        Tool(
+            name="find_similar",
+            description=(
+                "Find the screenshots that look most like a TARGET or ROUND screenshot, "
+                "e.g. the earlier round closest to TARGET_03.png to roll back to. Uses a "
+                "perceptual-hash and color-histogram index kept next to the images, so "
+                "no images are opened; answers in milliseconds."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "customer_name": {
+                        "type": "string",
+                        "description": "Name of the customer/theme the query image belongs to"
+                    },
+                    "file": {
+                        "type": "string",
+                        "description": "Query image, e.g. TARGET_03.png or ROUND05_03.png"
+                    },
+                    "scope": {
+                        "type": "string",
+                        "enum": ["customer", "all"],
+                        "description": "Search this customer only or all customers (default: customer)"
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["round", "target", "all"],
+                        "description": "Match against ROUND files, TARGET files or both (default: round)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 50,
+                        "description": "Maximum number of matches (default: 5)"
+                    }
+                },
+                "required": ["customer_name", "file"]
+            }
+        ),
+        Tool(
+            name="list_jobs",
+            description=(
+                "Show the server's scheduled tool calls: running and queued jobs with their "
+                "queue position, and recently finished ones. Calls that change the environment "
+                "or a customer's files run at most one per customer and JOB_MAX_CONCURRENCY at once."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "state": {
+                        "type": "string",
+                        "enum": ["queued", "running", "done", "failed", "cancelled"],
+                        "description": "Only return jobs in this state"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="cancel_job",
+            description=(
+                "Cancel a queued or running job by ID. A queued job leaves the queue; "
+                "a running one is interrupted and its caller gets an error result."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "ID of the job (from list_jobs)"
+                    }
+                },
+                "required": ["job_id"]
+            }
         )
     ]
 
 
+def _job_keys(name: str, arguments: dict) -> Optional[tuple[list[str], list[str]]]:
+    """Scheduler keys of a tool call.
+
+    Returns:
+        tuple: (exclusive keys, shared keys), or None for calls that only
+            read and run right away
+    """
+    customer = f"customer:{arguments.get('customer_name')}"
+    if name == "create_environment":
+        return ["environment", customer], []
+    if name == "get_screenshots":
+        return [customer], ["environment"]
+    if name == "get_screenshots_batch":
+        return [f"customer:{c}" for c in arguments.get("customer_names") or []], ["environment"]
+    if name in ("update_theme", "compare_screenshots"):
+        return [customer], []
+    return None
+
+
+async def _report_queue_position(job):
+    """Send the caller a progress notification with its queue position."""
+    ctx = app.request_context
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return
+    await ctx.session.send_progress_notification(
+        token,
+        0,
+        message=f"Queued as job {job.id} at position {job.position}",
+        related_request_id=str(ctx.request_id)
+    )
+
+
 @app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls from MCP clients."""
+async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageContent]:
+    """Handle tool calls from MCP clients.
+
+    Calls that change the environment or a customer's files go through the
+    job scheduler (bounded concurrency, one call per customer at a time);
+    read-only calls run right away.
+    """
+    keys = _job_keys(name, arguments or {})
+    if keys is None:
+        return await _run_tool(name, arguments)
+
+    from services.job_scheduler import JobScheduler, JobCancelledError
+
+    exclusive, shared = keys
+    try:
+        return await JobScheduler.run(
+            name,
+            lambda: _run_tool(name, arguments),
+            exclusive=exclusive,
+            shared=shared,
+            on_queued=_report_queue_position
+        )
+    except JobCancelledError as e:
+        return [TextContent(
+            type="text",
+            text=str({"success": False, "message": str(e)})
+        )]
+
+
+async def _run_tool(name: str, arguments: Any) -> list[TextContent | ImageContent]:
+    """Dispatch a tool call to its handler."""
     try:
         if name == "create_environment":
             # Import here to avoid circular dependencies
@@ -154,6 +954,134 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             input_data = GetScreenshotsInput(**arguments)
             result = await get_screenshots_handler(input_data)
 
+            images = []
+            if input_data.include_images and result.screenshots:
+                from tools.get_image import render_images
+                _, images = await render_images(
+                    [Path(path) for path in result.screenshots],
+                    input_data.image_max_edge,
+                    input_data.image_region,
+                    input_data.image_format,
+                    input_data.image_quality
+                )
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            ), *images]
+
+        elif name == "get_screenshots_batch":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.get_screenshots_batch import get_screenshots_batch_handler
+
+            input_data = GetScreenshotsBatchInput(**arguments)
+            result = await get_screenshots_batch_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "compare_screenshots":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.compare_screenshots import compare_screenshots_handler
+
+            input_data = CompareScreenshotsInput(**arguments)
+            result = await compare_screenshots_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "update_theme":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.update_theme import update_theme_handler
+
+            input_data = UpdateThemeInput(**arguments)
+            result = await update_theme_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "get_service_logs":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.get_service_logs import get_service_logs_handler
+
+            input_data = GetServiceLogsInput(**arguments)
+            result = await get_service_logs_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "list_rounds":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.list_rounds import list_rounds_handler
+
+            input_data = ListRoundsInput(**arguments)
+            result = await list_rounds_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "get_image":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.get_image import get_image_handler
+
+            input_data = GetImageInput(**arguments)
+            result, images = await get_image_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            ), *images]
+
+        elif name == "find_similar":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.find_similar import find_similar_handler
+
+            input_data = FindSimilarInput(**arguments)
+            result = await find_similar_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "list_jobs":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.list_jobs import list_jobs_handler
+
+            input_data = ListJobsInput(**(arguments or {}))
+            result = await list_jobs_handler(input_data)
+
+            return [TextContent(
+                type="text",
+                text=result.model_dump_json(indent=2)
+            )]
+
+        elif name == "cancel_job":
+            # Import here to avoid circular dependencies
+            sys.path.insert(0, str(Path(__file__).parent))
+            from tools.cancel_job import cancel_job_handler
+
+            input_data = CancelJobInput(**(arguments or {}))
+            result = await cancel_job_handler(input_data)
+
             return [TextContent(
                 type="text",
                 text=result.model_dump_json(indent=2)
@@ -178,6 +1106,30 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 # Server Entry Point
 # ============================================================================
 
+async def start_browser_pool():
+    """Warm up the shared browser pool so the first screenshot round is fast."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from config.constants import BROWSER_POOL_ENABLED
+    from services.browser_pool import BrowserPool
+
+    if not BROWSER_POOL_ENABLED:
+        logger.info("Browser pool disabled, browsers will be launched per call")
+        return
+
+    if await BrowserPool.start():
+        logger.info(f"Browser pool ready: {BrowserPool.stats()}")
+
+
+async def stop_browser_pool():
+    """Close live sessions and shut down the shared browser pool."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from services.browser_pool import BrowserPool
+    from services.live_session import LiveSessionManager
+
+    await LiveSessionManager.close_all()
+    await BrowserPool.shutdown()
+
+
 async def main_stdio():
     """Run the MCP server on stdio transport."""
     logger.info("Starting A12 Theme MCP Server on stdio...")
@@ -185,6 +1137,7 @@ async def main_stdio():
     from mcp.server.stdio import stdio_server
 
     try:
+        await start_browser_pool()
         async with stdio_server() as (read_stream, write_stream):
             logger.info("MCP Server running on stdio")
             await app.run(
@@ -195,6 +1148,8 @@ async def main_stdio():
     except Exception as e:
         logger.error(f"Error running server: {e}", exc_info=True)
         raise
+    finally:
+        await stop_browser_pool()
 
 
 async def main_sse(host: str = "localhost", port: int = 3000):
@@ -275,7 +1230,11 @@ async def main_sse(host: str = "localhost", port: int = 3000):
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        await server.serve()
+        await start_browser_pool()
+        try:
+            await server.serve()
+        finally:
+            await stop_browser_pool()
 
     except ImportError as e:
         logger.error(f"SSE transport requires additional dependencies: {e}")
@@ -6,16 +6,22 @@ This module handles UI automation for capturing screenshots:
 - Theme selection
 - Form filling with random data
 - Screenshot capture
+- Deterministic rendering (seeded data, fixed clock, no animations), so an
+  unchanged theme produces byte-identical screenshots
 """
 
+import asyncio
+import json
 import logging
 import re
 from pathlib import Path
 from typing import Optional, Tuple
+from urllib.parse import urlsplit
 
 from playwright.async_api import (
     async_playwright,
     Browser,
+    BrowserContext,
     Page,
     Playwright,
     TimeoutError as PlaywrightTimeoutError
@@ -29,22 +35,185 @@ from config.constants import (
     PAGE_LOAD_TIMEOUT,
     HEADLESS,
     SLOW_MO,
+    THEME_STORAGE_KEY,
+    DETERMINISTIC_CLOCK,
+    DETERMINISTIC_CONTEXT_OPTIONS,
     SCREENSHOTS_DIR,
-    ROUND_REGEX,
+    READINESS_TIMEOUTS,
+    IMAGE_REGION_SELECTORS,
 )
+from services.browser_pool import BrowserPool
+from services.round_index import RoundIndex
+from services.screenshot_store import ScreenshotStore
+from services.session_store import SessionStore
+from services.page_readiness import PageReadiness
+from services.person_fixtures import fixture_persons
+from services.selector_resolver import SelectorResolver
+from services.theme_manager import ThemeManager
+from services.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 fake = Faker()
 
+# Page-coordinate box [left, top, right, bottom] per region: the union of all
+# visible elements matching the region's selector (full-page screenshots use
+# page coordinates, so the boxes map directly onto the image)
+_REGION_BOXES_SCRIPT = """
+(selectors) => {
+    const boxes = {};
+    for (const [name, selector] of Object.entries(selectors)) {
+        let box = null;
+        for (const el of document.querySelectorAll(selector)) {
+            const r = el.getBoundingClientRect();
+            if (r.width === 0 || r.height === 0) continue;
+            const left = r.left + window.scrollX, top = r.top + window.scrollY;
+            const right = left + r.width, bottom = top + r.height;
+            box = box
+                ? [Math.min(box[0], left), Math.min(box[1], top), Math.max(box[2], right), Math.max(box[3], bottom)]
+                : [left, top, right, bottom];
+        }
+        if (box) boxes[name] = box.map((v) => Math.round(v * window.devicePixelRatio));
+    }
+    return boxes;
+}
+"""
+
+# Sets input values the way React expects them: through the native value
+# setter (React tracks the last value it saw on the element) followed by
+# bubbling input/change events, then blur so field validation runs.
+# Takes [[idPrefix, value], ...]; the first visible input per prefix is used
+_FILL_FORM_SCRIPT = """
+(fields) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    for (const [prefix, value] of fields) {
+        const inputs = Array.from(document.querySelectorAll(`input[id^="${prefix}"]`));
+        const input = inputs.find((el) => el.offsetParent !== null) || inputs[0];
+        if (!input) continue;
+        input.focus();
+        setValue.call(input, value);
+        input.dispatchEvent(new Event("input", { bubbles: true }));
+        input.dispatchEvent(new Event("change", { bubbles: true }));
+        input.blur();
+    }
+}
+"""
+
+# Current value per ID prefix (null if there is no such input)
+_READ_FORM_SCRIPT = """
+(prefixes) => Object.fromEntries(prefixes.map((prefix) => {
+    const inputs = Array.from(document.querySelectorAll(`input[id^="${prefix}"]`));
+    const input = inputs.find((el) => el.offsetParent !== null) || inputs[0];
+    return [prefix, input ? input.value : null];
+}))
+"""
+
+# Writes the theme the client should start with (init script, runs before any
+# page script); the %s is replaced with {origin, key, name} as JSON
+_PRESELECT_THEME_SCRIPT = """
+(({origin, key, name}) => {
+    if (window.location.origin === origin) {
+        try {
+            window.localStorage.setItem(key, name);
+        } catch (e) {
+            // Storage disabled; the theme is selected from the menu instead
+        }
+    }
+})(%s);
+"""
+
+# Candidate strategies ({css, text?}, text matched case-insensitively) per UI
+# element, in order of preference; SelectorResolver remembers the winner
+_USERNAME_FIELD_CANDIDATES = [
+    {"css": 'input[name="username"]'},
+    {"css": 'input[id="username"]'},
+    {"css": 'input[type="text"]'},
+    {"css": 'input[placeholder*="name" i]'},
+]
+_LOGIN_SUBMIT_CANDIDATES = [
+    {"css": 'button[type="submit"], input[type="submit"]'},
+    {"css": "button", "text": ["login", "log in", "sign in"]},
+]
+# Based on actual HTML: <button aria-label="Add" ...><span>Add</span></button>
+_ADD_BUTTON_CANDIDATES = [
+    {"css": 'button[aria-label="Add"]'},
+    {"css": 'button[data-role="button"]', "text": ["add"]},
+    {"css": "button", "text": ["add"]},
+    {"css": "button", "text": ["+"]},
+    {"css": "button", "text": ["new"]},
+    {"css": "button", "text": ["create"]},
+    {"css": 'button, a.button, a[role="button"]', "text": ["+", "add", "new", "create", "hinzufügen", "neu"]},
+]
+
+# Stylesheet for deterministic captures (init script): animations and
+# transitions finish instantly (end events still fire), carets are invisible
+_DETERMINISTIC_STYLE_SCRIPT = """
+(() => {
+    const css = `*, *::before, *::after {
+        animation-duration: 0s !important;
+        animation-delay: 0s !important;
+        animation-iteration-count: 1 !important;
+        transition-duration: 0s !important;
+        transition-delay: 0s !important;
+        caret-color: transparent !important;
+        scroll-behavior: auto !important;
+    }`;
+    const inject = () => {
+        const style = document.createElement("style");
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) {
+        inject();
+    } else {
+        document.addEventListener("DOMContentLoaded", inject, { once: true });
+    }
+})();
+"""
+
+
+def _origin(url: str) -> str:
+    """Origin (scheme://host:port) of a URL, as window.location.origin reports it."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
 
 class BrowserAutomation:
     """Handles browser automation for UI screenshot capture."""
 
-    def __init__(self):
-        """Initialize browser automation."""
+    def __init__(
+        self,
+        use_pool: bool = False,
+        reuse_session: bool = False,
+        username: str = DEFAULT_USERNAME,
+        password: str = DEFAULT_PASSWORD,
+        deterministic: bool = False
+    ):
+        """Initialize browser automation.
+
+        Args:
+            use_pool: Check out a context from the shared BrowserPool instead
+                of launching a dedicated browser
+            reuse_session: Restore a cached login session and skip the login
+                form when the application accepts it
+            username: User to log in as
+            password: Password for the user
+            deterministic: Render reproducibly (seeded form data, fixed clock,
+                locale and timezone, no animations or caret, fonts loaded
+                before every screenshot)
+        """
+        self.use_pool = use_pool
+        self.reuse_session = reuse_session
+        self.deterministic = deterministic
+        self.username = username
+        self.password = password
+        self.session_restored = False
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.readiness: Optional[PageReadiness] = None
+        self.selectors: Optional[SelectorResolver] = None
+        self.preselected_theme: Optional[str] = None
 
     async def __aenter__(self):
         """Context manager entry."""
@@ -55,27 +224,49 @@ class BrowserAutomation:
         """Context manager exit."""
         await self.close_browser()
 
-    async def setup_browser(self) -> Browser:
-        """Initialize Playwright and launch browser.
+    @traced()
+    async def setup_browser(self) -> BrowserContext:
+        """Initialize a browser context, either pooled or freshly launched.
 
         Returns:
-            Browser: Playwright browser instance
+            BrowserContext: Isolated context the page lives in
         """
         logger.info("Setting up Playwright browser...")
 
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=HEADLESS,
-                slow_mo=SLOW_MO,
-            )
+            context_options = dict(DETERMINISTIC_CONTEXT_OPTIONS) if self.deterministic else {}
+            if self.reuse_session:
+                storage_state = SessionStore.load(self.username)
+                if storage_state:
+                    context_options["storage_state"] = storage_state
+                    self.session_restored = True
+
+            if self.use_pool:
+                # Warm browser owned by the server process, fresh context per call
+                self.context = await BrowserPool.new_context(**context_options)
+            else:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(
+                    headless=HEADLESS,
+                    slow_mo=SLOW_MO,
+                )
+                self.context = await self.browser.new_context(**context_options)
+
+            if self.deterministic:
+                # Date.now() and new Date() always return the same time; timers
+                # keep running, so the application still works
+                await self.context.clock.install(time=DETERMINISTIC_CLOCK)
+                await self.context.clock.set_fixed_time(DETERMINISTIC_CLOCK)
+                await self.context.add_init_script(script=_DETERMINISTIC_STYLE_SCRIPT)
 
             # Create a new page with timeout settings
-            self.page = await self.browser.new_page()
+            self.page = await self.context.new_page()
             self.page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+            self.readiness = PageReadiness(self.page)
+            self.selectors = SelectorResolver(self.readiness)
 
             logger.info("Browser setup complete")
-            return self.browser
+            return self.context
 
         except Exception as e:
             logger.error(f"Error setting up browser: {e}", exc_info=True)
@@ -83,7 +274,10 @@ class BrowserAutomation:
             raise
 
     async def close_browser(self):
-        """Close browser and clean up Playwright resources."""
+        """Close browser and clean up Playwright resources.
+
+        Pooled contexts are handed back to the pool; the browser keeps running.
+        """
         logger.info("Closing browser...")
 
         try:
@@ -91,6 +285,13 @@ class BrowserAutomation:
                 await self.page.close()
                 self.page = None
 
+            if self.context:
+                if self.use_pool:
+                    await BrowserPool.release_context(self.context)
+                else:
+                    await self.context.close()
+                self.context = None
+
             if self.browser:
                 await self.browser.close()
                 self.browser = None
@@ -104,6 +305,7 @@ class BrowserAutomation:
         except Exception as e:
             logger.error(f"Error closing browser: {e}", exc_info=True)
 
+    @traced()
     async def navigate_to_login(self) -> bool:
         """Navigate to the login page.
 
@@ -116,26 +318,23 @@ class BrowserAutomation:
 
         try:
             logger.info(f"Navigating to {FRONTEND_URL}...")
-            await self.page.goto(FRONTEND_URL, wait_until="domcontentloaded", timeout=15000)
+            await self.page.goto(FRONTEND_URL, wait_until="domcontentloaded", timeout=READINESS_TIMEOUTS["navigate_to_login"])
 
             # Wait for React to render - look for the root div to have content
             logger.info("Waiting for React app to render...")
 
-            # Wait for either login form or main app content
-            try:
-                # Look for login form specifically (username/password inputs)
-                await self.page.wait_for_selector(
-                    'input[type="text"], input[type="password"]',
-                    timeout=10000
-                )
-                logger.info("Login form detected")
-            except:
-                # Or wait for any content in root
-                await self.page.wait_for_selector('#root > *', timeout=10000)
-                logger.info("App content loaded")
+            # Wait for either the login form or the app shell (restored session)
+            if await self.readiness.wait_for_selector(
+                "navigate_to_login",
+                'input[type="password"], button.header-trigger'
+            ):
+                logger.info("Login form or app shell detected")
+            elif not await self.readiness.wait_for_selector("navigate_to_login", '#root > *', timeout=2000):
+                logger.error("Neither login form nor app content rendered")
+                return False
 
-            # Additional wait for any initial redirects or loading
-            await self.page.wait_for_timeout(1500)
+            # Let initial redirects and requests finish
+            await self.readiness.wait_for_network_idle("navigate_to_login", timeout=READINESS_TIMEOUTS["settle"])
 
             logger.info(f"Navigation complete. Current URL: {self.page.url}")
             return True
@@ -148,6 +347,7 @@ class BrowserAutomation:
             logger.error(f"Error navigating to login page: {e}", exc_info=True)
             return False
 
+    @traced()
     async def login(
         self,
         username: str = DEFAULT_USERNAME,
@@ -170,33 +370,14 @@ class BrowserAutomation:
             logger.info(f"Logging in as {username}...")
 
             # Wait for login form to be rendered
-            await self.page.wait_for_timeout(1000)
-
-            # Find username field - try multiple selectors
-            username_field = None
-            username_selectors = [
-                'input[name="username"]',
-                'input[id="username"]',
-                'input[type="text"]',
-                'input[placeholder*="name" i]',
-            ]
-
-            for selector in username_selectors:
-                username_field = await self.page.query_selector(selector)
-                if username_field and await username_field.is_visible():
-                    logger.info(f"Found username field with: {selector}")
-                    break
+            await self.readiness.wait_for_selector("login", 'input[type="password"]')
 
+            # Find username field - all candidates in one probe, learned one first
+            username_field = await self.selectors.resolve("login", "username_field", _USERNAME_FIELD_CANDIDATES)
             if not username_field:
                 logger.error("Could not find username field!")
                 return False
 
-            # Find password field
-            password_field = await self.page.query_selector('input[type="password"]')
-            if not password_field or not await password_field.is_visible():
-                logger.error("Could not find password field!")
-                return False
-
             logger.info("Found login fields, filling...")
 
             # Fill username
@@ -204,31 +385,23 @@ class BrowserAutomation:
             logger.info(f"Filled username: {username}")
 
             # Fill password
-            await password_field.fill(password)
+            await self.page.fill('input[type="password"]', password)
             logger.info("Filled password")
 
-            # Submit form (look for submit button or press Enter)
-            submit_button = await self.page.query_selector('button[type="submit"], button:has-text("Login"), button:has-text("Sign in")')
-
+            # Submit form (submit button, or press Enter)
+            submit_button = await self.selectors.resolve(
+                "login", "login_submit", _LOGIN_SUBMIT_CANDIDATES, timeout=READINESS_TIMEOUTS["settle"]
+            )
             if submit_button:
                 await submit_button.click()
             else:
-                # Fallback: press Enter
                 await self.page.press('input[type="password"]', 'Enter')
 
-            # Wait for navigation after login
+            # Wait for the redirect back into the app (header rendered)
             logger.info("Waiting for redirect after login...")
-            await self.page.wait_for_load_state("domcontentloaded", timeout=10000)
-
-            # Wait additional time for any redirects to complete
-            await self.page.wait_for_timeout(1500)
-
-            # Wait for the main app to be loaded (wait for body or main content)
-            try:
-                await self.page.wait_for_selector('body', timeout=5000)
-                logger.info(f"Current URL after login: {self.page.url}")
-            except:
-                pass
+            if not await self.readiness.wait_for_selector("login", 'button.header-trigger'):
+                logger.warning("App header not visible after login")
+            logger.info(f"Current URL after login: {self.page.url}")
 
             logger.info("Login complete")
             return True
@@ -241,13 +414,108 @@ class BrowserAutomation:
             logger.error(f"Error during login: {e}", exc_info=True)
             return False
 
+    async def is_logged_in(self, timeout: int = 5000) -> bool:
+        """Check whether the application shell is shown instead of the login form.
+
+        Args:
+            timeout: Maximum time to wait for the app header in milliseconds
+
+        Returns:
+            bool: True if the user is logged in, False otherwise
+        """
+        if not self.page:
+            return False
+
+        try:
+            password_field = await self.page.query_selector('input[type="password"]')
+            if password_field and await password_field.is_visible():
+                return False
+
+            await self.page.wait_for_selector('button.header-trigger', timeout=timeout)
+            return True
+
+        except PlaywrightTimeoutError:
+            return False
+
+        except Exception as e:
+            logger.debug(f"Error checking login state: {e}")
+            return False
+
+    @traced()
+    async def ensure_logged_in(self) -> bool:
+        """Log in, reusing a cached session when the application accepts it.
+
+        Falls back to the full login form if the restored session is rejected,
+        and caches the fresh session afterwards.
+
+        Returns:
+            bool: True if logged in, False otherwise
+        """
+        if self.session_restored:
+            if await self.is_logged_in():
+                logger.info(f"Cached session accepted for {self.username}, skipping login")
+                return True
+
+            logger.info(f"Cached session rejected for {self.username}, logging in again")
+            SessionStore.invalidate(self.username)
+            self.session_restored = False
+
+        if not await self.login(self.username, self.password):
+            return False
+
+        if self.reuse_session and self.context:
+            await SessionStore.save(self.context, self.username)
+
+        return True
+
+    @traced()
+    async def preselect_theme(self, theme_name: str) -> bool:
+        """Store the theme as the client's initial theme before the app loads.
+
+        The client's ThemeContextProvider starts with the theme named in
+        localStorage["theme"]. An init script writes the theme's display
+        name there on every document of the frontend's origin, so the app
+        renders with the theme from its first paint. Must be called before
+        the first navigation.
+
+        Args:
+            theme_name: Name of the customer/theme
+
+        Returns:
+            bool: True if the init script was registered, False otherwise
+        """
+        if not self.context:
+            logger.error("Browser context not initialized")
+            return False
+
+        display_name = ThemeManager.theme_display_name(theme_name)
+        try:
+            await self.context.add_init_script(
+                script=_PRESELECT_THEME_SCRIPT % json.dumps({
+                    "origin": _origin(FRONTEND_URL),
+                    "key": THEME_STORAGE_KEY,
+                    "name": display_name,
+                })
+            )
+            self.preselected_theme = display_name
+            logger.info(f"Preselected theme '{display_name}' through localStorage")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error preselecting theme: {e}", exc_info=True)
+            return False
+
+    @traced()
     async def select_theme(self, theme_name: str) -> bool:
-        """Select a theme from the theme selector.
+        """Make sure the theme is active.
 
-        The theme selector is a popup button in the header with a palette icon.
+        A theme preselected through preselect_theme() is only verified, by
+        reading the active theme from the client. Otherwise, or if the client
+        did not pick it up (e.g. a theme file the dev server has not compiled
+        yet), the theme is chosen from the palette menu in the header.
 
         Args:
-            theme_name: Name of the theme to select
+            theme_name: Name of the customer/theme
 
         Returns:
             bool: True if successful, False otherwise
@@ -256,11 +524,30 @@ class BrowserAutomation:
             logger.error("Browser page not initialized")
             return False
 
+        if self.preselected_theme == ThemeManager.theme_display_name(theme_name):
+            if await self.readiness.wait_for_theme_applied("select_theme", theme_name):
+                logger.info(f"Preselected theme '{self.preselected_theme}' is active")
+                return True
+            logger.warning(f"Preselected theme '{self.preselected_theme}' is not active, using the theme menu")
+
+        return await self._select_theme_from_menu(theme_name)
+
+    async def _select_theme_from_menu(self, theme_name: str) -> bool:
+        """Select a theme from the theme selector.
+
+        The theme selector is a popup button in the header with a palette icon.
+
+        Args:
+            theme_name: Name of the theme to select
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
         try:
-            logger.info(f"Selecting theme: {theme_name}")
+            logger.info(f"Selecting theme from menu: {theme_name}")
 
-            # Wait for React app to be fully rendered
-            await self.page.wait_for_timeout(1000)
+            # Wait for the header (and its theme selector) to be rendered
+            await self.readiness.wait_for_selector("select_theme", 'button.header-trigger')
 
             # Find the theme selector button (has palette icon, not public or account_circle)
             # The theme button has a Material Icon "palette" inside it
@@ -269,29 +556,33 @@ class BrowserAutomation:
             theme_button = await self.page.query_selector(theme_button_selector)
 
             if not theme_button:
-                # Try alternative: find any button with palette icon
-                all_buttons = await self.page.query_selector_all('button.header-trigger')
-                for btn in all_buttons:
-                    icon_text = await btn.evaluate('el => el.querySelector("i span[aria-hidden]")?.textContent')
-                    if icon_text == "palette":
-                        theme_button = btn
-                        logger.info("Found theme button via icon search")
-                        break
+                # Try alternative: any header button with a palette icon (one round trip)
+                handle = await self.page.evaluate_handle(
+                    """() => Array.from(document.querySelectorAll('button.header-trigger')).find(
+                        (btn) => btn.querySelector('i span[aria-hidden]')?.textContent === 'palette'
+                    ) || null"""
+                )
+                theme_button = handle.as_element()
+                if theme_button:
+                    logger.info("Found theme button via icon search")
 
             if theme_button and await theme_button.is_visible():
                 logger.info("Found theme selector button, clicking to open menu...")
                 await theme_button.click()
 
-                # Wait for popup menu to appear
-                await self.page.wait_for_timeout(1000)
+                # Menu entries show the display name ("arctic-light" is "Arctic Light")
+                option_selector = f'text=/{re.escape(ThemeManager.theme_display_name(theme_name))}/i'
+
+                # Wait for popup menu to show the theme option
+                await self.readiness.wait_for_selector("select_theme", option_selector)
 
                 # Find theme option (case-insensitive)
-                theme_option = await self.page.query_selector(f'text=/{theme_name}/i')
+                theme_option = await self.page.query_selector(option_selector)
 
                 if theme_option:
                     logger.info(f"Found theme '{theme_name}', clicking...")
                     await theme_option.click()
-                    await self.page.wait_for_timeout(1000)
+                    await self.readiness.wait_for_theme_applied("select_theme", theme_name)
                     logger.info(f"Theme '{theme_name}' selected")
                 else:
                     logger.warning(f"Could not find theme '{theme_name}' in menu, continuing anyway")
@@ -307,6 +598,68 @@ class BrowserAutomation:
             logger.warning("Continuing without theme selection")
             return True
 
+    @traced()
+    async def apply_theme_in_place(
+        self,
+        theme_name: str,
+        theme_data: dict,
+        page: Optional[Page] = None
+    ) -> bool:
+        """Push a theme object into the running page through the client's theme hook.
+
+        The client (themeContext.tsx) exposes window.__A12_THEME_HOOK__; applying a
+        theme through it re-renders in place, without a rebuild or reload.
+
+        Args:
+            theme_name: Name of the customer/theme
+            theme_data: Theme content to apply
+            page: Page to update (defaults to the automation's page)
+
+        Returns:
+            bool: True if the theme was applied and rendered, False if the page
+                has no theme hook or did not re-render in time
+        """
+        page = page or self.page
+        if not page:
+            logger.error("Browser page not initialized")
+            return False
+
+        readiness = self.readiness if page is self.page else PageReadiness(page)
+        display_name = ThemeManager.theme_display_name(theme_name)
+
+        try:
+            revision = await page.evaluate(
+                "() => window.__A12_THEME_HOOK__ ? window.__A12_THEME_HOOK__.getRevision() : null"
+            )
+            if revision is None:
+                logger.warning("Page has no theme hook, cannot apply theme in place")
+                return False
+
+            await page.evaluate(
+                "([name, theme]) => window.__A12_THEME_HOOK__.applyTheme(name, theme)",
+                [display_name, theme_data]
+            )
+
+            # The hook bumps its revision once the new theme has been committed
+            await page.wait_for_function(
+                "(revision) => window.__A12_THEME_HOOK__.getRevision() > revision",
+                arg=revision,
+                timeout=READINESS_TIMEOUTS["hot_reload"]
+            )
+            await readiness.wait_for_dom_stable("hot_reload")
+
+            logger.info(f"Applied theme '{display_name}' in place")
+            return True
+
+        except PlaywrightTimeoutError:
+            logger.warning(f"Page did not re-render theme '{display_name}' in time")
+            return False
+
+        except Exception as e:
+            logger.error(f"Error applying theme in place: {e}", exc_info=True)
+            return False
+
+    @traced()
     async def create_new_person(self) -> bool:
         """Click the create new person button (+).
 
@@ -320,73 +673,9 @@ class BrowserAutomation:
         try:
             logger.info("Looking for 'Create Person' button...")
 
-            # Wait a moment for the page to settle
-            await self.page.wait_for_timeout(1000)
-
-            # Based on actual HTML: <button aria-label="Add" ...><span>Add</span></button>
-            selectors = [
-                'button[aria-label="Add"]',
-                'button[data-role="button"]:has-text("Add")',
-                'button:has-text("Add")',
-                'button:has-text("+")',
-                'button:has-text("New")',
-                'button:has-text("Create")',
-            ]
-
-            button_found = False
-            for selector in selectors:
-                try:
-                    create_button = await self.page.query_selector(selector)
-                    if create_button:
-                        # Check if visible
-                        if await create_button.is_visible():
-                            logger.info(f"Found Add button with selector: {selector}")
-                            await create_button.click()
-                            button_found = True
-                            break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-
-            if not button_found:
-                # Last resort: try to find any button that looks like it might create
-                logger.warning("Could not find create button with known selectors, trying generic search...")
-                all_buttons = await self.page.query_selector_all('button, a.button, a[role="button"]')
-                logger.info(f"Found {len(all_buttons)} total buttons on page")
-
-                # Log all button texts for debugging
-                button_texts = []
-                for idx, button in enumerate(all_buttons):
-                    try:
-                        text = await button.text_content()
-                        is_visible = await button.is_visible()
-                        if text:
-                            text = text.strip()
-                            button_texts.append(f"Button {idx}: '{text}' (visible={is_visible})")
-                    except:
-                        pass
-
-                if button_texts:
-                    logger.info("Available buttons: " + ", ".join(button_texts[:10]))  # Show first 10
-
-                # Try to find create button
-                for button in all_buttons:
-                    try:
-                        if not await button.is_visible():
-                            continue
-                        text = await button.text_content()
-                        if text:
-                            text_lower = text.strip().lower()
-                            if any(word in text_lower for word in ['+', 'add', 'new', 'create', 'hinzufügen', 'neu']):
-                                logger.info(f"Found potential create button with text: '{text.strip()}'")
-                                await button.click()
-                                button_found = True
-                                break
-                    except Exception as e:
-                        logger.debug(f"Error checking button: {e}")
-                        continue
-
-            if not button_found:
+            # Wait for the list toolbar; all candidates in one probe, learned one first
+            create_button = await self.selectors.resolve("create_new_person", "add_button", _ADD_BUTTON_CANDIDATES)
+            if not create_button:
                 logger.error("Could not find create button!")
                 # Take a screenshot to help debug
                 debug_path = Path("/tmp/debug-no-button.png")
@@ -394,8 +683,11 @@ class BrowserAutomation:
                 logger.error(f"Debug screenshot saved to: {debug_path}")
                 return False
 
-            # Wait for form to load (use domcontentloaded for speed)
-            await self.page.wait_for_load_state("domcontentloaded", timeout=10000)
+            await create_button.click()
+
+            # Wait for the form inputs to be rendered
+            if not await self.readiness.wait_for_selector("create_new_person", 'input[id^="a12-"]'):
+                logger.warning("Form inputs not visible yet after clicking Add")
 
             logger.info("Create person form opened")
             return True
@@ -408,9 +700,18 @@ class BrowserAutomation:
             logger.error(f"Error opening create form: {e}", exc_info=True)
             return False
 
+    @traced()
     async def fill_person_form(self) -> bool:
         """Fill the person form with random test data using Faker.
 
+        In deterministic mode the form gets the first fixture person instead,
+        so every round shows the same data.
+
+        All fields are resolved and set in one evaluate call (native value
+        setter plus input/change events, which React's onChange picks up) and
+        verified in a second one. Only fields that did not take the value are
+        filled again through the keyboard.
+
         Returns:
             bool: True if successful, False otherwise
         """
@@ -424,25 +725,33 @@ class BrowserAutomation:
             # Wait for React form to fully initialize and be ready for interaction
             # This is critical when running in MCP server context vs manual script
             logger.info("Waiting for form to be fully initialized...")
-            await self.page.wait_for_timeout(2000)
-
-            # Generate random data
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            email = fake.email()
-            city = fake.city()
-            country = fake.country()
-            # Generate birth date for someone between 18 and 80 years old
-            birth_date = fake.date_of_birth(minimum_age=18, maximum_age=80)
-            # Format as YYYY-MM-DD for HTML date inputs
-            birth_date_str = birth_date.strftime('%Y-%m-%d')
+            await self.readiness.wait_for_selector("fill_person_form", 'input[id^="a12-FirstName"]')
+            await self.readiness.wait_for_dom_stable("fill_person_form")
+
+            if self.deterministic:
+                # The same person every round (the first fixture person)
+                data = fixture_persons(1)[0]["Person"]["PersonalData"]
+                first_name, last_name = data["FirstName"], data["LastName"]
+                email, birth_date_str = data["EmailAddress"], data["DateOfBirth"]
+                city, country = data["PlaceOfBirth"], data["Nationality"]
+            else:
+                # Generate random data
+                first_name = fake.first_name()
+                last_name = fake.last_name()
+                email = fake.email()
+                city = fake.city()
+                country = fake.country()
+                # Generate birth date for someone between 18 and 80 years old
+                birth_date = fake.date_of_birth(minimum_age=18, maximum_age=80)
+                # Format as YYYY-MM-DD for HTML date inputs
+                birth_date_str = birth_date.strftime('%Y-%m-%d')
 
             logger.info(f"Generated test data: {first_name} {last_name}, {email}, DOB: {birth_date_str}")
 
             # Fill form fields using actual field IDs from the A12 form
             # Fields have IDs like: a12-FirstName-F3, a12-LastName-F4, etc.
             fields_to_fill = [
-                # (label text or ID pattern, value)
+                # (ID prefix, value)
                 ('a12-FirstName', first_name),
                 ('a12-LastName', last_name),
                 ('a12-EmailAddress', email),
@@ -451,68 +760,29 @@ class BrowserAutomation:
                 ('a12-Nationality', country),
             ]
 
+            with span("fill_form:batch"):
+                await self.page.evaluate(_FILL_FORM_SCRIPT, fields_to_fill)
+
+            # Let React commit the state updates before reading the values back
+            await self.readiness.wait_for_dom_stable("fill_person_form")
+
+            with span("fill_form:verify"):
+                actual = await self.page.evaluate(_READ_FORM_SCRIPT, [prefix for prefix, _ in fields_to_fill])
+
             filled_count = 0
             for field_pattern, value in fields_to_fill:
-                try:
-                    # Find input that has ID containing the pattern
-                    selector = f'input[id^="{field_pattern}"]'
-
-                    # Wait for field to be present and visible (with retry)
-                    try:
-                        await self.page.wait_for_selector(selector, state="visible", timeout=5000)
-                    except PlaywrightTimeoutError:
-                        logger.warning(f"Field not found after timeout: {field_pattern}")
-                        continue
-
-                    field = await self.page.query_selector(selector)
-
-                    if field and await field.is_visible():
-                        # Check if it's a date field
-                        field_type = await field.get_attribute('type')
-                        is_date_field = 'DateOfBirth' in field_pattern or field_type == 'date'
-
-                        # Click field first to ensure it's focused (important for React forms)
-                        await field.click()
-                        await self.page.wait_for_timeout(200)
-
-                        if is_date_field:
-                            # For date fields, use keyboard input which is more reliable
-                            # Clear field first using triple-click to select all
-                            await field.click(click_count=3)
-                            await self.page.wait_for_timeout(100)
-                            await field.press('Backspace')
-                            await self.page.wait_for_timeout(150)
-
-                            # Type the date value character by character
-                            await field.type(value, delay=50)
-                            await self.page.wait_for_timeout(200)
-
-                            # Press Tab to trigger validation/blur
-                            await field.press('Tab')
-                            await self.page.wait_for_timeout(100)
-                        else:
-                            # For regular fields, use fill method
-                            # Clear any existing value
-                            await field.fill('')
-                            await self.page.wait_for_timeout(100)
-
-                            # Fill with new value
-                            await field.fill(value)
-                            await self.page.wait_for_timeout(100)
-
-                        # Verify the value was set
-                        actual_value = await field.input_value()
-                        if actual_value == value or (is_date_field and actual_value):
-                            logger.info(f"Filled {field_pattern}: {value}")
+                actual_value = actual.get(field_pattern)
+                # Date widgets may reformat the value; any value counts
+                is_date_field = 'DateOfBirth' in field_pattern
+                if actual_value == value or (is_date_field and actual_value):
+                    filled_count += 1
+                elif actual_value is None:
+                    logger.warning(f"Field not found: {field_pattern}")
+                else:
+                    logger.info(f"Field {field_pattern} did not take the value, typing it instead")
+                    with span(f"fill_field:{field_pattern}"):
+                        if await self._type_field(field_pattern, value, is_date_field):
                             filled_count += 1
-                        else:
-                            logger.warning(f"Field {field_pattern} value mismatch: expected '{value}', got '{actual_value}'")
-                    else:
-                        logger.debug(f"Could not find field: {field_pattern}")
-
-                except Exception as e:
-                    logger.warning(f"Error filling {field_pattern}: {e}")
-                    continue
 
             logger.info(f"Filled {filled_count}/{len(fields_to_fill)} fields")
 
@@ -527,6 +797,40 @@ class BrowserAutomation:
             logger.error(f"Error filling person form: {e}", exc_info=True)
             return False
 
+    async def _type_field(self, field_pattern: str, value: str, is_date_field: bool) -> bool:
+        """Fill one field through the keyboard (fallback for fill_person_form).
+
+        Args:
+            field_pattern: ID prefix of the input
+            value: Value to enter
+            is_date_field: Type the value character by character and tab out
+
+        Returns:
+            bool: True if the field holds the value afterwards
+        """
+        try:
+            field = self.page.locator(f'input[id^="{field_pattern}"]').first
+            if is_date_field:
+                # Date widgets parse typed input more reliably than fill()
+                await field.click(click_count=3)
+                await field.press('Backspace')
+                await field.press_sequentially(value)
+                await field.press('Tab')
+            else:
+                await field.fill(value)
+
+            actual_value = await field.input_value()
+            if actual_value == value or (is_date_field and actual_value):
+                logger.info(f"Filled {field_pattern}: {value}")
+                return True
+            logger.warning(f"Field {field_pattern} value mismatch: expected '{value}', got '{actual_value}'")
+            return False
+
+        except Exception as e:
+            logger.warning(f"Error filling {field_pattern}: {e}")
+            return False
+
+    @traced()
     async def save_and_return(self) -> bool:
         """Click save button and return to list view.
 
@@ -553,13 +857,13 @@ class BrowserAutomation:
                 await self.page.press('input', 'Enter')
                 logger.info("Pressed Enter to submit")
 
-            # Wait for save to process and navigate
+            # Wait for the form to close and the list to come back
             logger.info("Waiting for save to complete...")
-            await self.page.wait_for_timeout(2000)
+            await self.readiness.wait_for_selector("save_and_return", 'input[id^="a12-FirstName"]', state="hidden")
 
-            # Wait for navigation back to list
             logger.info("Waiting for navigation back to list...")
-            await self.page.wait_for_load_state("domcontentloaded", timeout=10000)
+            await self.readiness.wait_for_selector("save_and_return", 'button[aria-label="Add"]')
+            await self.readiness.wait_for_network_idle("save_and_return", timeout=READINESS_TIMEOUTS["settle"])
 
             logger.info("Page loaded after save")
 
@@ -574,17 +878,102 @@ class BrowserAutomation:
             logger.error(f"Error saving form: {e}", exc_info=True)
             return False
 
-    async def capture_screenshot(self, path: Path, full_page: bool = True) -> bool:
+    @traced()
+    async def return_to_list(self) -> bool:
+        """Leave the form without saving and wait for the person list.
+
+        Returns:
+            bool: True if the list is shown, False otherwise
+        """
+        if not self.page:
+            logger.error("Browser page not initialized")
+            return False
+
+        try:
+            await self.page.go_back(wait_until="domcontentloaded")
+            if not await self.readiness.wait_for_selector(
+                "return_to_list", 'button[aria-label="Add"]', timeout=READINESS_TIMEOUTS["settle"]
+            ):
+                # History navigation did not lead back to the list; load it
+                await self.page.goto(FRONTEND_URL, wait_until="domcontentloaded")
+                if not await self.readiness.wait_for_selector("return_to_list", 'button[aria-label="Add"]'):
+                    return False
+
+            await self.readiness.wait_for_network_idle("return_to_list", timeout=READINESS_TIMEOUTS["settle"])
+            return True
+
+        except Exception as e:
+            logger.error(f"Error returning to list: {e}", exc_info=True)
+            return False
+
+    @traced()
+    async def open_form_state(self) -> Optional[Page]:
+        """Open a second page in this context at the filled, unsaved person form.
+
+        The page shares cookies and localStorage with the main page, so it is
+        already logged in and uses the selected theme. Nothing is saved, so
+        the backend is not written to.
+
+        Returns:
+            Page: The form page, or None if the form could not be reached
+        """
+        if not self.context:
+            logger.error("Browser context not initialized")
+            return None
+
+        list_page, list_readiness = self.page, self.readiness
+        form_page = await self.context.new_page()
+        form_page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+
+        # The form steps operate on self.page; point them at the new page
+        self.page, self.readiness = form_page, PageReadiness(form_page)
+        try:
+            await form_page.goto(FRONTEND_URL, wait_until="domcontentloaded", timeout=READINESS_TIMEOUTS["navigate_to_login"])
+
+            if (
+                await self.is_logged_in()
+                and await self.create_new_person()
+                and await self.fill_person_form()
+            ):
+                await self.readiness.wait_for_dom_stable("settle")
+                logger.info("Opened form state page")
+                return form_page
+
+            logger.warning("Could not open form state page")
+
+        except Exception as e:
+            logger.error(f"Error opening form state page: {e}", exc_info=True)
+
+        finally:
+            self.page, self.readiness = list_page, list_readiness
+
+        await form_page.close()
+        return None
+
+    async def capture_screenshot(
+        self,
+        path: Path,
+        full_page: bool = True,
+        page: Optional[Page] = None
+    ) -> bool:
         """Capture a screenshot and save to the specified path.
 
+        The image is kept in the content-addressed ScreenshotStore; path
+        becomes a link to the stored object. The boxes of the named image
+        regions (header, form, list) are stored with it. In deterministic
+        mode the capture waits for web fonts and hides the caret and any
+        running animation.
+
         Args:
             path: Path where screenshot should be saved
             full_page: Whether to capture full page or just viewport
+            page: Page to capture (defaults to the automation's page)
 
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.page:
+        page = page or self.page
+        if not page:
             logger.error("Browser page not initialized")
             return False
 
@@ -593,7 +982,15 @@ class BrowserAutomation:
             path.parent.mkdir(parents=True, exist_ok=True)
 
             # Capture screenshot
-            await self.page.screenshot(path=str(path), full_page=full_page)
+            with span(f"capture_screenshot:{path.name}", full_page=full_page):
+                if self.deterministic:
+                    readiness = self.readiness if page is self.page else PageReadiness(page)
+                    await readiness.wait_for_fonts("fonts")
+                    data = await page.screenshot(full_page=full_page, animations="disabled", caret="hide")
+                else:
+                    data = await page.screenshot(full_page=full_page)
+                regions = await self._region_boxes(page) if full_page else {}
+                await asyncio.to_thread(ScreenshotStore.save, path, data, regions=regions)
 
             logger.info(f"Screenshot saved: {path}")
             return True
@@ -602,9 +999,21 @@ class BrowserAutomation:
             logger.error(f"Error capturing screenshot: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    async def _region_boxes(page: Page) -> dict[str, list[int]]:
+        """Image-pixel boxes of the named regions on the page (empty on failure)."""
+        try:
+            return await page.evaluate(_REGION_BOXES_SCRIPT, IMAGE_REGION_SELECTORS)
+        except Exception as e:
+            logger.debug(f"Could not measure image regions: {e}")
+            return {}
+
     @staticmethod
     def get_next_round_number(customer_dir: Path) -> int:
-        """Scan directory for existing ROUNDXX files and return next round number.
+        """Return the next round number from the customer's round index.
+
+        The index (rounds.json) is completed from the ROUND files on disk;
+        nothing is reserved (see RoundIndex.allocate).
 
         Args:
             customer_dir: Directory containing customer screenshots
@@ -612,22 +1021,8 @@ class BrowserAutomation:
         Returns:
             int: Next round number to use (1 if no rounds exist)
         """
-        if not customer_dir.exists():
-            logger.info(f"Customer directory doesn't exist yet: {customer_dir}")
-            return 1
-
         try:
-            # Find all ROUNDXX files
-            max_round = 0
-            pattern = re.compile(ROUND_REGEX)
-
-            for file in customer_dir.glob("ROUND*.png"):
-                match = pattern.match(file.name)
-                if match:
-                    round_num = int(match.group(1))
-                    max_round = max(max_round, round_num)
-
-            next_round = max_round + 1
+            next_round = RoundIndex.next_round(customer_dir)
             logger.info(f"Next round number for {customer_dir.name}: {next_round}")
             return next_round
 
@@ -642,6 +1037,10 @@ class BrowserAutomation:
     ) -> Tuple[bool, list[str]]:
         """Execute the complete screenshot capture workflow.
 
+        In deterministic mode the filled form is left without saving, so
+        nothing is written to the backend and ROUNDXX_04 shows the same
+        list every round.
+
         Args:
             customer_name: Name of the customer/theme
             round_number: Round number for screenshot naming
@@ -654,6 +1053,9 @@ class BrowserAutomation:
         customer_dir.mkdir(parents=True, exist_ok=True)
 
         try:
+            # Start the app with the customer theme (verified in select_theme)
+            await self.preselect_theme(customer_name)
+
             # Step 1: Navigate to login
             if not await self.navigate_to_login():
                 return False, screenshots
@@ -663,12 +1065,12 @@ class BrowserAutomation:
             # if await self.capture_screenshot(screenshot_path):
             #     screenshots.append(str(screenshot_path))
 
-            # Step 2: Login
-            login_success = await self.login()
+            # Step 2: Login (skipped when a cached session is still valid)
+            login_success = await self.ensure_logged_in()
 
             # Wait for page to fully settle after login
             logger.info("Waiting for page to fully load after login...")
-            await self.page.wait_for_timeout(1000)
+            await self.readiness.wait_for_network_idle("settle")
 
             # Take screenshot after login regardless of success
             # logger.info("Taking screenshot after login...")
@@ -681,11 +1083,11 @@ class BrowserAutomation:
                 # Return partial results
                 return True, screenshots  # Return True so we get partial screenshots
 
-            # Wait for main page to fully load
+            # Wait for main page to fully render
             logger.info("Waiting for main page to load...")
-            await self.page.wait_for_timeout(1500)
+            await self.readiness.wait_for_dom_stable("settle")
 
-            # Try to select theme (don't fail if it doesn't work)
+            # Verify the preselected theme, or pick it from the menu (don't fail if it doesn't work)
             await self.select_theme(customer_name)
 
             # Step 3: Create new person
@@ -697,22 +1099,26 @@ class BrowserAutomation:
             if not await self.fill_person_form():
                 return False, screenshots
 
-            # Brief wait for form to settle after filling
-            await self.page.wait_for_timeout(500)
+            # Wait for validation messages and re-renders after filling
+            await self.readiness.wait_for_dom_stable("settle")
 
             # Screenshot 3: Person form filled
             screenshot_path = customer_dir / f"ROUND{round_number:02d}_03.png"
             if await self.capture_screenshot(screenshot_path):
                 screenshots.append(str(screenshot_path))
 
-            # Step 5: Save and return to list
-            if not await self.save_and_return():
+            # Step 5: Save and return to list; deterministic rounds leave the
+            # form unsaved, so the list does not grow from round to round
+            if self.deterministic:
+                if not await self.return_to_list():
+                    return False, screenshots
+            elif not await self.save_and_return():
                 return False, screenshots
 
-            # Brief wait for list to render
-            await self.page.wait_for_timeout(500)
+            # Wait for the list to render (with the new entry unless deterministic)
+            await self.readiness.wait_for_dom_stable("settle")
 
-            # Screenshot 4: Person list with new entry
+            # Screenshot 4: Person list
             screenshot_path = customer_dir / f"ROUND{round_number:02d}_04.png"
             if await self.capture_screenshot(screenshot_path):
                 screenshots.append(str(screenshot_path))
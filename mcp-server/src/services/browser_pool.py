@@ -0,0 +1,239 @@
+"""Persistent browser pool for screenshot capture.
+
+This module keeps Chromium warm across tool calls:
+- Launching Playwright and the browser once per server process
+- Handing out fresh, isolated browser contexts per call
+- Health checking the browser before each checkout
+- Recycling the browser after a maximum number of uses
+- Relaunching the browser after a crash
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Playwright,
+)
+
+from config.constants import (
+    HEADLESS,
+    SLOW_MO,
+    BROWSER_POOL_MAX_USES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    """Bookkeeping for one launched browser instance."""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0
+        self.active_contexts = 0
+        self.retired = False
+        self.crashed = False
+
+    @property
+    def is_healthy(self) -> bool:
+        return not self.crashed and not self.retired and self.browser.is_connected()
+
+
+class BrowserPool:
+    """Owns a long-lived Playwright browser shared by all tool calls."""
+
+    # Class-level state so the pool lives as long as the server process
+    _playwright: Optional[Playwright] = None
+    _current: Optional[_PooledBrowser] = None
+    _retired: list[_PooledBrowser] = []
+    _contexts: dict[BrowserContext, _PooledBrowser] = {}
+    _lock: Optional[asyncio.Lock] = None
+    _launch_count: int = 0
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Create the pool lock lazily so it binds to the running event loop."""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def start(cls) -> bool:
+        """Launch Playwright and the browser if they are not running yet.
+
+        Returns:
+            bool: True if a healthy browser is available, False otherwise
+        """
+        async with cls._get_lock():
+            try:
+                await cls._ensure_browser()
+                return True
+            except Exception as e:
+                logger.error(f"Error starting browser pool: {e}", exc_info=True)
+                return False
+
+    @classmethod
+    async def new_context(cls, **context_options) -> BrowserContext:
+        """Check out a fresh, isolated browser context from the pool.
+
+        Args:
+            **context_options: Options passed to Browser.new_context()
+
+        Returns:
+            BrowserContext: New context; hand it back with release_context()
+        """
+        async with cls._get_lock():
+            pooled = await cls._ensure_browser()
+
+            try:
+                context = await pooled.browser.new_context(**context_options)
+            except Exception as e:
+                # The browser died between the health check and the checkout
+                logger.warning(f"Pooled browser failed to create context ({e}), relaunching...")
+                pooled.crashed = True
+                pooled = await cls._ensure_browser()
+                context = await pooled.browser.new_context(**context_options)
+
+            pooled.uses += 1
+            pooled.active_contexts += 1
+            cls._contexts[context] = pooled
+
+            if pooled.uses >= BROWSER_POOL_MAX_USES:
+                logger.info(f"Pooled browser reached {pooled.uses} uses, retiring after current calls")
+                cls._retire(pooled)
+
+            logger.info(
+                f"Checked out browser context (browser uses: {pooled.uses}, "
+                f"active contexts: {pooled.active_contexts})"
+            )
+            return context
+
+    @classmethod
+    async def release_context(cls, context: BrowserContext):
+        """Close a context obtained from new_context() and return it to the pool.
+
+        Args:
+            context: Context to release
+        """
+        pooled = cls._contexts.pop(context, None)
+
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+        if pooled is None:
+            return
+
+        pooled.active_contexts = max(0, pooled.active_contexts - 1)
+
+        async with cls._get_lock():
+            await cls._close_idle_retired()
+
+    @classmethod
+    async def shutdown(cls):
+        """Close all browsers and stop Playwright."""
+        logger.info("Shutting down browser pool...")
+
+        async with cls._get_lock():
+            for context in list(cls._contexts):
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            cls._contexts.clear()
+
+            if cls._current:
+                cls._retire(cls._current)
+
+            for pooled in cls._retired:
+                await cls._close_browser(pooled)
+            cls._retired.clear()
+
+            if cls._playwright:
+                try:
+                    await cls._playwright.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping Playwright: {e}", exc_info=True)
+                cls._playwright = None
+
+        logger.info("Browser pool shut down")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Return a snapshot of the pool state for logging and diagnostics."""
+        current = cls._current
+        return {
+            "running": current is not None and current.is_healthy,
+            "launches": cls._launch_count,
+            "uses": current.uses if current else 0,
+            "active_contexts": current.active_contexts if current else 0,
+            "retired_browsers": len(cls._retired),
+        }
+
+    @classmethod
+    async def _ensure_browser(cls) -> _PooledBrowser:
+        """Return a healthy browser, launching or relaunching as needed.
+
+        Must be called with the pool lock held.
+        """
+        if cls._current and cls._current.is_healthy:
+            return cls._current
+
+        if cls._current:
+            logger.warning("Pooled browser is unhealthy, relaunching...")
+            cls._retire(cls._current)
+            await cls._close_idle_retired()
+
+        if cls._playwright is None:
+            logger.info("Starting Playwright for browser pool...")
+            cls._playwright = await async_playwright().start()
+
+        browser = await cls._playwright.chromium.launch(
+            headless=HEADLESS,
+            slow_mo=SLOW_MO,
+        )
+        pooled = _PooledBrowser(browser)
+        browser.on("disconnected", lambda _: cls._on_disconnected(pooled))
+
+        cls._current = pooled
+        cls._launch_count += 1
+        logger.info(f"Browser pool launched browser #{cls._launch_count}")
+        return pooled
+
+    @classmethod
+    def _on_disconnected(cls, pooled: _PooledBrowser):
+        """Mark a browser as crashed so the next checkout relaunches it."""
+        if not pooled.retired:
+            logger.warning("Pooled browser disconnected unexpectedly")
+        pooled.crashed = True
+
+    @classmethod
+    def _retire(cls, pooled: _PooledBrowser):
+        """Stop handing out contexts from a browser; close it once idle."""
+        pooled.retired = True
+        if pooled not in cls._retired:
+            cls._retired.append(pooled)
+        if cls._current is pooled:
+            cls._current = None
+
+    @classmethod
+    async def _close_idle_retired(cls):
+        """Close retired browsers that no longer have active contexts."""
+        for pooled in list(cls._retired):
+            if pooled.active_contexts == 0 or pooled.crashed:
+                await cls._close_browser(pooled)
+                cls._retired.remove(pooled)
+
+    @staticmethod
+    async def _close_browser(pooled: _PooledBrowser):
+        """Close a browser, ignoring errors from already-dead processes."""
+        try:
+            if pooled.browser.is_connected():
+                await pooled.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser: {e}")
@@ -0,0 +1,209 @@
+"""Warm-standby management of the backend and frontend environment.
+
+This module makes create_environment fast after the first startup:
+- Reattaching to services that are already running
+- Checkpointing the backend compose containers once they are healthy
+- Restarting checkpointed containers with `docker start` instead of the
+  full Gradle compose task
+- Starting the frontend against webpack's persistent compile cache (or
+  an up-to-date static bundle)
+- Recording time-to-ready per service and startup mode
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+from config.constants import (
+    ENVIRONMENT_CHECKPOINT_FILE,
+    WARM_STANDBY_ENABLED,
+    COMPOSE_PROJECT_NAME,
+    WEBPACK_CACHE_DIR,
+    FRONTEND_MODE,
+)
+from services.process_manager import ProcessManager
+from services.static_frontend import StaticFrontendServer
+
+logger = logging.getLogger(__name__)
+
+
+class EnvironmentManager:
+    """Starts services from warm standbys when possible, cold otherwise."""
+
+    # Background start tasks (kept referenced until they finish)
+    _tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def load_checkpoint() -> dict:
+        """Load the environment checkpoint.
+
+        Returns:
+            dict: Checkpoint content, empty if missing or unreadable
+        """
+        if not ENVIRONMENT_CHECKPOINT_FILE.exists():
+            return {}
+
+        try:
+            with open(ENVIRONMENT_CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable environment checkpoint: {e}")
+            return {}
+
+    @staticmethod
+    def save_checkpoint(checkpoint: dict):
+        """Write the environment checkpoint atomically.
+
+        Args:
+            checkpoint: Checkpoint content
+        """
+        try:
+            ENVIRONMENT_CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=ENVIRONMENT_CHECKPOINT_FILE.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_name, ENVIRONMENT_CHECKPOINT_FILE)
+        except Exception as e:
+            logger.warning(f"Could not write environment checkpoint: {e}")
+
+    @staticmethod
+    async def list_backend_containers() -> dict[str, str]:
+        """List the compose project's containers and their state.
+
+        Returns:
+            dict[str, str]: Container name to state ("running", "exited", ...);
+                empty if Docker is unavailable
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "docker", "ps", "--all",
+                "--filter", f"label=com.docker.compose.project={COMPOSE_PROJECT_NAME}",
+                "--format", "{{.Names}}\t{{.State}}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=15)
+        except Exception as e:
+            logger.debug(f"Could not list backend containers: {e}")
+            return {}
+
+        if process.returncode != 0:
+            return {}
+
+        containers = {}
+        for line in stdout.decode(errors="replace").splitlines():
+            name, _, state = line.partition("\t")
+            if name:
+                containers[name] = state
+        return containers
+
+    @classmethod
+    def _record_time_to_ready(cls, service: str, extra: Optional[dict] = None):
+        """Store the latest time-to-ready of a service in the checkpoint."""
+        metrics = ProcessManager.get_startup_metrics().get(service)
+        if not metrics or not metrics.get("ready"):
+            return
+
+        checkpoint = cls.load_checkpoint()
+        entry = checkpoint.setdefault(service, {})
+        entry.update(extra or {})
+        entry["checkpointed_at"] = time.time()
+        entry.setdefault("time_to_ready_s", {})[metrics["mode"]] = metrics["http_ready_s"]
+        cls.save_checkpoint(checkpoint)
+
+    @classmethod
+    async def _start_backend(cls, containers: list[str]):
+        """Start the backend from standby containers, falling back to Gradle."""
+        ready = False
+        if containers:
+            ready = await ProcessManager.start_backend(["docker", "start", *containers], mode="warm_start")
+            if not ready:
+                logger.warning("Warm backend start failed, falling back to Gradle")
+
+        if not ready:
+            ready = await ProcessManager.start_backend(mode="cold_start")
+
+        if ready:
+            # Checkpoint the now running containers as the next standby
+            running = [
+                name for name, state in (await cls.list_backend_containers()).items()
+                if state == "running"
+            ]
+            cls._record_time_to_ready("backend", {"containers": sorted(running)})
+
+    @classmethod
+    async def _start_frontend(cls, mode: str):
+        """Start the frontend and record its time-to-ready."""
+        if await ProcessManager.start_frontend(mode=mode):
+            cls._record_time_to_ready("frontend")
+
+    @classmethod
+    def _spawn(cls, coro):
+        task = asyncio.create_task(coro)
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def start(cls) -> dict[str, str]:
+        """Bring up backend and frontend, reusing whatever is already warm.
+
+        Running services are reattached immediately. Services that need
+        starting are started in the background (the call does not wait).
+
+        Returns:
+            dict[str, str]: Startup mode per service: "reattached",
+                "warm_start" or "cold_start"
+        """
+        modes: dict[str, str] = {}
+
+        # Reattach to services that are already up
+        for service, check in (
+            ("backend", ProcessManager.is_backend_healthy),
+            ("frontend", ProcessManager.is_frontend_healthy),
+        ):
+            probe_started = time.monotonic()
+            if await check():
+                ProcessManager.record_reattach(service, time.monotonic() - probe_started)
+                modes[service] = "reattached"
+
+        if "backend" not in modes:
+            containers = []
+            if WARM_STANDBY_ENABLED:
+                checkpointed = set(cls.load_checkpoint().get("backend", {}).get("containers", []))
+                existing = await cls.list_backend_containers()
+                containers = sorted(checkpointed & existing.keys())
+
+            modes["backend"] = "warm_start" if containers else "cold_start"
+            logger.info(f"Starting backend ({modes['backend']})...")
+            cls._spawn(cls._start_backend(containers))
+
+        if "frontend" not in modes:
+            # The static frontend is warm when its bundle is up to date, the dev
+            # server once webpack's filesystem cache exists
+            if FRONTEND_MODE == "static":
+                warm = await asyncio.to_thread(StaticFrontendServer.is_bundle_fresh)
+            else:
+                warm = WARM_STANDBY_ENABLED and WEBPACK_CACHE_DIR.exists()
+            modes["frontend"] = "warm_start" if warm else "cold_start"
+            logger.info(f"Starting frontend ({modes['frontend']})...")
+            cls._spawn(cls._start_frontend(modes["frontend"]))
+
+        return modes
+
+    @classmethod
+    def standby_report(cls) -> dict[str, dict]:
+        """Return the checkpointed time-to-ready per service and startup mode.
+
+        Returns:
+            dict[str, dict]: Per service: seconds to ready by startup mode
+        """
+        checkpoint = cls.load_checkpoint()
+        return {
+            service: dict(entry.get("time_to_ready_s", {}))
+            for service, entry in checkpoint.items()
+            if isinstance(entry, dict)
+        }
@@ -0,0 +1,257 @@
+"""Pixel diff engine for comparing ROUND screenshots against TARGET screenshots.
+
+This module turns two large screenshots into a small numeric signal:
+- Per-pair similarity score and changed-pixel ratio
+- Per-region difference heatmap on a coarse grid
+- Compact diff image highlighting where the screenshots differ
+
+All comparisons run vectorized with NumPy on downscaled copies, so even
+3000px-wide TARGET files compare in milliseconds.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    TARGET_PATTERN,
+    DIFF_PATTERN,
+    DIFFS_DIRNAME,
+    COMPARE_WORK_WIDTH,
+    COMPARE_PIXEL_THRESHOLD,
+    DIFF_IMAGE_MAX_EDGE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _scaled_size(size: tuple[int, int], max_edge: int) -> tuple[int, int]:
+    """Scale (width, height) down so the longer edge is at most max_edge."""
+    width, height = size
+    scale = min(1.0, max_edge / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _width_scaled(size: tuple[int, int], width: int) -> tuple[int, int]:
+    """Scale (width, height) to the given width, keeping the aspect ratio."""
+    return width, max(1, round(size[1] * width / size[0]))
+
+
+def load_rgb(path: Path, size: Optional[tuple[int, int]] = None) -> np.ndarray:
+    """Load an image as a float32 RGB array, optionally resized.
+
+    Args:
+        path: Image file to load
+        size: Target (width, height); None keeps the original size
+
+    Returns:
+        np.ndarray: Array of shape (height, width, 3) with values 0-255
+    """
+    with Image.open(path) as img:
+        img = img.convert("RGB")
+        if size and img.size != size:
+            # reducing_gap downsamples in integer steps first, which is much faster
+            img = img.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+        return np.asarray(img, dtype=np.float32)
+
+
+def region_heatmap(per_pixel: np.ndarray, grid: int) -> np.ndarray:
+    """Average a per-pixel difference map over a grid of regions.
+
+    Args:
+        per_pixel: Array of shape (height, width) with values 0-255
+        grid: Number of rows and columns
+
+    Returns:
+        np.ndarray: Array of shape (rows, cols) with values 0-1
+    """
+    height, width = per_pixel.shape
+    rows, cols = min(grid, height), min(grid, width)
+
+    row_edges = np.linspace(0, height, rows + 1).astype(int)
+    col_edges = np.linspace(0, width, cols + 1).astype(int)
+
+    sums = np.add.reduceat(per_pixel, row_edges[:-1], axis=0)
+    sums = np.add.reduceat(sums, col_edges[:-1], axis=1)
+    counts = np.outer(np.diff(row_edges), np.diff(col_edges))
+
+    return sums / counts / 255.0
+
+
+def compare_arrays(actual: np.ndarray, target: np.ndarray, grid: int = 8) -> dict:
+    """Compare two equally sized RGB arrays.
+
+    Args:
+        actual: Screenshot array of shape (height, width, 3)
+        target: Target array of the same shape
+        grid: Rows and columns of the region heatmap
+
+    Returns:
+        dict: similarity, changed_ratio, heatmap, worst_regions and the
+            per-pixel difference map (key "per_pixel")
+    """
+    if actual.shape != target.shape:
+        raise ValueError(f"Shape mismatch: {actual.shape} vs {target.shape}")
+
+    diff = np.abs(actual - target)
+    per_pixel = diff.max(axis=2)
+    heatmap = region_heatmap(per_pixel, grid)
+
+    # Rank regions by difference, worst first
+    order = np.argsort(heatmap, axis=None)[::-1][:3]
+    worst_regions = [
+        {"row": int(row), "col": int(col), "score": round(float(heatmap[row, col]), 3)}
+        for row, col in zip(*np.unravel_index(order, heatmap.shape))
+    ]
+
+    return {
+        "similarity": round(1.0 - float(diff.mean()) / 255.0, 4),
+        "changed_ratio": round(float((per_pixel > COMPARE_PIXEL_THRESHOLD).mean()), 4),
+        "heatmap": np.round(heatmap, 3).tolist(),
+        "worst_regions": worst_regions,
+        "per_pixel": per_pixel,
+    }
+
+
+def render_diff_image(target: np.ndarray, per_pixel: np.ndarray) -> Image.Image:
+    """Render differences in red over a dimmed grayscale copy of the target.
+
+    Args:
+        target: Target array of shape (height, width, 3)
+        per_pixel: Difference map of shape (height, width)
+
+    Returns:
+        Image.Image: RGB diff image no larger than DIFF_IMAGE_MAX_EDGE
+    """
+    gray = target.mean(axis=2) * 0.35
+    intensity = np.clip(per_pixel * 4.0, 0, 255)
+
+    overlay = np.stack([np.maximum(gray, intensity), gray, gray], axis=2).astype(np.uint8)
+    img = Image.fromarray(overlay)
+
+    size = _scaled_size(img.size, DIFF_IMAGE_MAX_EDGE)
+    if size != img.size:
+        img = img.resize(size, Image.Resampling.BILINEAR)
+    return img
+
+
+class ImageComparator:
+    """Compares ROUND screenshots with the matching TARGET screenshots."""
+
+    @staticmethod
+    def compare_files(
+        round_path: Path,
+        target_path: Path,
+        diff_path: Optional[Path] = None,
+        grid: int = 8
+    ) -> dict:
+        """Compare one screenshot file with its target.
+
+        Both images are scaled to a common width (the narrower of the two,
+        at most COMPARE_WORK_WIDTH) with their aspect ratios kept, and only
+        the top-aligned overlap is compared. A full-page capture taller or
+        shorter than its target is therefore not stretched onto it; the
+        uncompared part is reported as height_mismatch.
+
+        Args:
+            round_path: Captured screenshot
+            target_path: Target screenshot
+            diff_path: Where to write the compact diff image (optional)
+            grid: Rows and columns of the region heatmap
+
+        Returns:
+            dict: Comparison result (without the raw per-pixel map)
+        """
+        with Image.open(target_path) as img:
+            target_size = img.size
+        with Image.open(round_path) as img:
+            round_size = img.size
+
+        width = min(COMPARE_WORK_WIDTH, target_size[0], round_size[0])
+        target = load_rgb(target_path, _width_scaled(target_size, width))
+        actual = load_rgb(round_path, _width_scaled(round_size, width))
+
+        height = min(target.shape[0], actual.shape[0])
+        height_mismatch = abs(target.shape[0] - actual.shape[0]) / max(target.shape[0], actual.shape[0])
+        target, actual = target[:height], actual[:height]
+
+        result = compare_arrays(actual, target, grid)
+        per_pixel = result.pop("per_pixel")
+
+        result["round_file"] = str(round_path)
+        result["target_file"] = str(target_path)
+        result["round_size"] = list(round_size)
+        result["target_size"] = list(target_size)
+        result["compared_size"] = [width, height]
+        result["height_mismatch"] = round(height_mismatch, 4)
+        result["diff_image"] = None
+
+        if diff_path:
+            diff_path.parent.mkdir(parents=True, exist_ok=True)
+            render_diff_image(target, per_pixel).save(diff_path, optimize=True)
+            result["diff_image"] = str(diff_path)
+
+        return result
+
+    @staticmethod
+    def find_pairs(customer_dir: Path, round_number: int) -> list[tuple[int, Path, Path]]:
+        """Find ROUND/TARGET pairs that share the same screenshot index.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+            round_number: Round whose screenshots should be paired
+
+        Returns:
+            list: (index, round_path, target_path) tuples sorted by index
+        """
+        pattern = re.compile(rf"ROUND{round_number:02d}_(\d{{2}})\.png")
+        pairs = []
+
+        for round_path in sorted(customer_dir.glob(f"ROUND{round_number:02d}_*.png")):
+            match = pattern.match(round_path.name)
+            if not match:
+                continue
+
+            index = int(match.group(1))
+            target_path = customer_dir / TARGET_PATTERN.format(index)
+            if target_path.exists():
+                pairs.append((index, round_path, target_path))
+            else:
+                logger.debug(f"No target for {round_path.name}")
+
+        return pairs
+
+    @staticmethod
+    def compare_round(customer_name: str, round_number: int, grid: int = 8) -> list[dict]:
+        """Compare every screenshot of a round with its target.
+
+        Diff images are written to <customer>/diffs/DIFFXX_YY.png.
+
+        Args:
+            customer_name: Name of the customer/theme
+            round_number: Round to compare
+            grid: Rows and columns of the region heatmap
+
+        Returns:
+            list[dict]: One comparison result per ROUND/TARGET pair
+        """
+        customer_dir = SCREENSHOTS_DIR / customer_name
+        results = []
+
+        for index, round_path, target_path in ImageComparator.find_pairs(customer_dir, round_number):
+            diff_path = customer_dir / DIFFS_DIRNAME / DIFF_PATTERN.format(round_number, index)
+            result = ImageComparator.compare_files(round_path, target_path, diff_path, grid)
+            result["index"] = index
+            results.append(result)
+
+            logger.info(
+                f"Compared {round_path.name} with {target_path.name}: "
+                f"similarity={result['similarity']}, changed={result['changed_ratio']}"
+            )
+
+        return results
@@ -0,0 +1,188 @@
+"""Small, cropped renditions of screenshots for delivery to the MCP client.
+
+This module keeps images sent to the agent cheap:
+- Cropping to a named region (header, form, list) using the element boxes
+  recorded on capture, or a layout-based fallback for TARGET files
+- Downscaling to a requested longest edge
+- Encoding as JPEG, WebP or PNG at a chosen quality
+- Caching every rendition by source content hash and options, so repeated
+  requests for the same image cost a file read
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    IMAGE_CACHE_DIR,
+    IMAGE_DEFAULT_MAX_EDGE,
+    IMAGE_DEFAULT_QUALITY,
+    IMAGE_REGION_SELECTORS,
+    IMAGE_FALLBACK_HEADER_RATIO,
+)
+from services.screenshot_store import ScreenshotStore
+
+logger = logging.getLogger(__name__)
+
+REGIONS = ["full", *IMAGE_REGION_SELECTORS]
+
+# Format name to (PIL format, MIME type, file suffix)
+FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg", ".jpg"),
+    "webp": ("WEBP", "image/webp", ".webp"),
+    "png": ("PNG", "image/png", ".png"),
+}
+
+
+def fallback_region_box(size: tuple[int, int], region: str) -> tuple[int, int, int, int]:
+    """Box of a region in an image without recorded element boxes.
+
+    The header is a strip at the top whose height scales with the image
+    width (pages are captured full height); form and list are the content
+    below it.
+
+    Args:
+        size: Image (width, height)
+        region: Region name
+
+    Returns:
+        tuple: (left, top, right, bottom) in pixels
+    """
+    width, height = size
+    header_bottom = min(height, max(1, round(width * IMAGE_FALLBACK_HEADER_RATIO)))
+    if region == "header":
+        return 0, 0, width, header_bottom
+    if region in ("form", "list") and header_bottom < height:
+        return 0, header_bottom, width, height
+    return 0, 0, width, height
+
+
+def _clamp_box(box: list[int], size: tuple[int, int]) -> Optional[tuple[int, int, int, int]]:
+    """Clip a box to the image; None if nothing of it is left."""
+    width, height = size
+    left, top = max(0, int(box[0])), max(0, int(box[1]))
+    right, bottom = min(width, int(box[2])), min(height, int(box[3]))
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right, bottom
+
+
+class ImageRenderer:
+    """Renders cached, downscaled and cropped images."""
+
+    @staticmethod
+    def region_box(
+        digest: str,
+        size: tuple[int, int],
+        region: str,
+        screenshots_dir: Path = SCREENSHOTS_DIR
+    ) -> tuple[int, int, int, int]:
+        """Pixel box of a named region of an image.
+
+        Args:
+            digest: Content hash of the image
+            size: Image (width, height)
+            region: "full", "header", "form" or "list"
+            screenshots_dir: Root screenshots directory (holds the store)
+
+        Returns:
+            tuple: (left, top, right, bottom)
+        """
+        if region == "full":
+            return 0, 0, size[0], size[1]
+
+        recorded = ScreenshotStore.regions(digest, screenshots_dir).get(region)
+        if recorded:
+            box = _clamp_box(recorded, size)
+            if box:
+                return box
+        return fallback_region_box(size, region)
+
+    @classmethod
+    def render(
+        cls,
+        path: Path,
+        max_edge: int = IMAGE_DEFAULT_MAX_EDGE,
+        region: str = "full",
+        fmt: str = "jpeg",
+        quality: int = IMAGE_DEFAULT_QUALITY,
+        cache_dir: Path = IMAGE_CACHE_DIR,
+        screenshots_dir: Path = SCREENSHOTS_DIR
+    ) -> dict:
+        """Render an image region at a bounded size, from cache when possible.
+
+        Args:
+            path: Source image (ROUND, TARGET or DIFF file)
+            max_edge: Longest edge of the rendition in pixels
+            region: "full", "header", "form" or "list"
+            fmt: "jpeg", "webp" or "png"
+            quality: JPEG/WebP quality (ignored for PNG)
+            cache_dir: Directory of cached renditions
+            screenshots_dir: Root screenshots directory (holds the store)
+
+        Returns:
+            dict: data (bytes), mime_type, width, height, source_size, box,
+                bytes and cache_hit
+
+        Raises:
+            FileNotFoundError: If the source image does not exist
+            ValueError: If region or format is unknown
+        """
+        if region not in REGIONS:
+            raise ValueError(f"Unknown region '{region}' (use one of {', '.join(REGIONS)})")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}' (use one of {', '.join(FORMATS)})")
+
+        digest = ScreenshotStore.digest_of(path)
+        if digest is None:
+            raise FileNotFoundError(f"Image does not exist: {path}")
+
+        pil_format, mime_type, suffix = FORMATS[fmt]
+        options = f"{region}|{max_edge}|{fmt}|{quality if fmt != 'png' else ''}"
+        key = hashlib.sha256(f"{digest}|{options}".encode("utf-8")).hexdigest()[:16]
+        cached = cache_dir / digest[:2] / f"{digest[:16]}-{key}{suffix}"
+        meta_path = cached.with_suffix(".json")
+
+        if cached.exists() and meta_path.exists():
+            data = cached.read_bytes()
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return {"data": data, "mime_type": mime_type, **meta, "bytes": len(data), "cache_hit": True}
+
+        with Image.open(path) as img:
+            source_size = img.size
+            box = cls.region_box(digest, source_size, region, screenshots_dir)
+            # Crop first so the region keeps as much detail as the size allows
+            img = img.convert("RGB").crop(box)
+            img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+            save_options = {"format": pil_format}
+            if fmt == "jpeg":
+                save_options.update(quality=quality, optimize=True)
+            elif fmt == "webp":
+                save_options.update(quality=quality, method=4)
+            else:
+                save_options.update(optimize=True)
+
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    img.save(f, **save_options)
+                os.replace(tmp_name, cached)
+            except Exception:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            width, height = img.size
+
+        meta = {"width": width, "height": height, "source_size": list(source_size), "box": list(box)}
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        data = cached.read_bytes()
+        logger.info(f"Rendered {path.name} {region} at {width}x{height} {fmt} ({len(data)} bytes)")
+        return {"data": data, "mime_type": mime_type, **meta, "bytes": len(data), "cache_hit": False}
@@ -0,0 +1,223 @@
+"""Scheduler for tool calls that share the environment or a customer's files.
+
+The MCP server handles requests concurrently (every SSE client, and every
+request of a client, gets its own task). This module keeps those calls
+from stepping on each other:
+- Bounded concurrency: at most JOB_MAX_CONCURRENCY scheduled calls run at
+  once, the rest wait in a FIFO queue
+- Per-customer mutual exclusion: calls for the same customer (screenshot
+  rounds, theme patches, comparisons) run one after another
+- Shared/exclusive environment access: screenshot calls share the running
+  environment, create_environment waits until they are done and holds it
+  exclusively
+- Queue positions reported to the caller while waiting
+- Cancellation of queued or running jobs (cancel_job, or the client
+  cancelling its request)
+
+Calls for different customers overtake a blocked call, but never one that
+wants the same customer, so each customer's calls keep their order.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from config.constants import (
+    JOB_MAX_CONCURRENCY,
+    JOB_HISTORY_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelledError(Exception):
+    """Raised in the caller when its job was cancelled with cancel_job."""
+
+
+class Job:
+    """One scheduled tool call."""
+
+    def __init__(self, tool: str, exclusive: Iterable[str], shared: Iterable[str]):
+        self.id = uuid.uuid4().hex[:8]
+        self.tool = tool
+        self.exclusive = frozenset(exclusive)
+        # A key held exclusively is never also held shared by the same job
+        self.shared = frozenset(shared) - self.exclusive
+        self.state = "queued"  # queued, running, done, failed, cancelled
+        self.position: Optional[int] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+        self.task: Optional[asyncio.Task] = None
+        self.wake = asyncio.Event()
+
+    def to_dict(self) -> dict:
+        """Public view of the job for list_jobs."""
+        now = time.time()
+        waited_until = self.started_at or self.finished_at or now
+        return {
+            "job_id": self.id,
+            "tool": self.tool,
+            "keys": sorted(self.exclusive | self.shared),
+            "state": self.state,
+            "position": self.position,
+            "wait_s": round(waited_until - self.created_at, 3),
+            "run_s": round((self.finished_at or now) - self.started_at, 3) if self.started_at else None,
+            "error": self.error,
+        }
+
+
+class JobScheduler:
+    """Queues scheduled tool calls and starts them when their keys are free."""
+
+    # Class-level state so the queue is shared by all sessions of the process
+    _queue: deque[Job] = deque()
+    _running: dict[str, Job] = {}
+    _history: deque[Job] = deque(maxlen=JOB_HISTORY_SIZE)  # Finished jobs
+    max_concurrency: int = JOB_MAX_CONCURRENCY
+
+    @staticmethod
+    def _conflicts(job: Job, exclusive: set[str], shared: set[str]) -> bool:
+        """Whether job needs a key held (or reserved) as given."""
+        return bool(job.exclusive & (exclusive | shared) or job.shared & exclusive)
+
+    @classmethod
+    def _dispatch(cls):
+        """Start every queued job whose keys are free, in queue order.
+
+        Keys of jobs that have to keep waiting are reserved for them, so a
+        later job for the same customer cannot overtake an earlier one.
+        """
+        exclusive: set[str] = set()
+        shared: set[str] = set()
+        for job in cls._running.values():
+            exclusive |= job.exclusive
+            shared |= job.shared
+
+        running = len(cls._running)
+        position = 0
+        for job in list(cls._queue):
+            if running < cls.max_concurrency and not cls._conflicts(job, exclusive, shared):
+                cls._queue.remove(job)
+                cls._running[job.id] = job
+                job.state = "running"
+                job.position = None
+                job.started_at = time.time()
+                running += 1
+                job.wake.set()
+            else:
+                position += 1
+                if job.position != position:
+                    job.position = position
+                    job.wake.set()
+            exclusive |= job.exclusive
+            shared |= job.shared
+
+    @classmethod
+    async def run(
+        cls,
+        tool: str,
+        run: Callable[[], Awaitable[Any]],
+        exclusive: Iterable[str] = (),
+        shared: Iterable[str] = (),
+        on_queued: Optional[Callable[[Job], Awaitable[None]]] = None
+    ) -> Any:
+        """Run a tool call once its keys are free and a slot is available.
+
+        Args:
+            tool: Tool name (for list_jobs and logs)
+            run: Starts the tool call
+            exclusive: Keys the call needs alone (e.g. the customer name)
+            shared: Keys the call may share with other shared holders
+                (e.g. "environment")
+            on_queued: Called with the job while it waits, whenever its
+                queue position changes
+
+        Returns:
+            Whatever run returns
+
+        Raises:
+            JobCancelledError: If the job was cancelled with cancel()
+        """
+        job = Job(tool, exclusive, shared)
+        job.task = asyncio.current_task()
+        cls._queue.append(job)
+        cls._dispatch()
+
+        try:
+            while job.state == "queued":
+                if job.position is not None:
+                    logger.info(f"Job {job.id} ({tool}) queued at position {job.position}")
+                    if on_queued:
+                        try:
+                            await on_queued(job)
+                        except Exception as e:
+                            logger.debug(f"Could not report queue position of job {job.id}: {e}")
+                job.wake.clear()
+                if job.state == "queued":
+                    await job.wake.wait()
+
+            logger.info(f"Job {job.id} ({tool}) started after {job.started_at - job.created_at:.2f}s")
+            result = await run()
+            job.state = "done"
+            return result
+
+        except asyncio.CancelledError:
+            job.state = "cancelled"
+            if job.cancel_requested and job.task.uncancel() == 0:
+                raise JobCancelledError(f"Job {job.id} ({tool}) was cancelled")
+            raise
+
+        except Exception as e:
+            job.state = "failed"
+            job.error = str(e)
+            raise
+
+        finally:
+            job.finished_at = time.time()
+            job.position = None
+            if job in cls._queue:
+                cls._queue.remove(job)
+            cls._running.pop(job.id, None)
+            cls._history.append(job)
+            cls._dispatch()
+
+    @classmethod
+    def cancel(cls, job_id: str) -> Optional[str]:
+        """Cancel a queued or running job.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            str: State the job was in ("queued" or "running"), or None if
+                no such job is waiting or running
+        """
+        job = cls._running.get(job_id) or next((j for j in cls._queue if j.id == job_id), None)
+        if job is None or job.cancel_requested:
+            return None
+
+        job.cancel_requested = True
+        state = job.state
+        job.task.cancel()
+        logger.info(f"Cancelling {state} job {job.id} ({job.tool})")
+        return state
+
+    @classmethod
+    def jobs(cls) -> list[dict]:
+        """Recently finished, running and queued jobs, oldest first."""
+        return [job.to_dict() for job in (*cls._history, *cls._running.values(), *cls._queue)]
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Number of running and queued jobs and the concurrency limit."""
+        return {
+            "running": len(cls._running),
+            "queued": len(cls._queue),
+            "max_concurrency": cls.max_concurrency,
+        }
@@ -0,0 +1,215 @@
+"""Live browser sessions kept open between screenshot rounds.
+
+This module parks logged-in pages per customer after a full screenshot
+workflow, so later rounds can:
+- Push the updated theme JSON straight into the open pages
+- Re-render in place and re-capture without rebuild, reload or login
+- Re-capture the form and list states without creating another person
+
+Parked sessions hold browser contexts open, so they are closed after
+LIVE_SESSION_IDLE_TIMEOUT seconds without use, and at most LIVE_SESSION_MAX
+are kept (the least recently used one is closed first).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from playwright.async_api import Page
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    ROUND_PATTERN,
+    LIVE_SESSION_IDLE_TIMEOUT,
+    LIVE_SESSION_MAX,
+)
+from services.browser_automation import BrowserAutomation
+from services.theme_manager import ThemeManager
+
+logger = logging.getLogger(__name__)
+
+
+class LiveSession:
+    """An open browser session parked at one or more screenshot states."""
+
+    def __init__(self, customer_name: str, automation: BrowserAutomation, pages: dict[int, Page]):
+        """Initialize a live session.
+
+        Args:
+            customer_name: Name of the customer/theme
+            automation: Open automation that owns the browser context
+            pages: Parked pages by screenshot index (the YY in ROUNDXX_YY.png)
+        """
+        self.customer_name = customer_name
+        self.automation = automation
+        self.pages = pages
+        self.last_used = time.time()
+
+    @property
+    def is_alive(self) -> bool:
+        """True while all parked pages are still open."""
+        return bool(self.pages) and not any(page.is_closed() for page in self.pages.values())
+
+    async def close(self):
+        """Close the parked pages and the owning browser context."""
+        for page in self.pages.values():
+            if page is not self.automation.page and not page.is_closed():
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+        self.pages = {}
+        await self.automation.close_browser()
+
+
+class LiveSessionManager:
+    """Keeps at most one live session per customer."""
+
+    _sessions: dict[str, LiveSession] = {}
+    _reaper: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get(cls, customer_name: str) -> Optional[LiveSession]:
+        """Return the customer's live session if its pages are still open.
+
+        Args:
+            customer_name: Name of the customer/theme
+
+        Returns:
+            LiveSession: Open session, or None
+        """
+        session = cls._sessions.get(customer_name)
+        if session and not session.is_alive:
+            logger.info(f"Live session for {customer_name} is gone, dropping it")
+            cls._sessions.pop(customer_name, None)
+            return None
+        if session:
+            session.last_used = time.time()
+        return session
+
+    @classmethod
+    async def park(
+        cls,
+        customer_name: str,
+        automation: BrowserAutomation,
+        pages: dict[int, Page]
+    ) -> LiveSession:
+        """Keep an automation open for later in-place re-captures.
+
+        Replaces (and closes) any previous session of the customer.
+
+        Args:
+            customer_name: Name of the customer/theme
+            automation: Open automation that owns the browser context
+            pages: Parked pages by screenshot index
+
+        Returns:
+            LiveSession: The parked session
+        """
+        previous = cls._sessions.pop(customer_name, None)
+        if previous and previous.automation is not automation:
+            await previous.close()
+
+        session = LiveSession(customer_name, automation, pages)
+        cls._sessions[customer_name] = session
+        logger.info(f"Parked live session for {customer_name} at states {sorted(pages)}")
+
+        # Make room by closing the least recently used sessions
+        while len(cls._sessions) > LIVE_SESSION_MAX:
+            oldest = min(cls._sessions.values(), key=lambda s: s.last_used)
+            logger.info(f"Live session limit ({LIVE_SESSION_MAX}) reached, closing {oldest.customer_name}")
+            await cls.close(oldest.customer_name)
+
+        if cls._reaper is None or cls._reaper.done():
+            cls._reaper = asyncio.create_task(cls._reap())
+        return session
+
+    @classmethod
+    async def expire_idle(cls, now: Optional[float] = None) -> list[str]:
+        """Close sessions unused for longer than LIVE_SESSION_IDLE_TIMEOUT.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            list[str]: Customers whose sessions were closed
+        """
+        now = time.time() if now is None else now
+        expired = [
+            name for name, session in cls._sessions.items()
+            if now - session.last_used > LIVE_SESSION_IDLE_TIMEOUT
+        ]
+        for customer_name in expired:
+            logger.info(f"Live session for {customer_name} idle for over {LIVE_SESSION_IDLE_TIMEOUT}s")
+            await cls.close(customer_name)
+        return expired
+
+    @classmethod
+    async def _reap(cls):
+        """Close idle sessions periodically while any are parked."""
+        while cls._sessions:
+            await asyncio.sleep(max(1.0, LIVE_SESSION_IDLE_TIMEOUT / 4))
+            try:
+                await cls.expire_idle()
+            except Exception as e:
+                logger.warning(f"Error closing idle live sessions: {e}")
+
+    @classmethod
+    async def close(cls, customer_name: str):
+        """Close a customer's live session, if any."""
+        session = cls._sessions.pop(customer_name, None)
+        if session:
+            await session.close()
+            logger.info(f"Closed live session for {customer_name}")
+
+    @classmethod
+    async def close_all(cls):
+        """Close all live sessions (server shutdown)."""
+        for customer_name in list(cls._sessions):
+            await cls.close(customer_name)
+        if cls._reaper is not None:
+            cls._reaper.cancel()
+            cls._reaper = None
+
+    @classmethod
+    async def recapture(
+        cls,
+        customer_name: str,
+        round_number: int,
+        required_states: frozenset[int] = frozenset()
+    ) -> Optional[list[str]]:
+        """Apply the customer's current theme file in place and re-capture all parked states.
+
+        Args:
+            customer_name: Name of the customer/theme
+            round_number: Round number for screenshot naming
+            required_states: Screenshot indexes the session must have parked
+
+        Returns:
+            list[str]: Screenshot paths, or None if there is no usable live
+                session (the caller should fall back to the full workflow)
+        """
+        session = cls.get(customer_name)
+        if not session:
+            return None
+        if not required_states <= session.pages.keys():
+            logger.info(f"Live session for {customer_name} lacks states {sorted(required_states - session.pages.keys())}")
+            return None
+
+        theme_data = ThemeManager.load_theme(customer_name)
+        customer_dir = SCREENSHOTS_DIR / customer_name
+        screenshots = []
+
+        for index, page in sorted(session.pages.items()):
+            if not await session.automation.apply_theme_in_place(customer_name, theme_data, page):
+                logger.warning(f"In-place theme update failed for {customer_name}, closing live session")
+                await cls.close(customer_name)
+                return None
+
+            screenshot_path = customer_dir / ROUND_PATTERN.format(round_number, index)
+            if await session.automation.capture_screenshot(screenshot_path, page=page):
+                screenshots.append(str(screenshot_path))
+
+        session.last_used = time.time()
+        return screenshots
@@ -0,0 +1,169 @@
+"""Streaming log pump for piped service output.
+
+This module keeps the stdout/stderr pipes of backend and frontend drained:
+- Reading both streams continuously so a child never blocks on a full pipe
+- Keeping the most recent lines in a bounded in-memory ring buffer
+- Writing all lines to a size-rotated log file on disk
+- Signalling when a line matches the service's "ready" pattern
+- Tailing and grepping recent lines for the get_service_logs tool
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+from config.constants import (
+    LOG_DIR,
+    LOG_BUFFER_LINES,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Longest line kept in the ring buffer; longer lines are cut
+_MAX_LINE_CHARS = 4000
+
+
+class LogPump:
+    """Drains a process's output into a ring buffer and a rotated log file."""
+
+    def __init__(
+        self,
+        service: str,
+        ready_pattern: Optional[str] = None,
+        on_ready: Optional[Callable[[str], None]] = None,
+        log_dir: Path = LOG_DIR,
+        max_lines: int = LOG_BUFFER_LINES
+    ):
+        """Initialize a log pump.
+
+        Args:
+            service: Service name, used for the log file name
+            ready_pattern: Regex that marks the service as started
+            on_ready: Called with the first line matching ready_pattern
+            log_dir: Directory for the rotated log files
+            max_lines: Number of recent lines kept in memory
+        """
+        self.service = service
+        self.ready = asyncio.Event()
+        self.lines: deque[tuple[float, str, str]] = deque(maxlen=max_lines)
+        self.total_lines = 0
+        self.log_path = log_dir / f"{service}.log"
+
+        self._ready_regex = re.compile(ready_pattern) if ready_pattern else None
+        self._on_ready = on_ready
+        self._tasks: list[asyncio.Task] = []
+        self._file_handler: Optional[logging.handlers.RotatingFileHandler] = None
+
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._file_handler = logging.handlers.RotatingFileHandler(
+                self.log_path,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding="utf-8"
+            )
+            self._file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        except Exception as e:
+            logger.warning(f"Could not open log file for {service}, keeping logs in memory only: {e}")
+
+    def attach(self, process: asyncio.subprocess.Process):
+        """Start draining the stdout and stderr pipes of a process.
+
+        Args:
+            process: Process started with stdout/stderr=PIPE
+        """
+        for stream_name, stream in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if stream is not None:
+                self._tasks.append(asyncio.create_task(self._pump(stream_name, stream)))
+
+    async def wait_closed(self):
+        """Wait until all attached streams reached EOF."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stop(self):
+        """Stop reading and close the log file. Buffered lines stay available."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._file_handler:
+            self._file_handler.close()
+            self._file_handler = None
+
+    async def _pump(self, stream_name: str, stream: asyncio.StreamReader):
+        """Read one stream line by line until EOF."""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line exceeded the stream limit; the reader dropped it
+                self._record(stream_name, "[line too long, dropped]")
+                continue
+
+            if not line:
+                break
+            self._record(stream_name, line.decode(errors="replace").rstrip())
+
+    def _record(self, stream_name: str, text: str):
+        """Store a line and check it against the ready pattern."""
+        if len(text) > _MAX_LINE_CHARS:
+            text = text[:_MAX_LINE_CHARS] + " [...]"
+
+        self.lines.append((time.time(), stream_name, text))
+        self.total_lines += 1
+
+        if self._file_handler:
+            record = logging.LogRecord(self.service, logging.INFO, "", 0, f"[{stream_name}] {text}", None, None)
+            try:
+                self._file_handler.emit(record)
+            except Exception:
+                pass
+
+        if self._ready_regex and not self.ready.is_set() and self._ready_regex.search(text):
+            self.ready.set()
+            if self._on_ready:
+                self._on_ready(text)
+
+    def tail(
+        self,
+        lines: int = 100,
+        pattern: Optional[str] = None,
+        ignore_case: bool = False,
+        stream: Optional[str] = None
+    ) -> list[str]:
+        """Return the most recent buffered lines, optionally filtered.
+
+        Args:
+            lines: Maximum number of lines to return
+            pattern: Regex a line must match
+            ignore_case: Match pattern case-insensitively
+            stream: Only lines from "stdout" or "stderr"
+
+        Returns:
+            list[str]: Formatted lines, oldest first
+
+        Raises:
+            re.error: If pattern is not a valid regex
+        """
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0) if pattern else None
+
+        selected: list[str] = []
+        for timestamp, stream_name, text in reversed(self.lines):
+            if stream and stream_name != stream:
+                continue
+            if regex and not regex.search(text):
+                continue
+            clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+            selected.append(f"{clock} [{stream_name}] {text}")
+            if len(selected) >= lines:
+                break
+
+        selected.reverse()
+        return selected
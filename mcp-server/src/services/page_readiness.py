@@ -0,0 +1,326 @@
+"""Condition-based readiness waits for browser automation.
+
+This module replaces fixed sleeps with waits for concrete page signals:
+- Network idle
+- Specific A12 selectors
+- Theme selection reflected in the header
+- The first of several candidate selectors to match (one in-page probe)
+- DOM quiet (no pending React renders, no running animations)
+- Web fonts loaded (document.fonts.ready)
+
+Every wait is bounded by a per-step upper limit and records how long it
+actually waited, so slow steps show up in the tool output.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from playwright.async_api import (
+    Page,
+    TimeoutError as PlaywrightTimeoutError
+)
+
+from config.constants import (
+    READINESS_TIMEOUTS,
+    DOM_QUIET_PERIOD,
+)
+from services.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# Resolves once no DOM mutation happened for quietMs and no finite animation
+# is running, or false once timeoutMs has elapsed.
+_DOM_STABLE_SCRIPT = """
+({ quietMs, timeoutMs }) => new Promise((resolve) => {
+    const start = performance.now();
+    let lastMutation = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    observer.observe(document.documentElement, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    const isAnimating = () => typeof document.getAnimations === "function" &&
+        document.getAnimations().some((a) =>
+            a.playState === "running" &&
+            a.effect && a.effect.getComputedTiming().iterations !== Infinity);
+    const check = () => {
+        const now = performance.now();
+        if (now - lastMutation >= quietMs && !isAnimating()) {
+            observer.disconnect();
+            resolve(true);
+        } else if (now - start >= timeoutMs) {
+            observer.disconnect();
+            resolve(false);
+        } else {
+            requestAnimationFrame(check);
+        }
+    };
+    requestAnimationFrame(check);
+})
+"""
+
+# True once a header trigger shows the given theme name (the ThemeChooser
+# renders the active theme in upper case, separators as spaces).
+_THEME_APPLIED_SCRIPT = """
+(themeName) => {
+    const normalize = (s) => (s || "").toLowerCase().replace(/[-_\\s]+/g, " ").trim();
+    const wanted = normalize(themeName);
+    // The client's theme hook reports the active theme directly
+    const hook = window.__A12_THEME_HOOK__;
+    if (hook) {
+        return normalize(hook.getTheme()) === wanted;
+    }
+    return Array.from(document.querySelectorAll("button.header-trigger")).some((button) => {
+        const titles = Array.from(button.querySelectorAll("[title]")).map((el) => el.title);
+        return [button.textContent, button.title, ...titles].some((t) => normalize(t).includes(wanted));
+    });
+}
+"""
+
+
+# {index, nth} of the first candidate ({css, text?}) with a visible match, or
+# null; nth is the element's position in document.querySelectorAll(css).
+# text is a list of lower-case words, one of which the element's text (or
+# aria-label/value) must contain.
+_FIRST_CANDIDATE_SCRIPT = """
+(candidates) => {
+    const visible = (el) => {
+        if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility !== "hidden" && style.display !== "none";
+    };
+    const label = (el) => [el.textContent, el.getAttribute("aria-label"), el.value]
+        .filter(Boolean).join(" ").trim().toLowerCase();
+    for (let i = 0; i < candidates.length; i++) {
+        const { css, text } = candidates[i];
+        let elements;
+        try {
+            elements = document.querySelectorAll(css);
+        } catch (e) {
+            continue;
+        }
+        for (let nth = 0; nth < elements.length; nth++) {
+            const el = elements[nth];
+            if (visible(el) && (!text || text.some((word) => label(el).includes(word)))) {
+                return { index: i, nth };
+            }
+        }
+    }
+    return null;
+}
+"""
+
+
+class PageReadiness:
+    """Waits for concrete page signals and records how long each wait took."""
+
+    def __init__(self, page: Page):
+        """Initialize readiness tracking for a page.
+
+        Args:
+            page: Playwright page to observe
+        """
+        self.page = page
+        self.timings: list[dict] = []
+
+    def _timeout(self, step: str, timeout: Optional[int]) -> int:
+        """Resolve the upper bound for a step in milliseconds."""
+        if timeout is not None:
+            return timeout
+        return READINESS_TIMEOUTS.get(step, READINESS_TIMEOUTS["default"])
+
+    def _record(self, step: str, signal: str, started: float, timeout: int, satisfied: bool) -> bool:
+        """Record a finished wait and return whether its signal was seen."""
+        waited_ms = round((time.perf_counter() - started) * 1000, 1)
+        self.timings.append({
+            "step": step,
+            "signal": signal,
+            "waited_ms": waited_ms,
+            "timeout_ms": timeout,
+            "satisfied": satisfied,
+        })
+
+        if satisfied:
+            logger.debug(f"[{step}] {signal} ready after {waited_ms}ms")
+        else:
+            logger.warning(f"[{step}] {signal} not ready after {waited_ms}ms (limit {timeout}ms)")
+
+        return satisfied
+
+    @traced()
+    async def wait_for_selector(
+        self,
+        step: str,
+        selector: str,
+        state: str = "visible",
+        timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until a selector reaches the given state.
+
+        Args:
+            step: Workflow step the wait belongs to
+            selector: Playwright selector to wait for
+            state: Element state ("attached", "visible", "hidden", "detached")
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            bool: True if the selector reached the state, False on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=limit)
+            return self._record(step, f"selector {selector} {state}", started, limit, True)
+        except PlaywrightTimeoutError:
+            return self._record(step, f"selector {selector} {state}", started, limit, False)
+
+    @traced()
+    async def wait_for_network_idle(self, step: str, timeout: Optional[int] = None) -> bool:
+        """Wait until there are no network connections for at least 500 ms.
+
+        Args:
+            step: Workflow step the wait belongs to
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            bool: True if the network went idle, False on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=limit)
+            return self._record(step, "network idle", started, limit, True)
+        except PlaywrightTimeoutError:
+            return self._record(step, "network idle", started, limit, False)
+
+    @traced()
+    async def wait_for_dom_stable(
+        self,
+        step: str,
+        quiet_ms: int = DOM_QUIET_PERIOD,
+        timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until the DOM stops changing and no animation is running.
+
+        Args:
+            step: Workflow step the wait belongs to
+            quiet_ms: Mutation-free period that counts as stable
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            bool: True if the DOM settled, False on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            stable = await self.page.evaluate(
+                _DOM_STABLE_SCRIPT,
+                {"quietMs": quiet_ms, "timeoutMs": limit}
+            )
+        except Exception as e:
+            # Navigation destroyed the execution context; the new page is not settled yet
+            logger.debug(f"[{step}] DOM stability check interrupted: {e}")
+            stable = False
+
+        return self._record(step, "DOM stable", started, limit, bool(stable))
+
+    @traced()
+    async def wait_for_fonts(self, step: str, timeout: Optional[int] = None) -> bool:
+        """Wait until every web font the page uses has loaded.
+
+        Args:
+            step: Workflow step the wait belongs to
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            bool: True if the fonts are loaded, False on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            await self.page.wait_for_function(
+                "() => document.fonts.ready.then(() => document.fonts.status === 'loaded')",
+                timeout=limit
+            )
+            return self._record(step, "fonts loaded", started, limit, True)
+        except PlaywrightTimeoutError:
+            return self._record(step, "fonts loaded", started, limit, False)
+
+    @traced()
+    async def wait_for_theme_applied(
+        self,
+        step: str,
+        theme_name: str,
+        timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until the theme is active and the page re-rendered.
+
+        The active theme is read from the client's theme hook, or from the
+        header's theme selector on pages without the hook.
+
+        Args:
+            step: Workflow step the wait belongs to
+            theme_name: Theme (customer) name to look for
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            bool: True if the theme is active and rendered, False on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            await self.page.wait_for_function(_THEME_APPLIED_SCRIPT, arg=theme_name, timeout=limit)
+            self._record(step, f"theme {theme_name} active", started, limit, True)
+        except PlaywrightTimeoutError:
+            return self._record(step, f"theme {theme_name} active", started, limit, False)
+
+        return await self.wait_for_dom_stable(step)
+
+    @traced()
+    async def wait_for_any(
+        self,
+        step: str,
+        name: str,
+        candidates: list[dict],
+        timeout: Optional[int] = None
+    ) -> Optional[dict]:
+        """Wait until one of several candidate selectors matches a visible element.
+
+        All candidates are checked by one in-page script on every poll, in
+        order, so the earliest candidate that matches wins.
+
+        Args:
+            step: Workflow step the wait belongs to
+            name: Name of the element (for the recorded signal)
+            candidates: {css, text?} strategies in order of preference
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            dict: index of the matching candidate and nth, the position of the
+                matching element among all elements of its CSS selector; None
+                on timeout
+        """
+        limit = self._timeout(step, timeout)
+        started = time.perf_counter()
+
+        try:
+            handle = await self.page.wait_for_function(_FIRST_CANDIDATE_SCRIPT, arg=candidates, timeout=limit)
+            result = await handle.json_value()
+        except PlaywrightTimeoutError:
+            self._record(step, f"{name} visible", started, limit, False)
+            return None
+
+        self._record(step, f"{name} visible", started, limit, True)
+        return result
+
+    def summary(self) -> dict[str, float]:
+        """Total time waited per step in milliseconds."""
+        totals: dict[str, float] = {}
+        for timing in self.timings:
+            totals[timing["step"]] = round(totals.get(timing["step"], 0.0) + timing["waited_ms"], 1)
+        return totals
@@ -0,0 +1,265 @@
+"""Dominant-color extraction from TARGET screenshots.
+
+This module seeds a new theme's colors from the target design:
+- Downsampling TARGET images and clustering their pixels (weighted k-means)
+- Ranking dominant colors by area coverage
+- Caching results per target file hash
+- Proposing values for colors.primaryColor, colors.background.* and
+  colors.interaction.* from the palette
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    PALETTE_CACHE_DIR,
+    PALETTE_SAMPLE_EDGE,
+    PALETTE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Colors are bucketed to 5 bits per channel before clustering, which keeps
+# the k-means input at a few hundred distinct weighted points.
+_QUANT_SHIFT = 3
+_KMEANS_ITERATIONS = 15
+
+
+def _to_hex(rgb) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*(int(round(c)) for c in rgb))
+
+
+def _luminance(rgb: np.ndarray) -> np.ndarray:
+    """Approximate perceived brightness (0-255) of RGB rows."""
+    return rgb @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def _chroma(rgb: np.ndarray) -> np.ndarray:
+    """Colorfulness (0-255) of RGB rows: max channel minus min channel."""
+    return rgb.max(axis=-1) - rgb.min(axis=-1)
+
+
+def sample_pixels(path: Path, max_edge: int = PALETTE_SAMPLE_EDGE) -> np.ndarray:
+    """Load a downsampled copy of an image as an (N, 3) array of RGB pixels.
+
+    Args:
+        path: Image file to sample
+        max_edge: Longest edge of the downsampled copy
+
+    Returns:
+        np.ndarray: Pixel rows with values 0-255
+    """
+    with Image.open(path) as img:
+        img = img.convert("RGB")
+        img.thumbnail((max_edge, max_edge), Image.Resampling.BOX)
+        return np.asarray(img, dtype=np.float64).reshape(-1, 3)
+
+
+def kmeans_palette(pixels: np.ndarray, k: int = PALETTE_SIZE) -> list[dict]:
+    """Cluster pixels into at most k dominant colors.
+
+    Distinct quantized colors are clustered with their pixel counts as
+    weights. Initial centers are the most frequent buckets, skipping ones
+    too close to an already chosen center, so results are deterministic.
+
+    Args:
+        pixels: (N, 3) array of RGB values
+        k: Maximum number of colors
+
+    Returns:
+        list[dict]: Colors sorted by coverage, each with hex, rgb and coverage
+    """
+    if len(pixels) == 0:
+        return []
+
+    buckets = pixels.astype(np.int64) >> _QUANT_SHIFT
+    keys = (buckets[:, 0] << 10) | (buckets[:, 1] << 5) | buckets[:, 2]
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    # Mean color of each bucket, weighted by how many pixels fell into it
+    points = np.zeros((len(unique_keys), 3))
+    np.add.at(points, inverse, pixels)
+    points /= counts[:, None]
+    weights = counts.astype(np.float64)
+
+    # Deterministic init: most frequent buckets that are visibly distinct
+    centers = []
+    for idx in np.argsort(-weights):
+        if all(np.linalg.norm(points[idx] - c) > 24 for c in centers):
+            centers.append(points[idx])
+        if len(centers) == k:
+            break
+    centers = np.array(centers)
+
+    for _ in range(_KMEANS_ITERATIONS):
+        distances = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+
+        cluster_weights = np.bincount(labels, weights=weights, minlength=len(centers))
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, points * weights[:, None])
+
+        keep = cluster_weights > 0
+        new_centers = sums[keep] / cluster_weights[keep][:, None]
+        if new_centers.shape == centers.shape and np.allclose(new_centers, centers, atol=0.5):
+            break
+        centers = new_centers
+
+    distances = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    labels = distances.argmin(axis=1)
+    coverage = np.bincount(labels, weights=weights, minlength=len(centers)) / weights.sum()
+
+    palette = [
+        {
+            "hex": _to_hex(center),
+            "rgb": [int(round(c)) for c in center],
+            "coverage": round(float(share), 4),
+        }
+        for center, share in zip(centers, coverage)
+        if share > 0
+    ]
+    palette.sort(key=lambda color: color["coverage"], reverse=True)
+    return palette
+
+
+def propose_theme_colors(palette: list[dict]) -> dict[str, str]:
+    """Map a palette onto theme color paths.
+
+    Heuristics: the most common light color is the page background, the
+    most common colorful color is the brand/primary color, the darkest
+    neutral color is the text color.
+
+    Args:
+        palette: Colors sorted by coverage (see kmeans_palette)
+
+    Returns:
+        dict[str, str]: Dotted theme paths (e.g. "colors.primaryColor") to hex values
+    """
+    if not palette:
+        return {}
+
+    rgb = np.array([color["rgb"] for color in palette], dtype=np.float64)
+    luminance = _luminance(rgb)
+    chroma = _chroma(rgb)
+    hexes = [color["hex"] for color in palette]
+
+    light = [i for i in range(len(palette)) if luminance[i] >= 200]
+    colorful = [i for i in range(len(palette)) if chroma[i] >= 60]
+    # Prefer neutral dark colors for text, so a dark brand color is not picked
+    dark = sorted(range(len(palette)), key=lambda i: (chroma[i] >= 60, luminance[i]))
+
+    proposal: dict[str, str] = {}
+
+    if light:
+        proposal["colors.background.primaryBackground"] = hexes[light[0]]
+        secondary = light[1] if len(light) > 1 else light[0]
+        proposal["colors.background.secondaryBackground"] = hexes[secondary]
+        proposal["colors.background.nonInteractiveBackground"] = hexes[secondary]
+
+    if dark and luminance[dark[0]] < 100:
+        proposal["colors.text.color"] = hexes[dark[0]]
+        proposal["colors.text.headlineColor"] = hexes[dark[0]]
+
+    if colorful:
+        primary = hexes[colorful[0]]
+        secondary = hexes[colorful[1]] if len(colorful) > 1 else primary
+        proposal["colors.primaryColor"] = primary
+        proposal["colors.secondaryColor"] = secondary
+        proposal["colors.interaction.primaryInteractionColor"] = primary
+        proposal["colors.interaction.secondaryInteractionColor"] = secondary
+        proposal["colors.interaction.hover.color"] = primary
+        proposal["colors.interaction.focus.color"] = primary
+        proposal["colors.interaction.selected.color"] = secondary
+
+    return proposal
+
+
+class PaletteExtractor:
+    """Extracts and caches dominant colors of TARGET screenshots."""
+
+    @staticmethod
+    def file_hash(path: Path) -> str:
+        """SHA-256 of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def extract(
+        path: Path,
+        k: int = PALETTE_SIZE,
+        cache_dir: Path = PALETTE_CACHE_DIR
+    ) -> list[dict]:
+        """Return the dominant colors of one image, cached by content hash.
+
+        Args:
+            path: Image file
+            k: Maximum number of colors
+            cache_dir: Directory for cached palettes
+
+        Returns:
+            list[dict]: Colors sorted by coverage
+        """
+        cache_path = cache_dir / f"{PaletteExtractor.file_hash(path)}-k{k}-e{PALETTE_SAMPLE_EDGE}.json"
+
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable palette cache {cache_path}: {e}")
+
+        palette = kmeans_palette(sample_pixels(path), k)
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(palette, f)
+        except Exception as e:
+            logger.warning(f"Could not cache palette for {path}: {e}")
+
+        return palette
+
+    @staticmethod
+    def extract_customer_palette(
+        customer_name: str,
+        k: int = PALETTE_SIZE,
+        cache_dir: Path = PALETTE_CACHE_DIR
+    ) -> Optional[list[dict]]:
+        """Merge the palettes of all TARGET screenshots of a customer.
+
+        The per-target palettes are re-clustered weighted by coverage, so
+        each target contributes equally regardless of its resolution.
+
+        Args:
+            customer_name: Name of the customer/theme
+            k: Maximum number of colors
+            cache_dir: Directory for cached palettes
+
+        Returns:
+            list[dict]: Colors sorted by coverage, or None if there are no targets
+        """
+        targets = sorted((SCREENSHOTS_DIR / customer_name).glob("TARGET_*.png"))
+        if not targets:
+            logger.info(f"No TARGET screenshots for {customer_name}, skipping palette extraction")
+            return None
+
+        palettes = [PaletteExtractor.extract(path, k, cache_dir) for path in targets]
+
+        # Re-cluster the per-target palettes, weighted by coverage
+        rgb = np.array([color["rgb"] for palette in palettes for color in palette], dtype=np.float64)
+        weights = np.array([color["coverage"] for palette in palettes for color in palette])
+        pixels = np.repeat(rgb, np.maximum(1, np.round(weights * 1000)).astype(int), axis=0)
+
+        merged = kmeans_palette(pixels, k)
+        logger.info(f"Extracted {len(merged)} dominant colors from {len(targets)} targets of {customer_name}")
+        return merged
@@ -0,0 +1,51 @@
+"""Deterministic person data for capture rounds.
+
+The persons come from a seeded Faker instance, in the document format of
+import/data/request/PersonRequest.json, so deterministic rounds fill the
+person form with the same data every time.
+"""
+
+from datetime import date
+
+from faker import Faker
+
+from config.constants import (
+    FIXTURE_SEED,
+    FIXTURE_REFERENCE_DATE,
+)
+
+
+def fixture_persons(count: int, seed: int = FIXTURE_SEED) -> list[dict]:
+    """Deterministic Person documents.
+
+    Args:
+        count: Number of persons
+        seed: Faker seed
+
+    Returns:
+        list[dict]: Person documents (same input, same persons)
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    # Ages relative to a fixed day, so the persons do not change from day to day
+    reference = date.fromisoformat(FIXTURE_REFERENCE_DATE)
+    oldest, youngest = reference.replace(year=reference.year - 80), reference.replace(year=reference.year - 18)
+    persons = []
+    for _ in range(count):
+        first_name, last_name = fake.first_name(), fake.last_name()
+        persons.append({
+            "Person": {
+                "PersonalData": {
+                    "FirstName": first_name,
+                    "LastName": last_name,
+                    "EmailAddress": f"{first_name}.{last_name}@example.com".lower(),
+                    "DateOfBirth": fake.date_between_dates(date_start=oldest, date_end=youngest).isoformat(),
+                    "Nationality": fake.country(),
+                    "PlaceOfBirth": fake.city(),
+                },
+                "Phones": [
+                    {"PhoneNumber": fake.numerify("######"), "Type": "WORK"}
+                ],
+            }
+        })
+    return persons
@@ -3,13 +3,20 @@
 This module handles starting, stopping, and health checking of:
 - Backend services (Gradle + Docker Compose)
 - Frontend development server (npm)
+
+Readiness is event driven: the piped stdout/stderr of each service is
+drained by a LogPump, which also watches for the "started" log line and
+triggers an immediate health probe. Until then, probes back off exponentially on one shared HTTP
+session. Startup time per phase is recorded for each service.
 """
 
 import asyncio
 import atexit
 import logging
+import os
 import signal
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 import aiohttp
@@ -22,9 +29,21 @@ from config.constants import (
     BACKEND_STARTUP_TIMEOUT,
     FRONTEND_STARTUP_TIMEOUT,
     HEALTH_CHECK_INTERVAL,
+    HEALTH_CHECK_INITIAL_INTERVAL,
     GRADLE_BACKEND_CMD,
     NPM_START_CMD,
+    NPM_BUILD_CMD,
+    FRONTEND_MODE,
+    FRONTEND_BUILD_TIMEOUT,
+    RUNTIME_THEMES_PATH,
+    BACKEND_READY_PATTERN,
+    FRONTEND_READY_PATTERN,
+    TRACE_DIR,
+    TRACE_FORMAT,
 )
+from services.log_pump import LogPump
+from services.static_frontend import StaticFrontendServer
+from services.tracing import start_trace, traced
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +56,13 @@ class ProcessManager:
     _frontend_process: Optional[asyncio.subprocess.Process] = None
     _is_shutting_down: bool = False
 
+    # Shared HTTP session for health probes (keeps connections alive)
+    _http_session: Optional[aiohttp.ClientSession] = None
+
+    # Output pumps and startup timings per service ("backend", "frontend")
+    _log_pumps: dict[str, LogPump] = {}
+    _startup_metrics: dict[str, dict] = {}
+
     @classmethod
     def _setup_signal_handlers(cls):
         """Set up signal handlers for graceful shutdown."""
@@ -54,31 +80,45 @@ class ProcessManager:
         atexit.register(lambda: asyncio.run(cls.cleanup_all()))
 
     @classmethod
-    async def start_backend(cls) -> bool:
+    async def start_backend(
+        cls,
+        command: list[str] = GRADLE_BACKEND_CMD,
+        mode: str = "cold_start"
+    ) -> bool:
         """Start backend services using Gradle.
 
+        Args:
+            command: Start command; defaults to the Gradle compose task. The
+                environment manager passes `docker start ...` for warm standbys.
+            mode: Startup mode recorded in the startup metrics
+
         Returns:
             bool: True if started successfully, False otherwise
         """
-        if cls._backend_process is not None:
+        if cls._backend_process is not None and cls._backend_process.returncode is None:
             logger.info("Backend process already running")
             return True
 
         logger.info("Starting backend services...")
+        started_at = time.monotonic()
 
         try:
             # Start the gradle process
             cls._backend_process = await asyncio.create_subprocess_exec(
-                *GRADLE_BACKEND_CMD,
+                *command,
                 cwd=str(PROJECT_ROOT),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
 
             logger.info(f"Backend process started with PID {cls._backend_process.pid}")
+            log_ready = cls._watch_output("backend", cls._backend_process, BACKEND_READY_PATTERN, started_at)
+            cls._startup_metrics["backend"]["mode"] = mode
 
             # Wait for backend to be healthy
-            if await cls._wait_for_health(BACKEND_URL, BACKEND_STARTUP_TIMEOUT):
+            if await cls._wait_for_ready(
+                "backend", BACKEND_URL, BACKEND_STARTUP_TIMEOUT, cls._backend_process, log_ready, started_at
+            ):
                 logger.info("Backend services are healthy")
                 return True
             else:
@@ -92,17 +132,29 @@ class ProcessManager:
             return False
 
     @classmethod
-    async def start_frontend(cls) -> bool:
+    async def start_frontend(cls, mode: str = "cold_start") -> bool:
         """Start frontend development server using npm.
 
+        With FRONTEND_MODE=static the production bundle is served from this
+        process instead (see _start_static_frontend).
+
+        Args:
+            mode: Startup mode recorded in the startup metrics
+
         Returns:
             bool: True if started successfully, False otherwise
         """
-        if cls._frontend_process is not None:
+        if FRONTEND_MODE == "static":
+            return await cls._start_static_frontend(mode)
+
+        if cls._frontend_process is not None and cls._frontend_process.returncode is None:
             logger.info("Frontend process already running")
             return True
 
         logger.info("Starting frontend development server...")
+        started_at = time.monotonic()
+        # The dev server serves the current sources; fingerprint them anew
+        StaticFrontendServer.forget_build_id()
 
         try:
             # Start npm in the client directory
@@ -114,9 +166,13 @@ class ProcessManager:
             )
 
             logger.info(f"Frontend process started with PID {cls._frontend_process.pid}")
+            log_ready = cls._watch_output("frontend", cls._frontend_process, FRONTEND_READY_PATTERN, started_at)
+            cls._startup_metrics["frontend"]["mode"] = mode
 
             # Wait for frontend to be healthy
-            if await cls._wait_for_health(FRONTEND_URL, FRONTEND_STARTUP_TIMEOUT):
+            if await cls._wait_for_ready(
+                "frontend", FRONTEND_URL, FRONTEND_STARTUP_TIMEOUT, cls._frontend_process, log_ready, started_at
+            ):
                 logger.info("Frontend development server is healthy")
                 return True
             else:
@@ -129,6 +185,73 @@ class ProcessManager:
             await cls.stop_frontend()
             return False
 
+    @classmethod
+    async def _start_static_frontend(cls, mode: str) -> bool:
+        """Build the client bundle if its sources changed, then serve it statically.
+
+        Args:
+            mode: Startup mode recorded in the startup metrics
+
+        Returns:
+            bool: True if the static frontend is serving, False otherwise
+        """
+        if StaticFrontendServer.is_running():
+            logger.info("Static frontend already running")
+            return True
+
+        started_at = time.monotonic()
+
+        try:
+            if await asyncio.to_thread(StaticFrontendServer.is_bundle_fresh):
+                logger.info("Client bundle is up to date, skipping build")
+                metrics = cls._startup_metrics["frontend"] = {
+                    "spawn_s": None,
+                    "log_ready_s": None,
+                    "http_ready_s": None,
+                    "probes": 0,
+                    "ready": False,
+                }
+            else:
+                logger.info("Building client bundle...")
+                cls._frontend_process = await asyncio.create_subprocess_exec(
+                    *NPM_BUILD_CMD,
+                    cwd=str(CLIENT_DIR),
+                    env={**os.environ, "RUNTIME_THEMES_URL": RUNTIME_THEMES_PATH},
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                cls._watch_output("frontend", cls._frontend_process, FRONTEND_READY_PATTERN, started_at)
+                metrics = cls._startup_metrics["frontend"]
+
+                await asyncio.wait_for(cls._frontend_process.wait(), timeout=FRONTEND_BUILD_TIMEOUT)
+                if cls._frontend_process.returncode != 0:
+                    logger.error(f"Client bundle build failed with code {cls._frontend_process.returncode}")
+                    await cls.stop_frontend()
+                    return False
+
+                await asyncio.to_thread(StaticFrontendServer.mark_bundle_built)
+                cls._frontend_process = None
+
+            metrics["mode"] = mode
+            metrics["build_s"] = round(time.monotonic() - started_at, 3)
+
+            await StaticFrontendServer.start()
+            metrics["probes"] += 1
+            if not await cls._check_health(FRONTEND_URL):
+                logger.error("Static frontend is not responding")
+                await cls.stop_frontend()
+                return False
+
+            metrics["http_ready_s"] = round(time.monotonic() - started_at, 3)
+            metrics["ready"] = True
+            logger.info(f"frontend startup timings: {metrics}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error starting static frontend: {e}", exc_info=True)
+            await cls.stop_frontend()
+            return False
+
     @classmethod
     async def stop_backend(cls):
         """Stop backend services gracefully."""
@@ -139,6 +262,10 @@ class ProcessManager:
         logger.info("Stopping backend services...")
 
         try:
+            if cls._backend_process.returncode is not None:
+                logger.info("Backend start command already exited")
+                return
+
             # Try graceful termination first
             cls._backend_process.terminate()
 
@@ -158,10 +285,13 @@ class ProcessManager:
 
         finally:
             cls._backend_process = None
+            cls._stop_output_watchers("backend")
 
     @classmethod
     async def stop_frontend(cls):
-        """Stop frontend development server."""
+        """Stop frontend development server (or the static frontend)."""
+        await StaticFrontendServer.stop()
+
         if cls._frontend_process is None:
             logger.info("No frontend process to stop")
             return
@@ -169,6 +299,10 @@ class ProcessManager:
         logger.info("Stopping frontend development server...")
 
         try:
+            if cls._frontend_process.returncode is not None:
+                logger.info("Frontend process already exited")
+                return
+
             # Try graceful termination first
             cls._frontend_process.terminate()
 
@@ -188,6 +322,7 @@ class ProcessManager:
 
         finally:
             cls._frontend_process = None
+            cls._stop_output_watchers("frontend")
 
     @classmethod
     async def cleanup_all(cls):
@@ -200,6 +335,7 @@ class ProcessManager:
 
         await cls.stop_frontend()
         await cls.stop_backend()
+        await cls.close_http_session()
 
         logger.info("All processes cleaned up")
 
@@ -237,6 +373,110 @@ class ProcessManager:
         return backend_healthy and frontend_healthy
 
     @classmethod
+    def get_startup_metrics(cls) -> dict[str, dict]:
+        """Return the startup timings recorded for each service.
+
+        Returns:
+            dict[str, dict]: Per service: mode, spawn_s, log_ready_s (None if
+                no ready line was seen), http_ready_s, probes and ready
+        """
+        return {service: dict(metrics) for service, metrics in cls._startup_metrics.items()}
+
+    @classmethod
+    def _get_http_session(cls) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if cls._http_session is None or cls._http_session.closed:
+            cls._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=30)
+            )
+        return cls._http_session
+
+    @classmethod
+    async def close_http_session(cls):
+        """Close the shared HTTP session."""
+        if cls._http_session is not None:
+            try:
+                await cls._http_session.close()
+            except Exception as e:
+                logger.debug(f"Error closing HTTP session: {e}")
+            cls._http_session = None
+
+    @classmethod
+    def record_reattach(cls, service: str, probe_s: float):
+        """Record that a service was found already running and reused.
+
+        Args:
+            service: Service name ("backend" or "frontend")
+            probe_s: Seconds the health probe took
+        """
+        cls._startup_metrics[service] = {
+            "mode": "reattached",
+            "spawn_s": None,
+            "log_ready_s": None,
+            "http_ready_s": round(probe_s, 3),
+            "probes": 1,
+            "ready": True,
+        }
+
+    @classmethod
+    def get_log_pump(cls, service: str) -> Optional[LogPump]:
+        """Return the log pump of a service started by this server, if any.
+
+        The pump keeps its buffered lines after the service has stopped.
+
+        Args:
+            service: Service name ("backend" or "frontend")
+
+        Returns:
+            LogPump: The service's pump, or None
+        """
+        return cls._log_pumps.get(service)
+
+    @classmethod
+    def _watch_output(
+        cls,
+        service: str,
+        process: asyncio.subprocess.Process,
+        ready_pattern: str,
+        started_at: float
+    ) -> asyncio.Event:
+        """Drain a service's stdout and stderr and watch for its ready line.
+
+        Args:
+            service: Service name ("backend" or "frontend")
+            process: Process whose pipes are read
+            ready_pattern: Regex that marks the service as started
+            started_at: time.monotonic() when the start was requested
+
+        Returns:
+            asyncio.Event: Set as soon as a line matches ready_pattern
+        """
+        metrics = cls._startup_metrics[service] = {
+            "spawn_s": round(time.monotonic() - started_at, 3),
+            "log_ready_s": None,
+            "http_ready_s": None,
+            "probes": 0,
+            "ready": False,
+        }
+
+        def on_ready(line: str):
+            metrics["log_ready_s"] = round(time.monotonic() - started_at, 3)
+            logger.info(f"{service} reported ready after {metrics['log_ready_s']}s: {line}")
+
+        cls._stop_output_watchers(service)
+        pump = cls._log_pumps[service] = LogPump(service, ready_pattern, on_ready)
+        pump.attach(process)
+        return pump.ready
+
+    @classmethod
+    def _stop_output_watchers(cls, service: str):
+        """Stop draining a service's output (its buffered lines are kept)."""
+        pump = cls._log_pumps.get(service)
+        if pump:
+            pump.stop()
+
+    @classmethod
+    @traced("health_probe")
     async def _check_health(cls, url: str, timeout: float = 5.0) -> bool:
         """Check if a service is responding to HTTP requests.
 
@@ -248,49 +488,112 @@ class ProcessManager:
             bool: True if service responds (including 404), False on connection error
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    allow_redirects=True
-                ) as response:
-                    # Accept any response including 404 - we just want to know the server is running
-                    # 404 is normal for Spring Boot apps without a root endpoint
-                    return 200 <= response.status < 500
+            session = cls._get_http_session()
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=True
+            ) as response:
+                # Accept any response including 404 - we just want to know the server is running
+                # 404 is normal for Spring Boot apps without a root endpoint
+                return 200 <= response.status < 500
 
         except Exception as e:
             logger.debug(f"Health check failed for {url}: {e}")
             return False
 
     @classmethod
-    async def _wait_for_health(
+    async def _wait_for_ready(
+        cls,
+        service: str,
+        url: str,
+        timeout: float,
+        process: asyncio.subprocess.Process,
+        log_ready: asyncio.Event,
+        started_at: float
+    ) -> bool:
+        """Wait for a service to become healthy, tracing each health probe.
+
+        The trace is written to TRACE_DIR/<service>-startup.
+
+        Args:
+            service: Service name ("backend" or "frontend")
+            url: URL to check
+            timeout: Maximum time to wait in seconds, counted from started_at
+            process: Service process; giving up early if it exits
+            log_ready: Event set by the output watcher on the ready line
+            started_at: time.monotonic() when the start was requested
+
+        Returns:
+            bool: True if service became healthy, False on timeout or exit
+        """
+        with start_trace(f"{service}_startup", service=service) as trace:
+            ready = await cls._probe_until_ready(service, url, timeout, process, log_ready, started_at)
+        trace.export(TRACE_DIR / f"{service}-startup", TRACE_FORMAT)
+        return ready
+
+    @classmethod
+    async def _probe_until_ready(
         cls,
+        service: str,
         url: str,
         timeout: float,
-        check_interval: float = HEALTH_CHECK_INTERVAL
+        process: asyncio.subprocess.Process,
+        log_ready: asyncio.Event,
+        started_at: float
     ) -> bool:
-        """Wait for a service to become healthy.
+        """Probe a service until it is healthy.
+
+        Probes back off exponentially from HEALTH_CHECK_INITIAL_INTERVAL to
+        HEALTH_CHECK_INTERVAL. A matching log line cuts the current wait
+        short, and from then on probes run at the initial interval.
 
         Args:
+            service: Service name ("backend" or "frontend")
             url: URL to check
-            timeout: Maximum time to wait in seconds
-            check_interval: Time between checks in seconds
+            timeout: Maximum time to wait in seconds, counted from started_at
+            process: Service process; giving up early if it exits
+            log_ready: Event set by the output watcher on the ready line
+            started_at: time.monotonic() when the start was requested
 
         Returns:
-            bool: True if service became healthy, False if timeout
+            bool: True if service became healthy, False on timeout or exit
         """
         logger.info(f"Waiting for {url} to become healthy (timeout: {timeout}s)...")
 
-        elapsed = 0.0
-        while elapsed < timeout:
+        metrics = cls._startup_metrics[service]
+        deadline = started_at + timeout
+        interval = HEALTH_CHECK_INITIAL_INTERVAL
+
+        while True:
+            metrics["probes"] += 1
             if await cls._check_health(url):
+                metrics["http_ready_s"] = round(time.monotonic() - started_at, 3)
+                metrics["ready"] = True
+                logger.info(f"{service} startup timings: {metrics}")
                 return True
 
-            await asyncio.sleep(check_interval)
-            elapsed += check_interval
-            logger.debug(f"Still waiting for {url}... ({elapsed:.0f}s elapsed)")
+            # Start commands that detach (compose up -d, docker start) exit with 0
+            if process.returncode not in (None, 0):
+                logger.error(f"{service} process exited with code {process.returncode} before becoming healthy")
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            if log_ready.is_set():
+                await asyncio.sleep(min(HEALTH_CHECK_INITIAL_INTERVAL, remaining))
+            else:
+                try:
+                    await asyncio.wait_for(log_ready.wait(), timeout=min(interval, remaining))
+                except asyncio.TimeoutError:
+                    pass
+                interval = min(interval * 2, HEALTH_CHECK_INTERVAL)
+
+            logger.debug(f"Still waiting for {url}... ({time.monotonic() - started_at:.0f}s elapsed)")
 
-        logger.error(f"Timeout waiting for {url} to become healthy")
+        logger.error(f"Timeout waiting for {url} to become healthy ({service} timings: {metrics})")
         return False
 
 
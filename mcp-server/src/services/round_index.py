@@ -0,0 +1,315 @@
+"""Per-customer manifest of screenshot rounds.
+
+This module replaces rescanning the screenshot directory for round numbers:
+- A JSON manifest (<customer>/rounds.json) with the next round number and
+  metadata per round: status, screenshots with their content hash, theme
+  revision, duration and trace file
+- Round numbers allocated under an exclusive file lock, so concurrent
+  callers (get_screenshots_batch, several server processes) never get the
+  same round
+- Atomic rewrites (temp file + rename), so readers never see a partial file
+- Rebuilding the manifest from the ROUND files when it is missing or corrupt,
+  and adding ROUND files written outside the index (so their numbers are
+  never handed out again); the directory is only scanned for them when its
+  mtime changed since this process last synced with it
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from config.constants import (
+    ROUND_REGEX,
+    ROUND_INDEX_FILENAME,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+MANIFEST_VERSION = 1
+
+
+def theme_revision(theme_path: Path) -> Optional[str]:
+    """Short content hash identifying the state of a theme file.
+
+    Args:
+        theme_path: Theme JSON file
+
+    Returns:
+        str: First 12 hex digits of the SHA-256, or None if the file is missing
+    """
+    try:
+        return hashlib.sha256(theme_path.read_bytes()).hexdigest()[:12]
+    except OSError:
+        return None
+
+
+class RoundIndex:
+    """Reads and updates the round manifest of a customer directory."""
+
+    # Directory mtime (ns) at which this process last knew the manifest to
+    # cover every ROUND file. It cannot live in the manifest itself: the
+    # manifest's atomic rewrite changes the directory's mtime.
+    _synced_mtimes: dict[Path, int] = {}
+
+    @staticmethod
+    def _dir_mtime(customer_dir: Path) -> int:
+        """Modification time of the directory in nanoseconds."""
+        return customer_dir.stat().st_mtime_ns
+
+    @staticmethod
+    def manifest_path(customer_dir: Path) -> Path:
+        """Path of the customer's round manifest."""
+        return customer_dir / ROUND_INDEX_FILENAME
+
+    @staticmethod
+    @contextmanager
+    def _locked(customer_dir: Path) -> Iterator[None]:
+        """Hold the customer's manifest lock (across threads and processes)."""
+        customer_dir.mkdir(parents=True, exist_ok=True)
+        with open(customer_dir / f".{ROUND_INDEX_FILENAME}.lock", 'a+b') as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    @staticmethod
+    def _scan(customer_dir: Path) -> dict:
+        """Build a manifest from the ROUND files in the directory."""
+        pattern = re.compile(ROUND_REGEX)
+        rounds: dict[str, dict] = {}
+
+        for path in sorted(customer_dir.glob("ROUND*.png")):
+            match = pattern.match(path.name)
+            if not match:
+                continue
+            round_number = int(match.group(1))
+            entry = rounds.setdefault(str(round_number), {
+                "round": round_number,
+                "status": "complete",
+                "recovered": True,
+                "screenshots": [],
+            })
+            entry["screenshots"].append({"name": path.name})
+
+        next_round = max((int(key) for key in rounds), default=0) + 1
+        return {"version": MANIFEST_VERSION, "next_round": next_round, "rounds": rounds}
+
+    @classmethod
+    def _read(cls, customer_dir: Path) -> Optional[dict]:
+        """Read the manifest; None if it is missing or corrupt."""
+        path = cls.manifest_path(customer_dir)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and isinstance(manifest.get("next_round"), int):
+                return manifest
+            logger.warning(f"Round manifest {path} is malformed, rebuilding")
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Round manifest {path} is unreadable ({e}), rebuilding")
+        return None
+
+    @classmethod
+    def _reconcile(cls, customer_dir: Path, manifest: dict) -> bool:
+        """Add ROUND files written outside the index (e.g. copied in by hand).
+
+        Rounds found on disk but missing from the manifest are recorded as
+        recovered, and next_round is moved past the highest one, so their
+        files are never handed out (and overwritten) again. The directory is
+        not scanned while its mtime is the one this process last synced at.
+
+        Returns:
+            bool: True if the manifest changed (the caller saves it)
+        """
+        mtime = cls._dir_mtime(customer_dir)
+        if cls._synced_mtimes.get(customer_dir) == mtime:
+            return False
+
+        scanned = cls._scan(customer_dir)
+        missing = {key: entry for key, entry in scanned["rounds"].items() if key not in manifest["rounds"]}
+        manifest["rounds"].update(missing)
+        next_round = max(manifest["next_round"], scanned["next_round"])
+        changed = bool(missing) or next_round != manifest["next_round"]
+        manifest["next_round"] = next_round
+        if not changed:
+            cls._synced_mtimes[customer_dir] = mtime
+        return changed
+
+    @classmethod
+    def _load(cls, customer_dir: Path) -> dict:
+        """Read the manifest, rebuilding or completing it from the directory.
+
+        Callers must hold the lock; a rebuilt or completed manifest is saved
+        right away.
+        """
+        mtime = cls._dir_mtime(customer_dir)
+        manifest = cls._read(customer_dir)
+        if manifest is None:
+            manifest = cls._scan(customer_dir)
+        elif not cls._reconcile(customer_dir, manifest):
+            return manifest
+        cls._save(customer_dir, manifest, synced_mtime=mtime)
+        return manifest
+
+    @classmethod
+    def _snapshot(cls, customer_dir: Path) -> dict:
+        """Current manifest for readers (takes the lock only to rebuild or complete it)."""
+        manifest = cls._read(customer_dir)
+        if manifest is None or cls._reconcile(customer_dir, manifest):
+            with cls._locked(customer_dir):
+                manifest = cls._load(customer_dir)
+        return manifest
+
+    @classmethod
+    def _save(cls, customer_dir: Path, manifest: dict, synced_mtime: Optional[int] = None):
+        """Write the manifest atomically.
+
+        If the directory was in sync (at synced_mtime, or the mtime this
+        process last synced at) right before the write, it still is after
+        it; the new mtime is remembered, so the write does not cause a scan.
+        """
+        if synced_mtime is None:
+            synced_mtime = cls._synced_mtimes.get(customer_dir)
+        in_sync = cls._dir_mtime(customer_dir) == synced_mtime
+
+        path = cls.manifest_path(customer_dir)
+        fd, tmp_name = tempfile.mkstemp(dir=customer_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        if in_sync:
+            cls._synced_mtimes[customer_dir] = cls._dir_mtime(customer_dir)
+
+    @classmethod
+    def next_round(cls, customer_dir: Path) -> int:
+        """Round number the next capture will get (nothing is reserved).
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+
+        Returns:
+            int: Next round number (1 if no rounds exist)
+        """
+        if not customer_dir.exists():
+            return 1
+        return cls._snapshot(customer_dir)["next_round"]
+
+    @classmethod
+    def allocate(cls, customer_dir: Path, **metadata) -> int:
+        """Reserve the next round number and record the round as capturing.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+            **metadata: Extra fields stored with the round (theme revision, ...)
+
+        Returns:
+            int: The reserved round number
+        """
+        with cls._locked(customer_dir):
+            manifest = cls._load(customer_dir)
+            round_number = manifest["next_round"]
+            manifest["next_round"] = round_number + 1
+            manifest["rounds"][str(round_number)] = {
+                "round": round_number,
+                "status": "capturing",
+                "started_at": time.time(),
+                "screenshots": [],
+                **metadata,
+            }
+            cls._save(customer_dir, manifest)
+
+        logger.info(f"Allocated round {round_number} for {customer_dir.name}")
+        return round_number
+
+    @classmethod
+    def finish(
+        cls,
+        customer_dir: Path,
+        round_number: int,
+        success: bool,
+        screenshots: list[dict],
+        **metadata
+    ):
+        """Record the outcome of an allocated round.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+            round_number: Round to update
+            success: Whether the capture succeeded
+            screenshots: Per screenshot: name and content hash
+            **metadata: Extra fields stored with the round (trace file, ...)
+        """
+        with cls._locked(customer_dir):
+            manifest = cls._load(customer_dir)
+            entry = manifest["rounds"].setdefault(str(round_number), {"round": round_number})
+            finished_at = time.time()
+            entry.update(metadata)
+            entry["status"] = "complete" if success else "failed"
+            entry["screenshots"] = screenshots
+            entry["finished_at"] = finished_at
+            if "started_at" in entry:
+                entry["duration_s"] = round(finished_at - entry["started_at"], 3)
+            manifest["next_round"] = max(manifest["next_round"], round_number + 1)
+            cls._save(customer_dir, manifest)
+
+    @classmethod
+    def list_rounds(cls, customer_dir: Path) -> list[dict]:
+        """Metadata of all rounds, oldest first.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+
+        Returns:
+            list[dict]: One entry per round
+        """
+        if not customer_dir.exists():
+            return []
+        rounds = cls._snapshot(customer_dir)["rounds"]
+        return [rounds[key] for key in sorted(rounds, key=int)]
+
+    @classmethod
+    def latest_complete(cls, customer_dir: Path) -> Optional[int]:
+        """Number of the most recent successfully captured round.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+
+        Returns:
+            int: Round number, or None if no round completed
+        """
+        complete = [entry["round"] for entry in cls.list_rounds(customer_dir) if entry.get("status") == "complete"]
+        return max(complete, default=None)
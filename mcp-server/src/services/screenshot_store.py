@@ -0,0 +1,390 @@
+"""Content-addressed storage for captured screenshots.
+
+This module keeps ROUND screenshots compact without changing their names:
+- Each capture is stored once under SCREENSHOTS_DIR/.store/objects, keyed
+  by the SHA-256 of its PNG bytes, so identical captures share one file
+- ROUNDXX_YY.png stays a regular file in the customer directory: a hard
+  link to its object (a plain copy where hard links are unavailable), so
+  it stays readable and committable without the store
+- Lossless WebP, AVIF and downscaled WebP previews are kept next to the
+  objects, written on capture (SCREENSHOT_VARIANTS) or on first request
+- Element boxes of named page regions (header, form, list) recorded on
+  capture are kept as a sidecar of the object
+- Objects no screenshot links to anymore can be garbage-collected
+- Screenshots saved before the store existed are only linked to it on
+  request (ingest_directory, see store_screenshots.py)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    SCREENSHOT_STORE_ENABLED,
+    SCREENSHOT_STORE_DIRNAME,
+    SCREENSHOT_VARIANTS,
+    SCREENSHOT_PREVIEW_EDGE,
+    SCREENSHOT_AVIF_QUALITY,
+)
+
+logger = logging.getLogger(__name__)
+
+# Variant name to (subdirectory, file suffix)
+VARIANTS = {
+    "webp": ("variants", ".webp"),
+    "avif": ("variants", ".avif"),
+    "preview": ("previews", ".webp"),
+}
+
+
+def _git_tracked(directory: Path) -> set[str]:
+    """Names of the files in a directory that git tracks (empty outside a repo)."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--", "."],
+            cwd=directory, capture_output=True, timeout=10, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return set()
+    return {Path(name).name for name in result.stdout.decode("utf-8").split("\0") if name and "/" not in name}
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write bytes to a temp file in the target directory, then swap it in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class ScreenshotStore:
+    """Stores screenshots by content hash and links the ROUND names to them."""
+
+    @staticmethod
+    def store_dir(screenshots_dir: Path = SCREENSHOTS_DIR) -> Path:
+        """Root of the content-addressed store."""
+        return screenshots_dir / SCREENSHOT_STORE_DIRNAME
+
+    @classmethod
+    def object_path(cls, digest: str, screenshots_dir: Path = SCREENSHOTS_DIR) -> Path:
+        """Path of the stored PNG for a content hash.
+
+        Args:
+            digest: SHA-256 hex digest of the PNG bytes
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            Path: Object path (may not exist yet)
+        """
+        return cls.store_dir(screenshots_dir) / "objects" / digest[:2] / f"{digest}.png"
+
+    @classmethod
+    def regions_path(cls, digest: str, screenshots_dir: Path = SCREENSHOTS_DIR) -> Path:
+        """Path of the region boxes sidecar for a content hash."""
+        return cls.object_path(digest, screenshots_dir).with_suffix(".regions.json")
+
+    @classmethod
+    def variant_object_path(cls, digest: str, variant: str, screenshots_dir: Path = SCREENSHOTS_DIR) -> Path:
+        """Path of a stored variant ("webp", "avif" or "preview") for a content hash."""
+        subdir, suffix = VARIANTS[variant]
+        return cls.store_dir(screenshots_dir) / subdir / digest[:2] / f"{digest}{suffix}"
+
+    @staticmethod
+    def _link(path: Path, target: Path):
+        """Make path a hard link to target, or a copy of it."""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(target, tmp_path)
+        except OSError:
+            shutil.copyfile(target, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def save(
+        cls,
+        path: Path,
+        data: bytes,
+        screenshots_dir: Path = SCREENSHOTS_DIR,
+        encode_variants: bool = True,
+        regions: Optional[dict[str, list[int]]] = None
+    ) -> Path:
+        """Store PNG bytes and make path refer to them.
+
+        With the store disabled, the bytes are simply written to path.
+
+        Args:
+            path: Screenshot path (e.g. <customer>/ROUND03_04.png)
+            data: PNG bytes
+            screenshots_dir: Screenshots root the store lives in
+            encode_variants: Encode the SCREENSHOT_VARIANTS right away
+            regions: Named region boxes [left, top, right, bottom] in image
+                pixels, kept next to the object
+
+        Returns:
+            Path: The object the screenshot refers to (path itself if the
+                store is disabled)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not SCREENSHOT_STORE_ENABLED:
+            # A new file, so a shared object is never written through
+            _write_atomic(path, data)
+            return path
+
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = cls.object_path(digest, screenshots_dir)
+        if object_path.exists():
+            logger.info(f"Screenshot {path.name} is identical to stored {digest[:12]}, deduplicated")
+        else:
+            _write_atomic(object_path, data)
+
+        cls._link(path, object_path)
+
+        if regions:
+            _write_atomic(cls.regions_path(digest, screenshots_dir), json.dumps(regions).encode("utf-8"))
+
+        if encode_variants:
+            for variant in SCREENSHOT_VARIANTS:
+                cls.ensure_variant(digest, variant, screenshots_dir)
+
+        return object_path
+
+    @classmethod
+    def ingest(cls, path: Path, screenshots_dir: Path = SCREENSHOTS_DIR) -> bool:
+        """Link an existing screenshot file to the store.
+
+        Variants are not encoded here; they are created on first request.
+
+        Args:
+            path: Regular PNG file to store
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            bool: True if the file was linked to the store, False if it
+                already is or could not be stored
+        """
+        if path.is_symlink() or not path.is_file():
+            return False
+
+        try:
+            if path.stat().st_nlink > 1:
+                # Already a hard link to an object
+                return False
+            cls.save(path, path.read_bytes(), screenshots_dir, encode_variants=False)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Could not store {path}: {e}")
+            return False
+
+    @classmethod
+    def ingest_directory(cls, customer_dir: Path, screenshots_dir: Path = SCREENSHOTS_DIR) -> int:
+        """Link all ROUND screenshots of a customer directory to the store.
+
+        Nothing calls this implicitly; run store_screenshots.py to
+        deduplicate screenshots saved before the store existed. TARGET
+        screenshots, and ROUND screenshots committed to git, are left as
+        they are.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            int: Number of files moved into the store
+        """
+        if not SCREENSHOT_STORE_ENABLED or not customer_dir.exists():
+            return 0
+
+        tracked = _git_tracked(customer_dir)
+        ingested = sum(
+            cls.ingest(path, screenshots_dir)
+            for path in sorted(customer_dir.glob("ROUND*.png"))
+            if path.name not in tracked
+        )
+        if ingested:
+            logger.info(f"Linked {ingested} screenshots of {customer_dir.name} to the store")
+        return ingested
+
+    @classmethod
+    def digest_of(cls, path: Path) -> Optional[str]:
+        """Content hash of a screenshot.
+
+        Args:
+            path: Screenshot path
+
+        Returns:
+            str: SHA-256 hex digest, or None if the file does not exist
+        """
+        if not path.is_file():
+            return None
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    @classmethod
+    def regions(cls, digest: str, screenshots_dir: Path = SCREENSHOTS_DIR) -> dict[str, list[int]]:
+        """Region boxes recorded when the image was captured.
+
+        Args:
+            digest: Content hash of the stored object
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            dict: Region name to [left, top, right, bottom]; empty if none were recorded
+        """
+        try:
+            return json.loads(cls.regions_path(digest, screenshots_dir).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def ensure_variant(
+        cls,
+        digest: str,
+        variant: str,
+        screenshots_dir: Path = SCREENSHOTS_DIR,
+        source: Optional[Path] = None
+    ) -> Optional[Path]:
+        """Encode a variant of an image unless it already exists.
+
+        Args:
+            digest: Content hash of the image
+            variant: "webp" (lossless), "avif" or "preview" (downscaled WebP)
+            screenshots_dir: Screenshots root the store lives in
+            source: PNG with that content (defaults to the stored object)
+
+        Returns:
+            Path: The variant file, or None if the image is missing or
+                encoding failed
+        """
+        variant_path = cls.variant_object_path(digest, variant, screenshots_dir)
+        if variant_path.exists():
+            return variant_path
+
+        source = source or cls.object_path(digest, screenshots_dir)
+        if not source.exists():
+            return None
+
+        try:
+            with Image.open(source) as img:
+                img = img.convert("RGB")
+                if variant == "preview":
+                    img.thumbnail((SCREENSHOT_PREVIEW_EDGE, SCREENSHOT_PREVIEW_EDGE), Image.Resampling.LANCZOS)
+                    save_options = {"format": "WEBP", "quality": 80, "method": 4}
+                elif variant == "avif":
+                    save_options = {"format": "AVIF", "quality": SCREENSHOT_AVIF_QUALITY}
+                else:
+                    save_options = {"format": "WEBP", "lossless": True, "method": 4}
+
+                variant_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=variant_path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        img.save(f, **save_options)
+                    os.replace(tmp_name, variant_path)
+                except Exception:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+
+            return variant_path
+
+        except Exception as e:
+            logger.warning(f"Could not encode {variant} variant of {digest[:12]}: {e}")
+            return None
+
+    @classmethod
+    def variant(cls, path: Path, variant: str, screenshots_dir: Path = SCREENSHOTS_DIR) -> Optional[Path]:
+        """Return a variant of a screenshot, encoding it on first request.
+
+        Args:
+            path: Screenshot path (e.g. <customer>/ROUND03_04.png)
+            variant: "webp", "avif" or "preview"
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            Path: The variant file, or None if unavailable
+        """
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown screenshot variant: {variant}")
+
+        digest = cls.digest_of(path)
+        if digest is None:
+            return None
+
+        # Screenshots outside the store are encoded from the file itself
+        return cls.ensure_variant(digest, variant, screenshots_dir, source=path)
+
+    @classmethod
+    def garbage_collect(cls, screenshots_dir: Path = SCREENSHOTS_DIR) -> int:
+        """Delete stored objects (and their variants) nothing refers to anymore.
+
+        Args:
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            int: Number of objects deleted
+        """
+        objects_dir = cls.store_dir(screenshots_dir) / "objects"
+        if not objects_dir.exists():
+            return 0
+
+        removed = 0
+        for object_path in objects_dir.rglob("*.png"):
+            digest = object_path.stem
+            # More than one hard link means a screenshot still uses it
+            if object_path.stat().st_nlink > 1:
+                continue
+
+            object_path.unlink()
+            cls.regions_path(digest, screenshots_dir).unlink(missing_ok=True)
+            for variant in VARIANTS:
+                cls.variant_object_path(digest, variant, screenshots_dir).unlink(missing_ok=True)
+            removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} unreferenced screenshot objects")
+        return removed
+
+    @classmethod
+    def stats(cls, screenshots_dir: Path = SCREENSHOTS_DIR) -> dict[str, int]:
+        """Size of the store and how much deduplication saved.
+
+        Args:
+            screenshots_dir: Screenshots root the store lives in
+
+        Returns:
+            dict[str, int]: objects, stored_bytes, screenshots and
+                logical_bytes (size without deduplication)
+        """
+        store_dir = cls.store_dir(screenshots_dir)
+        objects = list((store_dir / "objects").rglob("*.png")) if store_dir.exists() else []
+        sizes = {path.stem: path.stat().st_size for path in objects}
+
+        screenshots = 0
+        logical_bytes = 0
+        for path in screenshots_dir.rglob("ROUND*.png"):
+            if store_dir in path.parents or not path.is_file():
+                continue
+            screenshots += 1
+            logical_bytes += path.stat().st_size
+
+        return {
+            "objects": len(objects),
+            "stored_bytes": sum(sizes.values()),
+            "screenshots": screenshots,
+            "logical_bytes": logical_bytes,
+        }
@@ -0,0 +1,191 @@
+"""Learned selectors for A12 UI elements.
+
+This module finds UI elements without probing candidate selectors one by
+one from Python:
+- All candidate strategies (CSS selector, optionally with a text match) are
+  checked by one in-page probe that polls until one of them matches a
+  visible element, so a lookup is a single round trip
+- The winning strategy is remembered per frontend build (fingerprint of
+  the client sources) in .cache/selectors.json and tried first next time
+- A remembered strategy that stops matching is outranked by the next
+  winner, so the cache heals itself after UI changes
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import Locator, Page
+
+from config.constants import (
+    SELECTOR_CACHE_FILE,
+    SELECTOR_CACHE_BUILDS,
+)
+from services.page_readiness import PageReadiness
+
+logger = logging.getLogger(__name__)
+
+
+def _strategy(candidate: dict) -> dict:
+    """Normalized strategy ({css} or {css, text})."""
+    strategy = {"css": candidate["css"]}
+    if candidate.get("text"):
+        strategy["text"] = [word.lower() for word in candidate["text"]]
+    return strategy
+
+
+def order_candidates(candidates: list[dict], learned: Optional[dict]) -> list[dict]:
+    """Candidates with the learned strategy moved to the front.
+
+    Args:
+        candidates: {css, text?} strategies in order of preference
+        learned: Strategy that matched last time, if any
+
+    Returns:
+        list[dict]: Normalized strategies to probe, learned one first
+    """
+    ordered = [_strategy(candidate) for candidate in candidates]
+    if not learned:
+        return ordered
+    learned = _strategy(learned)
+    return [learned] + [strategy for strategy in ordered if strategy != learned]
+
+
+def to_locator(page: Page, strategy: dict, nth: int) -> Locator:
+    """Playwright locator of the element the probe matched.
+
+    The probe also matches text against aria-label and value, which
+    Playwright's text filters do not, so the element is addressed by its
+    position among the matches of the CSS selector instead.
+
+    Args:
+        page: Page to locate in
+        strategy: {css, text?} strategy that matched
+        nth: Position of the element in document.querySelectorAll(css)
+
+    Returns:
+        Locator: Locator of the element
+    """
+    return page.locator(strategy["css"]).nth(nth)
+
+
+class SelectorResolver:
+    """Resolves UI elements with one in-page probe and remembers the winners."""
+
+    # Class-level state so all pages of the process share what was learned
+    _cache: Optional[dict] = None  # {build: {key: strategy}}, oldest build first
+
+    def __init__(self, readiness: PageReadiness):
+        """Initialize a resolver for a page.
+
+        Args:
+            readiness: Readiness tracker of the page (records the waits)
+        """
+        self.readiness = readiness
+        self._build: Optional[str] = None
+
+    @classmethod
+    def _load(cls) -> dict:
+        """Selector cache, read from disk on first use."""
+        if cls._cache is None:
+            try:
+                with open(SELECTOR_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                cls._cache = cache if isinstance(cache, dict) else {}
+            except (OSError, json.JSONDecodeError):
+                cls._cache = {}
+        return cls._cache
+
+    @classmethod
+    def _save(cls):
+        """Write the selector cache atomically, keeping the newest builds."""
+        cache = cls._load()
+        for build in list(cache)[:-SELECTOR_CACHE_BUILDS]:
+            del cache[build]
+
+        SELECTOR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=SELECTOR_CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_name, SELECTOR_CACHE_FILE)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def learned(cls, build: str, key: str) -> Optional[dict]:
+        """Strategy that matched key last time in a build."""
+        return cls._load().get(build, {}).get(key)
+
+    @classmethod
+    def learn(cls, build: str, key: str, strategy: dict):
+        """Remember the strategy that matched key in a build.
+
+        Args:
+            build: Frontend build fingerprint
+            key: Name of the UI element
+            strategy: Winning {css, text?} strategy
+        """
+        cache = cls._load()
+        # Re-insert the build so it counts as the newest one
+        entry = cache.pop(build, {})
+        entry[key] = _strategy(strategy)
+        cache[build] = entry
+        try:
+            cls._save()
+        except OSError as e:
+            logger.warning(f"Could not save selector cache: {e}")
+
+    @classmethod
+    def clear(cls):
+        """Forget everything learned (in memory and on disk)."""
+        cls._cache = {}
+        SELECTOR_CACHE_FILE.unlink(missing_ok=True)
+
+    async def build_id(self) -> str:
+        """Fingerprint of the frontend build (computed once per environment start)."""
+        if self._build is None:
+            from services.static_frontend import StaticFrontendServer
+            self._build = (await asyncio.to_thread(StaticFrontendServer.build_id))[:16]
+        return self._build
+
+    async def resolve(
+        self,
+        step: str,
+        key: str,
+        candidates: list[dict],
+        timeout: Optional[int] = None
+    ) -> Optional[Locator]:
+        """Find a UI element with the first candidate strategy that matches.
+
+        Args:
+            step: Workflow step the lookup belongs to
+            key: Name of the UI element (e.g. "add_person")
+            candidates: {css, text?} strategies in order of preference
+            timeout: Upper bound in milliseconds (defaults to the step limit)
+
+        Returns:
+            Locator: Locator of the element, or None if no candidate matched
+        """
+        build = await self.build_id()
+        learned = self.learned(build, key)
+        ordered = order_candidates(candidates, learned)
+
+        match = await self.readiness.wait_for_any(step, key, ordered, timeout)
+        if match is None:
+            logger.warning(f"No candidate selector matched '{key}'")
+            return None
+
+        winner = ordered[match["index"]]
+        if learned and match["index"] == 0:
+            logger.debug(f"Learned selector for '{key}' still matches: {winner}")
+        else:
+            logger.info(f"Resolved '{key}' with {winner}")
+            self.learn(build, key, winner)
+
+        return to_locator(self.readiness.page, winner, match["nth"])
@@ -0,0 +1,146 @@
+"""Authenticated session cache for browser automation.
+
+This module persists Playwright storage state between screenshot rounds:
+- Saving cookies and localStorage after a successful login
+- Loading cached state keyed by user and frontend URL
+- Invalidating state that the application rejected
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import BrowserContext
+
+from config.constants import (
+    FRONTEND_URL,
+    SESSION_CACHE_DIR,
+    SESSION_MAX_AGE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """Caches Playwright storage state per user and frontend URL."""
+
+    @staticmethod
+    def get_session_path(username: str, frontend_url: str = FRONTEND_URL) -> Path:
+        """Get the cache file path for a user's session.
+
+        Args:
+            username: User the session belongs to
+            frontend_url: Frontend the session was created against
+
+        Returns:
+            Path: Path to the cached storage state (may not exist yet)
+        """
+        safe_user = re.sub(r'[^a-zA-Z0-9_-]', '_', username)
+        key = hashlib.sha256(f"{username}|{frontend_url}".encode("utf-8")).hexdigest()[:16]
+        return SESSION_CACHE_DIR / f"{safe_user}-{key}.json"
+
+    @staticmethod
+    def load(username: str, frontend_url: str = FRONTEND_URL) -> Optional[dict]:
+        """Load cached storage state for a user if it is fresh enough.
+
+        Args:
+            username: User the session belongs to
+            frontend_url: Frontend the session was created against
+
+        Returns:
+            dict: Playwright storage state, or None if missing, stale or unreadable
+        """
+        session_path = SessionStore.get_session_path(username, frontend_url)
+
+        if not session_path.exists():
+            logger.info(f"No cached session for {username}")
+            return None
+
+        try:
+            age = time.time() - session_path.stat().st_mtime
+            if age > SESSION_MAX_AGE:
+                logger.info(f"Cached session for {username} expired ({age:.0f}s old)")
+                session_path.unlink(missing_ok=True)
+                return None
+
+            with open(session_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+
+            logger.info(f"Loaded cached session for {username} ({age:.0f}s old)")
+            return state
+
+        except Exception as e:
+            logger.warning(f"Error loading cached session {session_path}: {e}")
+            return None
+
+    @staticmethod
+    async def save(
+        context: BrowserContext,
+        username: str,
+        frontend_url: str = FRONTEND_URL
+    ) -> Optional[Path]:
+        """Capture the context's storage state and write it to the cache.
+
+        Args:
+            context: Logged-in browser context
+            username: User the session belongs to
+            frontend_url: Frontend the session was created against
+
+        Returns:
+            Path: Path to the cached state, or None if saving failed
+        """
+        session_path = SessionStore.get_session_path(username, frontend_url)
+
+        try:
+            state = await context.storage_state()
+
+            session_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write atomically (concurrent rounds may save at the same time)
+            # and keep the credentials-equivalent file private
+            fd, tmp_name = tempfile.mkstemp(dir=session_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(tmp_name, session_path)
+            except Exception:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+            logger.info(f"Cached session for {username}: {session_path}")
+            return session_path
+
+        except Exception as e:
+            logger.warning(f"Error caching session for {username}: {e}")
+            return None
+
+    @staticmethod
+    def invalidate(username: str, frontend_url: str = FRONTEND_URL) -> bool:
+        """Delete a cached session, e.g. after the application rejected it.
+
+        Args:
+            username: User the session belongs to
+            frontend_url: Frontend the session was created against
+
+        Returns:
+            bool: True if a cached session was deleted, False otherwise
+        """
+        session_path = SessionStore.get_session_path(username, frontend_url)
+
+        if not session_path.exists():
+            return False
+
+        try:
+            session_path.unlink()
+            logger.info(f"Invalidated cached session for {username}")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error invalidating session {session_path}: {e}")
+            return False
@@ -0,0 +1,284 @@
+"""Perceptual-hash index of TARGET and ROUND screenshots.
+
+This module answers "which screenshot looks most like this one" without
+opening every image:
+- Per image a pHash (DCT of a 32x32 grayscale copy), a dHash (gradient of
+  a 9x8 copy) and a coarse, normalized color histogram
+- One index file per customer (<customer>/similarity.json) next to the
+  images, updated incrementally: only files whose size or mtime changed
+  are hashed again, deleted files are dropped
+- Updates run in the background after each captured round; queries only
+  compare the stored hashes, so they take milliseconds
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from config.constants import (
+    SCREENSHOTS_DIR,
+    ROUND_REGEX,
+    SIMILARITY_INDEX_FILENAME,
+    SIMILARITY_HASH_SIZE,
+    SIMILARITY_HIST_BINS,
+    SIMILARITY_WEIGHTS,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+HASH_BITS = SIMILARITY_HASH_SIZE * SIMILARITY_HASH_SIZE
+
+_INDEXED_REGEX = re.compile(rf"(?:TARGET_\d{{2}}\.png|{ROUND_REGEX})")
+_ROUND_NUMBER = re.compile(ROUND_REGEX)
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """Orthonormal DCT-II basis of size n x n."""
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(SIMILARITY_HASH_SIZE * 4)
+
+
+def _bits_to_hex(bits: np.ndarray) -> str:
+    """Pack a boolean array into a hex string."""
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bit)
+    return f"{value:0{HASH_BITS // 4}x}"
+
+
+def compute_signature(path: Path) -> dict:
+    """Perceptual hashes and color histogram of an image.
+
+    Args:
+        path: Image file
+
+    Returns:
+        dict: phash and dhash (hex strings), histogram (normalized bin
+            weights, rounded) and size
+    """
+    size = SIMILARITY_HASH_SIZE
+    with Image.open(path) as img:
+        source_size = img.size
+        # One cheap downscale first (reducing_gap); the hashes only need a few pixels
+        small = img.convert("RGB").resize((size * 8, size * 8), Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    gray = small.convert("L")
+
+    pixels = np.asarray(gray.resize((size * 4, size * 4), Image.Resampling.LANCZOS), dtype=np.float64)
+    coefficients = (_DCT @ pixels @ _DCT.T)[:size, :size]
+    phash = coefficients > np.median(coefficients.ravel()[1:])
+
+    gradient = np.asarray(gray.resize((size + 1, size), Image.Resampling.LANCZOS), dtype=np.int16)
+    dhash = gradient[:, 1:] > gradient[:, :-1]
+
+    rgb = np.asarray(small, dtype=np.uint16) * SIMILARITY_HIST_BINS // 256
+    bins = (rgb[..., 0] * SIMILARITY_HIST_BINS + rgb[..., 1]) * SIMILARITY_HIST_BINS + rgb[..., 2]
+    histogram = np.bincount(bins.ravel(), minlength=SIMILARITY_HIST_BINS ** 3) / bins.size
+
+    return {
+        "phash": _bits_to_hex(phash),
+        "dhash": _bits_to_hex(dhash),
+        "histogram": [round(float(v), 4) for v in histogram],
+        "size": list(source_size),
+    }
+
+
+def compare_signatures(a: dict, b: dict) -> dict:
+    """Distances between two signatures and their combined similarity.
+
+    Args:
+        a: Signature from compute_signature
+        b: Signature from compute_signature
+
+    Returns:
+        dict: phash_distance and dhash_distance (differing bits),
+            histogram_similarity (0-1) and similarity (0-1, weighted)
+    """
+    phash_distance = (int(a["phash"], 16) ^ int(b["phash"], 16)).bit_count()
+    dhash_distance = (int(a["dhash"], 16) ^ int(b["dhash"], 16)).bit_count()
+    histogram_similarity = float(np.minimum(a["histogram"], b["histogram"]).sum())
+
+    distance = (
+        SIMILARITY_WEIGHTS["phash"] * phash_distance / HASH_BITS
+        + SIMILARITY_WEIGHTS["dhash"] * dhash_distance / HASH_BITS
+        + SIMILARITY_WEIGHTS["histogram"] * (1.0 - min(1.0, histogram_similarity))
+    )
+    return {
+        "similarity": round(1.0 - distance, 4),
+        "phash_distance": phash_distance,
+        "dhash_distance": dhash_distance,
+        "histogram_similarity": round(histogram_similarity, 4),
+    }
+
+
+class SimilarityIndex:
+    """Maintains and queries the per-customer perceptual-hash indexes."""
+
+    _lock = threading.Lock()
+    _tasks: set = set()
+
+    @staticmethod
+    def index_path(customer_dir: Path) -> Path:
+        """Path of the customer's similarity index."""
+        return customer_dir / SIMILARITY_INDEX_FILENAME
+
+    @classmethod
+    def _read(cls, customer_dir: Path) -> dict:
+        """Stored entries by file name; empty if missing, corrupt or outdated."""
+        try:
+            with open(cls.index_path(customer_dir), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+                return index.get("files", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Similarity index of {customer_dir.name} is unreadable ({e}), rebuilding")
+        return {}
+
+    @classmethod
+    def _save(cls, customer_dir: Path, files: dict):
+        """Write the index atomically."""
+        fd, tmp_name = tempfile.mkstemp(dir=customer_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "files": files}, f)
+            os.replace(tmp_name, cls.index_path(customer_dir))
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def update(cls, customer_dir: Path) -> int:
+        """Bring a customer's index up to date with its image files.
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+
+        Returns:
+            int: Number of images hashed (0 if the index was current)
+        """
+        if not customer_dir.is_dir():
+            return 0
+
+        with cls._lock:
+            files = cls._read(customer_dir)
+            current = {}
+            hashed = 0
+
+            for path in sorted(customer_dir.glob("*.png")):
+                if not _INDEXED_REGEX.fullmatch(path.name):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                key = [stat.st_size, stat.st_mtime_ns]
+                entry = files.get(path.name)
+                if entry and entry.get("stat") == key:
+                    current[path.name] = entry
+                    continue
+                try:
+                    current[path.name] = {"stat": key, **compute_signature(path)}
+                    hashed += 1
+                except Exception as e:
+                    logger.warning(f"Could not hash {path}: {e}")
+
+            if hashed or current.keys() != files.keys():
+                cls._save(customer_dir, current)
+                logger.info(f"Similarity index of {customer_dir.name}: {hashed} hashed, {len(current)} indexed")
+            return hashed
+
+    @classmethod
+    def schedule_update(cls, customer_dir: Path):
+        """Update a customer's index in the background (fire and forget).
+
+        Args:
+            customer_dir: Directory containing customer screenshots
+        """
+        task = asyncio.create_task(asyncio.to_thread(cls.update, customer_dir))
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    def find_similar(
+        cls,
+        query: Path,
+        customers: Optional[list[str]] = None,
+        kind: str = "round",
+        limit: int = 5,
+        screenshots_dir: Path = SCREENSHOTS_DIR
+    ) -> tuple[list[dict], int]:
+        """Nearest indexed screenshots to a query image.
+
+        Indexes of the searched customers are updated first (only changed
+        files are hashed), so results reflect the files on disk.
+
+        Args:
+            query: Image to match (indexed or not)
+            customers: Customer directories to search (None: all)
+            kind: "round", "target" or "all"
+            limit: Maximum number of matches
+            screenshots_dir: Root screenshots directory
+
+        Returns:
+            tuple: (matches, most similar first: customer, file, round,
+                similarity and distances; number of images searched)
+
+        Raises:
+            FileNotFoundError: If the query image does not exist
+        """
+        if not query.is_file():
+            raise FileNotFoundError(f"Image does not exist: {query}")
+
+        if customers is None:
+            customer_dirs = sorted(
+                path for path in screenshots_dir.iterdir()
+                if path.is_dir() and not path.name.startswith(".")
+            ) if screenshots_dir.is_dir() else []
+        else:
+            customer_dirs = [screenshots_dir / name for name in customers]
+
+        query_signature = None
+        candidates = []
+        for customer_dir in customer_dirs:
+            cls.update(customer_dir)
+            for name, entry in cls._read(customer_dir).items():
+                if customer_dir / name == query:
+                    query_signature = entry
+                    continue
+                round_match = _ROUND_NUMBER.fullmatch(name)
+                if kind == "round" and not round_match or kind == "target" and round_match:
+                    continue
+                candidates.append((customer_dir.name, name, round_match, entry))
+
+        if query_signature is None:
+            query_signature = compute_signature(query)
+
+        matches = [
+            {
+                "customer": customer,
+                "file": name,
+                "round": int(round_match.group(1)) if round_match else None,
+                **compare_signatures(query_signature, entry),
+            }
+            for customer, name, round_match, entry in candidates
+        ]
+        matches.sort(key=lambda match: match["similarity"], reverse=True)
+        return matches[:limit], len(candidates)
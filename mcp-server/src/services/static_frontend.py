@@ -0,0 +1,247 @@
+"""Static frontend server for screenshot capture.
+
+This module replaces the webpack dev server when FRONTEND_MODE=static:
+- Building the production bundle once, rebuilding only when client
+  sources change (theme files are excluded from the fingerprint)
+- Serving the bundle from an aiohttp server inside the MCP process
+- Serving all theme files at RUNTIME_THEMES_PATH, read from disk on each
+  request, so theme changes need no recompile
+- Proxying /api to the backend like the production nginx config
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from aiohttp import web
+
+from config.constants import (
+    CLIENT_DIR,
+    THEMES_DIR,
+    FRONTEND_URL,
+    FRONTEND_MODE,
+    BACKEND_URL,
+    STATIC_BUNDLE_DIR,
+    RUNTIME_THEMES_PATH,
+)
+from services.theme_manager import ThemeManager
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_STAMP_FILE = ".bundle-stamp"
+
+# Inputs of the production bundle (relative to CLIENT_DIR)
+_BUNDLE_INPUTS = [
+    "src",
+    "resources",
+    "package.json",
+    "package-lock.json",
+    "tsconfig.json",
+    "webpack.common.js",
+    "webpack.prod.js",
+]
+
+# Headers that must not be forwarded by a proxy
+_HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "host", "content-length",
+}
+
+
+def bundle_fingerprint(client_dir: Path = CLIENT_DIR, themes_dir: Path = THEMES_DIR) -> str:
+    """Fingerprint of the client sources the bundle is built from.
+
+    Uses path, size and modification time of every input file. Theme files
+    are left out because the static server loads them at runtime.
+
+    Args:
+        client_dir: Client project directory
+        themes_dir: Theme directory excluded from the fingerprint
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for name in _BUNDLE_INPUTS:
+        root = client_dir / name
+        files = sorted(root.rglob("*")) if root.is_dir() else [root]
+        for path in files:
+            if not path.is_file() or themes_dir in path.parents:
+                continue
+            stat = path.stat()
+            digest.update(f"{path.relative_to(client_dir)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class StaticFrontendServer:
+    """Serves the prebuilt client bundle, runtime themes and the /api proxy."""
+
+    _runner: Optional[web.AppRunner] = None
+    _proxy_session: Optional[aiohttp.ClientSession] = None
+    _build_id: Optional[str] = None  # Fingerprint of the build being served
+
+    @classmethod
+    def is_bundle_fresh(cls, bundle_dir: Path = STATIC_BUNDLE_DIR) -> bool:
+        """Check whether the built bundle matches the current client sources.
+
+        Args:
+            bundle_dir: Build output directory
+
+        Returns:
+            bool: True if the bundle exists and was built from the current sources
+        """
+        stamp = bundle_dir / BUNDLE_STAMP_FILE
+        if not (bundle_dir / "index.html").exists() or not stamp.exists():
+            return False
+        fingerprint = bundle_fingerprint()
+        if stamp.read_text(encoding="utf-8").strip() != fingerprint:
+            return False
+        cls._build_id = fingerprint
+        return True
+
+    @classmethod
+    def mark_bundle_built(cls, bundle_dir: Path = STATIC_BUNDLE_DIR):
+        """Record the fingerprint of the sources the bundle was just built from."""
+        fingerprint = bundle_fingerprint()
+        (bundle_dir / BUNDLE_STAMP_FILE).write_text(fingerprint, encoding="utf-8")
+        cls._build_id = fingerprint
+
+    @classmethod
+    def build_id(cls, bundle_dir: Path = STATIC_BUNDLE_DIR) -> str:
+        """Fingerprint of the frontend build the pages come from.
+
+        Computed once per environment start or bundle build instead of on
+        every call: the static bundle's stamp file records it, and the dev
+        server's sources are fingerprinted on first use after it started.
+
+        Args:
+            bundle_dir: Build output directory
+
+        Returns:
+            str: Hex digest
+        """
+        if cls._build_id is None:
+            stamp = bundle_dir / BUNDLE_STAMP_FILE
+            if FRONTEND_MODE == "static" and stamp.exists():
+                cls._build_id = stamp.read_text(encoding="utf-8").strip()
+            else:
+                cls._build_id = bundle_fingerprint()
+        return cls._build_id
+
+    @classmethod
+    def forget_build_id(cls):
+        """Fingerprint the sources again on the next build_id call."""
+        cls._build_id = None
+
+    @staticmethod
+    def load_runtime_themes(themes_dir: Path = THEMES_DIR) -> dict[str, dict]:
+        """Read all theme files, keyed by the client's display name.
+
+        Args:
+            themes_dir: Directory with the theme JSON files
+
+        Returns:
+            dict[str, dict]: Display name to theme; unreadable files are skipped
+        """
+        themes = {}
+        for path in sorted(themes_dir.glob("*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    themes[ThemeManager.theme_display_name(path.stem)] = json.load(f)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable theme {path.name}: {e}")
+        return themes
+
+    @classmethod
+    def create_app(cls, bundle_dir: Path = STATIC_BUNDLE_DIR) -> web.Application:
+        """Build the aiohttp application.
+
+        Args:
+            bundle_dir: Directory with the built client bundle
+
+        Returns:
+            web.Application: The static frontend app
+        """
+        bundle_root = bundle_dir.resolve()
+
+        async def runtime_themes(request: web.Request) -> web.Response:
+            themes = await asyncio.to_thread(cls.load_runtime_themes)
+            return web.json_response(themes, headers={"Cache-Control": "no-store"})
+
+        async def proxy_api(request: web.Request) -> web.StreamResponse:
+            if cls._proxy_session is None or cls._proxy_session.closed:
+                cls._proxy_session = aiohttp.ClientSession(auto_decompress=False)
+
+            headers = {k: v for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP}
+            async with cls._proxy_session.request(
+                request.method,
+                BACKEND_URL.rstrip("/") + request.path_qs,
+                headers=headers,
+                data=await request.read(),
+                allow_redirects=False
+            ) as upstream:
+                body = await upstream.read()
+                response_headers = {
+                    k: v for k, v in upstream.headers.items() if k.lower() not in _HOP_BY_HOP
+                }
+                return web.Response(status=upstream.status, body=body, headers=response_headers)
+
+        async def static_file(request: web.Request) -> web.StreamResponse:
+            relative = request.match_info.get("path", "")
+            path = (bundle_root / relative).resolve()
+            if bundle_root not in path.parents or not path.is_file():
+                # Unknown routes render the app, like the dev server's history fallback
+                path = bundle_root / "index.html"
+            headers = {"Cache-Control": "no-cache"} if path.suffix == ".html" else {}
+            return web.FileResponse(path, headers=headers)
+
+        app = web.Application(client_max_size=100 * 1024 * 1024)
+        app.router.add_get(RUNTIME_THEMES_PATH, runtime_themes)
+        app.router.add_route("*", "/api{tail:.*}", proxy_api)
+        app.router.add_get("/{path:.*}", static_file)
+        return app
+
+    @classmethod
+    async def start(cls, bundle_dir: Path = STATIC_BUNDLE_DIR, url: str = FRONTEND_URL):
+        """Start serving the bundle on the frontend URL's host and port.
+
+        Args:
+            bundle_dir: Directory with the built client bundle
+            url: URL to serve on
+        """
+        if cls._runner is not None:
+            return
+
+        parsed = urlparse(url)
+        runner = web.AppRunner(cls.create_app(bundle_dir), access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, parsed.hostname or "localhost", parsed.port or 80).start()
+        except Exception:
+            await runner.cleanup()
+            raise
+
+        cls._runner = runner
+        logger.info(f"Static frontend serving {bundle_dir} on {url}")
+
+    @classmethod
+    async def stop(cls):
+        """Stop the server and close the backend proxy session."""
+        if cls._runner is not None:
+            await cls._runner.cleanup()
+            cls._runner = None
+            logger.info("Static frontend stopped")
+
+        if cls._proxy_session is not None:
+            await cls._proxy_session.close()
+            cls._proxy_session = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """True while the static server is serving."""
+        return cls._runner is not None
@@ -4,21 +4,181 @@ This module handles theme file operations:
 - Creating new theme files from templates
 - Validating theme JSON structure
 - Managing theme file paths
+- Applying incremental patches (JSON pointer or dotted paths)
 """
 
+import copy
 import json
 import logging
+import os
+import re
 import shutil
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from config.constants import (
     THEMES_DIR,
     BASE_THEME_FILE,
+    SCREENSHOTS_DIR,
+    PATCHES_DIRNAME,
+    PATCH_LOG_PATTERN,
 )
 
 logger = logging.getLogger(__name__)
 
+# Theme files are stored with 2-space indentation and no trailing newline;
+# writing them back the same way keeps git diffs limited to changed keys.
+THEME_JSON_INDENT = 2
+
+_COLOR_REGEX = re.compile(
+    r'^(#[0-9a-fA-F]{3,4}|#[0-9a-fA-F]{6}|#[0-9a-fA-F]{8}'
+    r'|(rgb|rgba|hsl|hsla)\([^()]*\))$'
+)
+
+# CSS Color Module Level 4 named colors and color keywords (lower case)
+_NAMED_COLORS = frozenset("""
+    aliceblue antiquewhite aqua aquamarine azure beige bisque black blanchedalmond
+    blue blueviolet brown burlywood cadetblue chartreuse chocolate coral
+    cornflowerblue cornsilk crimson cyan darkblue darkcyan darkgoldenrod darkgray
+    darkgreen darkgrey darkkhaki darkmagenta darkolivegreen darkorange darkorchid
+    darkred darksalmon darkseagreen darkslateblue darkslategray darkslategrey
+    darkturquoise darkviolet deeppink deepskyblue dimgray dimgrey dodgerblue
+    firebrick floralwhite forestgreen fuchsia gainsboro ghostwhite gold goldenrod
+    gray green greenyellow grey honeydew hotpink indianred indigo ivory khaki
+    lavender lavenderblush lawngreen lemonchiffon lightblue lightcoral lightcyan
+    lightgoldenrodyellow lightgray lightgreen lightgrey lightpink lightsalmon
+    lightseagreen lightskyblue lightslategray lightslategrey lightsteelblue
+    lightyellow lime limegreen linen magenta maroon mediumaquamarine mediumblue
+    mediumorchid mediumpurple mediumseagreen mediumslateblue mediumspringgreen
+    mediumturquoise mediumvioletred midnightblue mintcream mistyrose moccasin
+    navajowhite navy oldlace olive olivedrab orange orangered orchid palegoldenrod
+    palegreen paleturquoise palevioletred papayawhip peachpuff peru pink plum
+    powderblue purple rebeccapurple red rosybrown royalblue saddlebrown salmon
+    sandybrown seagreen seashell sienna silver skyblue slateblue slategray
+    slategrey snow springgreen steelblue tan teal thistle tomato turquoise violet
+    wheat white whitesmoke yellow yellowgreen
+    transparent currentcolor inherit
+""".split())
+
+_MISSING = object()
+
+
+def parse_theme_path(path: str) -> list:
+    """Split a JSON pointer or dotted path into keys.
+
+    "/colors/interaction/hover/color" and "colors.interaction.hover.color"
+    both yield ["colors", "interaction", "hover", "color"]. Numeric parts
+    address list items.
+
+    Args:
+        path: JSON pointer (leading "/") or dotted path
+
+    Returns:
+        list: Keys (str) and list indices (int)
+
+    Raises:
+        ValueError: If the path is empty
+    """
+    if path.startswith("/"):
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+    else:
+        parts = path.split(".")
+
+    if not path or any(part == "" for part in parts):
+        raise ValueError(f"Invalid theme path: '{path}'")
+
+    return [int(part) if part.isdigit() else part for part in parts]
+
+
+def _get_at(data: Any, keys: list) -> Any:
+    """Return the value at keys, or _MISSING if any part does not exist."""
+    for key in keys:
+        if isinstance(data, dict) and isinstance(key, str) and key in data:
+            data = data[key]
+        elif isinstance(data, list) and isinstance(key, int) and key < len(data):
+            data = data[key]
+        else:
+            return _MISSING
+    return data
+
+
+def _copy_path(data: Any, keys: list, copied: dict[int, Any]) -> Any:
+    """Return the value at keys, shallow-copying the containers on the way.
+
+    Only the containers along the path are copied (once per patch batch,
+    tracked in copied), so untouched subtrees stay shared with the input
+    and the input itself is never modified.
+
+    Returns:
+        Any: The copied container at keys, or _MISSING if any part does not exist
+    """
+    for key in keys:
+        child = _get_at(data, [key])
+        if child is _MISSING:
+            return _MISSING
+        if isinstance(child, (dict, list)) and id(child) not in copied:
+            child = copy.copy(child)
+            copied[id(child)] = child
+            data[key] = child
+        data = child
+    return data
+
+
+def _json_type(value: Any) -> str:
+    """Name of the JSON type of a value (int and float are both "number")."""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    return "null"
+
+
+def _is_color(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    value = value.strip()
+    return bool(_COLOR_REGEX.match(value)) or value.lower() in _NAMED_COLORS
+
+
+def validate_against_schema(value: Any, schema: Any, path: str) -> list[str]:
+    """Check a value against the default theme's value at the same path.
+
+    Only the given subtree is inspected: types must match, colors must stay
+    colors, and objects must not drop keys the default theme defines.
+
+    Args:
+        value: New value
+        schema: Value of the default theme at the same path
+        path: Path used in error messages
+
+    Returns:
+        list[str]: Validation errors (empty if valid)
+    """
+    if _json_type(value) != _json_type(schema):
+        return [f"{path}: expected {_json_type(schema)}, got {_json_type(value)}"]
+
+    if isinstance(schema, str) and schema.startswith(("#", "rgb")):
+        if not _is_color(value):
+            return [f"{path}: '{value}' is not a valid color"]
+
+    errors = []
+    if isinstance(schema, dict):
+        for key, sub_schema in schema.items():
+            if key not in value:
+                errors.append(f"{path}.{key}: missing (defined in default theme)")
+            else:
+                errors.extend(validate_against_schema(value[key], sub_schema, f"{path}.{key}"))
+
+    return errors
+
 
 class ThemeManager:
     """Manages theme file operations."""
@@ -157,6 +317,42 @@ class ThemeManager:
             logger.error(f"Error deleting theme file {theme_path}: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def theme_display_name(customer_name: str) -> str:
+        """Name under which the client lists a theme file.
+
+        Mirrors convertFileNameToDisplayName in client/src/app/themeContext.tsx:
+        "arctic-light" becomes "Arctic Light".
+
+        Args:
+            customer_name: Name of the customer/theme (file name without .json)
+
+        Returns:
+            str: Display name used as key in the client's THEMES map
+        """
+        name = re.sub(r'(?:^\./|\.json$)', '', customer_name)
+        name = re.sub(r'[-_]+', ' ', name).strip()
+        return re.sub(r'\b\w', lambda m: m.group().upper(), name, flags=re.ASCII)
+
+    @staticmethod
+    def load_theme(customer_name: str) -> dict:
+        """Load a customer's theme file.
+
+        Args:
+            customer_name: Name of the customer/theme
+
+        Returns:
+            dict: Theme content
+
+        Raises:
+            FileNotFoundError: If the theme file doesn't exist
+            json.JSONDecodeError: If the theme file is not valid JSON
+        """
+        theme_path = ThemeManager.get_theme_path(customer_name)
+
+        with open(theme_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     @staticmethod
     def get_base_theme_content() -> Optional[dict]:
         """Load and return the base theme template content.
@@ -175,3 +371,183 @@ class ThemeManager:
         except Exception as e:
             logger.error(f"Error loading base theme: {e}", exc_info=True)
             return None
+
+    @staticmethod
+    def apply_patches(
+        theme_data: dict,
+        patches: list[dict],
+        schema: Optional[dict] = None
+    ) -> tuple[dict, list[dict], list[str]]:
+        """Apply patches to a copy of the theme data.
+
+        Patches are dicts with "path", "op" ("replace", "add" or "remove",
+        default "replace") and "value". Either all patches apply or none.
+        Only the objects along the patched paths are copied; the rest of
+        the theme is shared with theme_data.
+
+        Args:
+            theme_data: Current theme content (not modified)
+            patches: Patches to apply in order
+            schema: Default theme content to validate touched subtrees against
+
+        Returns:
+            tuple: (patched theme, applied changes with old/new values, warnings)
+
+        Raises:
+            ValueError: If a patch is malformed, targets a missing path or
+                fails schema validation
+        """
+        patched = copy.copy(theme_data)
+        copied = {id(patched): patched}
+        applied = []
+        warnings = []
+        errors = []
+
+        for patch in patches:
+            path = patch.get("path", "")
+            op = patch.get("op", "replace")
+            keys = parse_theme_path(path)
+            label = ".".join(str(k) for k in keys)
+
+            parent = _copy_path(patched, keys[:-1], copied)
+            key = keys[-1]
+            old_value = _get_at(patched, keys)
+
+            if parent is _MISSING or not isinstance(parent, (dict, list)):
+                raise ValueError(f"{label}: parent path does not exist")
+
+            if op == "remove":
+                if old_value is _MISSING:
+                    raise ValueError(f"{label}: cannot remove, path does not exist")
+                if schema is not None and _get_at(schema, keys) is not _MISSING:
+                    errors.append(f"{label}: defined in default theme, cannot be removed")
+                del parent[key]
+                applied.append({"path": label, "op": op, "old": old_value, "new": None})
+                continue
+
+            if op not in ("replace", "add"):
+                raise ValueError(f"{label}: unknown op '{op}'")
+
+            if patch.get("value") is None:
+                raise ValueError(f"{label}: '{op}' requires a value")
+
+            if op == "replace" and old_value is _MISSING:
+                raise ValueError(f"{label}: path does not exist (use op 'add' to create it)")
+
+            value = patch["value"]
+
+            if schema is not None:
+                schema_value = _get_at(schema, keys)
+                if schema_value is _MISSING:
+                    warnings.append(f"{label}: not defined in default theme, not validated")
+                else:
+                    errors.extend(validate_against_schema(value, schema_value, label))
+
+            if isinstance(parent, list):
+                if not isinstance(key, int) or key > len(parent):
+                    raise ValueError(f"{label}: invalid list index")
+                if key == len(parent):
+                    parent.append(value)
+                else:
+                    parent[key] = value
+            else:
+                parent[str(key)] = value
+
+            if old_value != value:
+                applied.append({
+                    "path": label,
+                    "op": op,
+                    "old": None if old_value is _MISSING else old_value,
+                    "new": value,
+                })
+
+        if errors:
+            raise ValueError("Theme patch failed validation: " + "; ".join(errors))
+
+        return patched, applied, warnings
+
+    @staticmethod
+    def update_theme(
+        customer_name: str,
+        patches: list[dict],
+        round_number: Optional[int] = None
+    ) -> dict:
+        """Patch a customer's theme file atomically.
+
+        The file is only rewritten if a value actually changes, so no-op
+        patches do not trigger a frontend rebuild. Applied changes are
+        appended to the customer's patch log for the given round.
+
+        Args:
+            customer_name: Name of the customer/theme
+            patches: Patches to apply (see apply_patches)
+            round_number: Round the changes belong to (for the patch log)
+
+        Returns:
+            dict: theme_path, applied changes, warnings and patch_log path
+
+        Raises:
+            FileNotFoundError: If the theme file doesn't exist
+            ValueError: If a patch is invalid (nothing is written)
+        """
+        theme_path = ThemeManager.get_theme_path(customer_name)
+
+        if not theme_path.exists():
+            raise FileNotFoundError(f"Theme file does not exist: {theme_path}")
+
+        with open(theme_path, 'r', encoding='utf-8') as f:
+            theme_data = json.load(f)
+
+        patched, applied, warnings = ThemeManager.apply_patches(
+            theme_data,
+            patches,
+            ThemeManager.get_base_theme_content()
+        )
+
+        patch_log = None
+        if applied:
+            # Write to a temp file in the same directory, then swap it in atomically
+            fd, tmp_name = tempfile.mkstemp(dir=theme_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(patched, f, indent=THEME_JSON_INDENT)
+                shutil.copymode(theme_path, tmp_name)
+                os.replace(tmp_name, theme_path)
+            except Exception:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+            logger.info(f"Applied {len(applied)} theme changes to {theme_path}")
+
+            if round_number is not None:
+                patch_log = ThemeManager.log_patches(customer_name, round_number, applied)
+        else:
+            logger.info(f"Theme patches for {customer_name} changed nothing, file not rewritten")
+
+        return {
+            "theme_path": str(theme_path),
+            "applied": applied,
+            "warnings": warnings,
+            "patch_log": str(patch_log) if patch_log else None,
+        }
+
+    @staticmethod
+    def log_patches(customer_name: str, round_number: int, applied: list[dict]) -> Path:
+        """Append applied theme changes to the round's patch log.
+
+        Args:
+            customer_name: Name of the customer/theme
+            round_number: Round the changes belong to
+            applied: Changes returned by apply_patches
+
+        Returns:
+            Path: Patch log file (JSON lines)
+        """
+        log_path = SCREENSHOTS_DIR / customer_name / PATCHES_DIRNAME / PATCH_LOG_PATTERN.format(round_number)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {"timestamp": time.time(), "round": round_number, "changes": applied}
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+
+        return log_path
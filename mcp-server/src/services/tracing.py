@@ -0,0 +1,218 @@
+"""Structured timing spans for the screenshot workflow and service startup.
+
+This module records where the time of a tool call goes:
+- A trace per tool call (or service startup), held in a context variable so
+  concurrent rounds (get_screenshots_batch) stay separate
+- Nested spans with parent links, attributes and an ok/error status
+- A per-span-name summary in milliseconds
+- Export as Chrome trace-event JSON (chrome://tracing, Perfetto) or
+  OpenTelemetry-style JSONL
+"""
+
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[str]] = ContextVar("current_span", default=None)
+
+
+def _new_id(num_bytes: int) -> str:
+    return os.urandom(num_bytes).hex()
+
+
+class Trace:
+    """Spans recorded for one traced operation."""
+
+    def __init__(self, name: str, **attributes):
+        """Initialize a trace.
+
+        Args:
+            name: Name of the traced operation (e.g. "get_screenshots")
+            **attributes: Attributes of the operation (customer, round, ...)
+        """
+        self.name = name
+        self.trace_id = _new_id(16)
+        self.attributes = attributes
+        self.spans: list[dict] = []
+
+    def summary(self) -> dict[str, float]:
+        """Total milliseconds per span name.
+
+        Returns:
+            dict[str, float]: Span name to summed duration, in recording order
+        """
+        totals: dict[str, float] = {}
+        for span_data in sorted(self.spans, key=lambda s: s["start_ns"]):
+            totals[span_data["name"]] = totals.get(span_data["name"], 0.0) + span_data["duration_ms"]
+        return {name: round(total, 1) for name, total in totals.items()}
+
+    def to_chrome_trace(self) -> dict:
+        """Convert to the Chrome trace-event format ("X" complete events)."""
+        events = [
+            {
+                "name": span_data["name"],
+                "cat": self.name,
+                "ph": "X",
+                "ts": span_data["start_ns"] / 1000,
+                "dur": (span_data["end_ns"] - span_data["start_ns"]) / 1000,
+                "pid": 1,
+                "tid": 1,
+                "args": {**span_data["attributes"], "status": span_data["status"]},
+            }
+            for span_data in self.spans
+        ]
+        return {"traceEvents": events, "metadata": {"trace_id": self.trace_id, **self.attributes}}
+
+    def to_otel_jsonl(self) -> str:
+        """Convert to OpenTelemetry-style JSON lines, one span per line."""
+        lines = []
+        for span_data in self.spans:
+            lines.append(json.dumps({
+                "traceId": self.trace_id,
+                "spanId": span_data["span_id"],
+                "parentSpanId": span_data["parent_id"],
+                "name": span_data["name"],
+                "startTimeUnixNano": span_data["start_ns"],
+                "endTimeUnixNano": span_data["end_ns"],
+                "attributes": span_data["attributes"],
+                "status": {"code": "OK" if span_data["status"] == "ok" else "ERROR"},
+                "resource": {"service.name": "a12-theme-mcp", **self.attributes},
+            }, default=str))
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Path, fmt: str = "chrome") -> Optional[Path]:
+        """Write the trace to a file.
+
+        Args:
+            path: Output path; the suffix is replaced to match the format
+            fmt: "chrome" (.json) or "otel" (.jsonl)
+
+        Returns:
+            Path: Written file, or None if writing failed
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if fmt == "otel":
+                path = path.with_suffix(".jsonl")
+                path.write_text(self.to_otel_jsonl(), encoding="utf-8")
+            else:
+                path = path.with_suffix(".json")
+                path.write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+            logger.info(f"Trace written: {path}")
+            return path
+
+        except Exception as e:
+            logger.warning(f"Could not write trace {path}: {e}")
+            return None
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace of the running operation, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace(name: str, **attributes) -> Iterator[Trace]:
+    """Record all spans of the enclosed block into a new trace.
+
+    The block itself is recorded as the root span.
+
+    Args:
+        name: Name of the traced operation
+        **attributes: Attributes of the operation
+
+    Yields:
+        Trace: The new trace
+    """
+    trace = Trace(name, **attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        with span(name, **attributes):
+            yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[dict]:
+    """Time the enclosed block as a span of the current trace.
+
+    Does nothing (beyond yielding a scratch dict) when no trace is active.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+
+    Yields:
+        dict: The span's attributes; add to it to annotate the span
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield dict(attributes)
+        return
+
+    span_id = _new_id(8)
+    parent_id = _current_span.get()
+    token = _current_span.set(span_id)
+    start_ns = time.time_ns()
+    status = "ok"
+    try:
+        yield attributes
+    except BaseException as e:
+        status = "error"
+        attributes["error"] = repr(e)
+        raise
+    finally:
+        end_ns = time.time_ns()
+        _current_span.reset(token)
+        if attributes.get("ok") is False:
+            status = "error"
+        trace.spans.append({
+            "name": name,
+            "span_id": span_id,
+            "parent_id": parent_id,
+            "start_ns": start_ns,
+            "end_ns": end_ns,
+            "duration_ms": (end_ns - start_ns) / 1e6,
+            "attributes": attributes,
+            "status": status,
+        })
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorate an async function so each call is recorded as a span.
+
+    A boolean return value is stored as the span's "ok" attribute, so steps
+    that report failure by returning False show up as errors.
+
+    Args:
+        name: Span name (defaults to the function name)
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            with span(span_name) as attributes:
+                result = await func(*args, **kwargs)
+                if isinstance(result, bool):
+                    attributes["ok"] = result
+                return result
+
+        return wrapper
+
+    return decorator
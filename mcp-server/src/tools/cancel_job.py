@@ -0,0 +1,45 @@
+"""cancel_job tool implementation.
+
+This tool cancels a queued or running tool call. A queued call leaves the
+queue; a running call is interrupted, and its caller gets an error result.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+
+async def cancel_job_handler(input_data):
+    """Handle cancel_job tool calls.
+
+    Args:
+        input_data: CancelJobInput instance
+
+    Returns:
+        CancelJobOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import CancelJobOutput
+
+    from services.job_scheduler import JobScheduler
+
+    state = JobScheduler.cancel(input_data.job_id)
+    if state is None:
+        return CancelJobOutput(
+            success=False,
+            job_id=input_data.job_id,
+            message=f"No queued or running job {input_data.job_id}. Use list_jobs to see current jobs."
+        )
+
+    return CancelJobOutput(
+        success=True,
+        job_id=input_data.job_id,
+        state=state,
+        message=f"Cancelled {state} job {input_data.job_id}"
+    )
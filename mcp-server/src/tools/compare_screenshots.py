@@ -0,0 +1,118 @@
+"""compare_screenshots tool implementation.
+
+This tool compares a round's screenshots with the customer's TARGET
+screenshots and returns similarity scores, region heatmaps and small
+diff images instead of the full-size PNGs.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import SCREENSHOTS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+async def compare_screenshots_handler(input_data):
+    """Handle compare_screenshots tool calls.
+
+    Steps:
+    1. Validate the customer name and resolve the round (latest round if
+       not given)
+    2. Pair ROUNDXX_YY.png with TARGET_YY.png
+    3. Compare each pair on downscaled copies (in a worker thread)
+    4. Return scores, heatmaps and diff image paths
+
+    Args:
+        input_data: CompareScreenshotsInput instance
+
+    Returns:
+        CompareScreenshotsOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import CompareScreenshotsOutput, ScreenshotComparison
+
+    customer_name = input_data.customer_name
+
+    # Import services and shared tool logic
+    from services.image_diff import ImageComparator
+    from services.round_index import RoundIndex
+    from tools.create_environment import validate_customer_name
+
+    if not validate_customer_name(customer_name):
+        return CompareScreenshotsOutput(
+            success=False,
+            round_number=0,
+            comparisons=[],
+            message=f"Invalid customer name: {customer_name}. Use alphanumeric characters, hyphens, and underscores only."
+        )
+
+    customer_dir = SCREENSHOTS_DIR / customer_name
+
+    try:
+        if not customer_dir.exists():
+            return CompareScreenshotsOutput(
+                success=False,
+                round_number=0,
+                comparisons=[],
+                message=f"No screenshots directory for {customer_name}. Run create_environment first."
+            )
+
+        round_number = input_data.round_number
+        if round_number is None:
+            # Latest round that finished capturing (one in progress may lack files)
+            round_number = RoundIndex.latest_complete(customer_dir) or 0
+
+        if round_number < 1:
+            return CompareScreenshotsOutput(
+                success=False,
+                round_number=0,
+                comparisons=[],
+                message=f"No rounds captured yet for {customer_name}. Run get_screenshots first."
+            )
+
+        logger.info(f"Comparing round {round_number} of {customer_name} with targets")
+
+        # NumPy work is CPU-bound; keep the event loop responsive
+        results = await asyncio.to_thread(
+            ImageComparator.compare_round,
+            customer_name,
+            round_number,
+            input_data.grid_size
+        )
+
+        if not results:
+            return CompareScreenshotsOutput(
+                success=False,
+                round_number=round_number,
+                comparisons=[],
+                message=f"No ROUND{round_number:02d}_YY.png has a matching TARGET_YY.png for {customer_name}."
+            )
+
+        comparisons = [ScreenshotComparison(**result) for result in results]
+        average = sum(c.similarity for c in comparisons) / len(comparisons)
+
+        return CompareScreenshotsOutput(
+            success=True,
+            round_number=round_number,
+            comparisons=comparisons,
+            message=(
+                f"Compared {len(comparisons)} screenshot pairs for round {round_number}. "
+                f"Average similarity: {average:.4f}"
+            )
+        )
+
+    except Exception as e:
+        logger.error(f"Error comparing screenshots: {e}", exc_info=True)
+        return CompareScreenshotsOutput(
+            success=False,
+            round_number=0,
+            comparisons=[],
+            message=f"Error comparing screenshots: {str(e)}"
+        )
@@ -3,6 +3,7 @@
 This tool sets up the development environment for a customer theme.
 """
 
+import asyncio
 import logging
 import re
 import sys
@@ -27,20 +28,47 @@ def validate_customer_name(customer_name: str) -> bool:
     return bool(re.match(pattern, customer_name))
 
 
+async def propose_colors(customer_name: str) -> tuple[list[dict], dict[str, str]]:
+    """Extract the TARGET palette and map it onto theme color paths.
+
+    Args:
+        customer_name: Name of the customer/theme
+
+    Returns:
+        tuple: (palette, suggested colors by dotted theme path); empty if
+            there are no targets or extraction fails
+    """
+    from services.palette_extractor import PaletteExtractor, propose_theme_colors
+
+    try:
+        # Image decoding and clustering are CPU-bound; keep the event loop responsive
+        palette = await asyncio.to_thread(PaletteExtractor.extract_customer_palette, customer_name)
+        if not palette:
+            return [], {}
+
+        suggested_colors = propose_theme_colors(palette)
+        logger.info(f"Suggested theme colors for {customer_name}: {suggested_colors}")
+        return palette, suggested_colors
+
+    except Exception as e:
+        logger.warning(f"Palette extraction failed for {customer_name}: {e}", exc_info=True)
+        return [], {}
+
+
 async def create_environment_handler(input_data):
     """Handle create_environment tool calls.
 
     Steps:
     1. Validate customer name
-    2. Check if environment is already running
-    3. Create theme file
-    4. Create screenshots directory
-    5. Initialize round counter
-    6. Start backend services
-    7. Wait for backend health check
-    8. Start frontend
-    9. Wait for frontend health check
-    10. Return success status
+    2. Create theme file
+    3. Create screenshots directory and move earlier ROUND screenshots
+       into the content-addressed screenshot store
+    4. Initialize round counter
+    5. Extract dominant colors from TARGET screenshots and propose theme colors
+    6. Reattach to running backend/frontend
+    7. Start the others in the background: checkpointed backend containers
+       via `docker start`, otherwise Gradle; frontend against the webpack cache
+    8. Return success status with startup modes and time-to-ready metrics
 
     Args:
         input_data: CreateEnvironmentInput instance
@@ -70,6 +98,7 @@ async def create_environment_handler(input_data):
     # Import services
     from services.theme_manager import ThemeManager
     from services.process_manager import ProcessManager
+    from services.environment_manager import EnvironmentManager
     from services.browser_automation import BrowserAutomation
 
     try:
@@ -86,12 +115,22 @@ async def create_environment_handler(input_data):
         screenshots_dir = str(screenshots_path)
         logger.info(f"Screenshots directory at: {screenshots_dir}")
 
+        # Hash TARGET and ROUND files for find_similar while services start
+        from services.similarity_index import SimilarityIndex
+        SimilarityIndex.schedule_update(screenshots_path)
+
         # 3. Initialize round counter
         current_round = BrowserAutomation.get_next_round_number(screenshots_path)
         logger.info(f"Current round: {current_round}")
 
-        # Check if environment is already running
-        if await ProcessManager.is_environment_running():
+        # 4. Propose theme colors from the TARGET screenshots
+        palette, suggested_colors = await propose_colors(customer_name)
+
+        # 5. Reattach to running services, start the rest (warm standby
+        # when checkpointed, cold otherwise) in the background
+        startup_modes = await EnvironmentManager.start()
+
+        if all(mode == "reattached" for mode in startup_modes.values()):
             logger.warning("Environment is already running")
             return CreateEnvironmentOutput(
                 success=True,
@@ -99,23 +138,17 @@ async def create_environment_handler(input_data):
                 screenshots_dir=screenshots_dir,
                 current_round=current_round,
                 frontend_url=FRONTEND_URL,
-                message=f"Environment already running for {customer_name}. Theme file and screenshots directory verified."
+                message=f"Environment already running for {customer_name}. Theme file and screenshots directory verified.",
+                palette=palette,
+                suggested_colors=suggested_colors,
+                startup_timings=ProcessManager.get_startup_metrics(),
+                startup_modes=startup_modes,
+                standby_time_to_ready=EnvironmentManager.standby_report()
             )
 
-        # 4. Start backend services (async, don't wait for full startup)
-        logger.info("Starting backend services...")
-        # Start the backend process without waiting for health check
-        import asyncio
-        asyncio.create_task(ProcessManager.start_backend())
-        logger.info("Backend services starting in background...")
-
-        # 5. Start frontend (async, don't wait for full startup)
-        logger.info("Starting frontend development server...")
-        asyncio.create_task(ProcessManager.start_frontend())
-        logger.info("Frontend starting in background...")
-
         # Return immediately - services will continue starting
         # The get_screenshots tool will verify they're running before use
+        starting = ", ".join(f"{service} ({mode.replace('_', ' ')})" for service, mode in startup_modes.items())
         return CreateEnvironmentOutput(
             success=True,
             theme_path=theme_path,
@@ -125,9 +158,14 @@ async def create_environment_handler(input_data):
             message=(
                 f"Environment setup initiated for {customer_name}. "
                 f"Theme file and screenshots directory created. "
-                f"Backend and frontend services are starting (this may take 1-2 minutes). "
+                f"Services: {starting}. A cold start may take 1-2 minutes, a warm start seconds. "
                 f"Use get_screenshots to verify services are ready and capture screenshots."
-            )
+            ),
+            palette=palette,
+            suggested_colors=suggested_colors,
+            startup_timings=ProcessManager.get_startup_metrics(),
+            startup_modes=startup_modes,
+            standby_time_to_ready=EnvironmentManager.standby_report()
         )
 
     except Exception as e:
@@ -0,0 +1,97 @@
+"""find_similar tool implementation.
+
+This tool finds the screenshots that look most like a given TARGET or
+ROUND screenshot, using the perceptual-hash index instead of opening
+every image.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import SCREENSHOTS_DIR
+
+logger = logging.getLogger(__name__)
+
+_FILE_REGEX = re.compile(r"[A-Za-z0-9_-]+\.png")
+
+
+async def find_similar_handler(input_data):
+    """Handle find_similar tool calls.
+
+    Steps:
+    1. Validate customer name and file name
+    2. Bring the searched customers' indexes up to date (only changed files
+       are hashed)
+    3. Rank the indexed screenshots by perceptual similarity to the file
+
+    Args:
+        input_data: FindSimilarInput instance
+
+    Returns:
+        FindSimilarOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import FindSimilarOutput
+
+    customer_name = input_data.customer_name
+
+    # Import services and shared tool logic
+    from services.similarity_index import SimilarityIndex
+    from tools.create_environment import validate_customer_name
+
+    def failure(message: str):
+        return FindSimilarOutput(
+            success=False,
+            customer_name=customer_name,
+            file=input_data.file,
+            message=message
+        )
+
+    if not validate_customer_name(customer_name):
+        return failure(f"Invalid customer name: {customer_name}. Use alphanumeric characters, hyphens, and underscores only.")
+
+    if not _FILE_REGEX.fullmatch(input_data.file):
+        return failure(f"Invalid file name: {input_data.file}. Use e.g. TARGET_03.png or ROUND05_03.png.")
+
+    query = SCREENSHOTS_DIR / customer_name / input_data.file
+    if not query.exists():
+        return failure(f"{input_data.file} does not exist for {customer_name}.")
+
+    try:
+        started = time.perf_counter()
+        customers = None if input_data.scope == "all" else [customer_name]
+        matches, searched = await asyncio.to_thread(
+            SimilarityIndex.find_similar, query, customers, input_data.kind, input_data.limit
+        )
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if matches:
+            best = matches[0]
+            message = (
+                f"Closest to {input_data.file}: {best['customer']}/{best['file']} "
+                f"(similarity {best['similarity']:.3f}) of {searched} screenshot(s)"
+            )
+        else:
+            message = f"No other indexed screenshots to compare {input_data.file} with."
+
+        return FindSimilarOutput(
+            success=True,
+            customer_name=customer_name,
+            file=input_data.file,
+            matches=matches,
+            searched=searched,
+            elapsed_ms=elapsed_ms,
+            message=message
+        )
+
+    except Exception as e:
+        logger.error(f"Error finding similar screenshots: {e}", exc_info=True)
+        return failure(f"Error finding similar screenshots: {str(e)}")
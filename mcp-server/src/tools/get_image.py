@@ -0,0 +1,132 @@
+"""get_image tool implementation.
+
+This tool returns a screenshot to the MCP client as an image, downscaled,
+cropped to a named region and re-encoded, so the agent does not have to
+read the full-resolution PNG.
+"""
+
+import asyncio
+import base64
+import logging
+import re
+import sys
+from pathlib import Path
+
+from mcp.types import ImageContent
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import SCREENSHOTS_DIR, DIFFS_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+# Image files of a customer directory (diff images live in its diffs/ subdirectory)
+_FILE_REGEX = re.compile(rf"(?:{DIFFS_DIRNAME}/)?[A-Za-z0-9_-]+\.png")
+
+
+async def render_images(
+    paths: list[Path],
+    max_edge: int,
+    region: str,
+    fmt: str,
+    quality: int
+) -> tuple[list[dict], list[ImageContent]]:
+    """Render images for inline delivery.
+
+    Args:
+        paths: Source images
+        max_edge: Longest edge in pixels
+        region: "full", "header", "form" or "list"
+        fmt: "jpeg", "webp" or "png"
+        quality: JPEG/WebP quality
+
+    Returns:
+        tuple: (per image: file, size, box, bytes and cache_hit; ImageContent list)
+    """
+    from services.image_renderer import ImageRenderer
+
+    renditions = await asyncio.gather(*(
+        asyncio.to_thread(ImageRenderer.render, path, max_edge, region, fmt, quality)
+        for path in paths
+    ))
+
+    details, images = [], []
+    for path, rendition in zip(paths, renditions):
+        details.append({
+            "file": path.name,
+            "width": rendition["width"],
+            "height": rendition["height"],
+            "source_size": rendition["source_size"],
+            "box": rendition["box"],
+            "bytes": rendition["bytes"],
+            "cache_hit": rendition["cache_hit"],
+        })
+        images.append(ImageContent(
+            type="image",
+            data=base64.b64encode(rendition["data"]).decode("ascii"),
+            mimeType=rendition["mime_type"]
+        ))
+    return details, images
+
+
+async def get_image_handler(input_data):
+    """Handle get_image tool calls.
+
+    Steps:
+    1. Validate customer name and file name
+    2. Crop to the region, downscale and encode (or load the cached rendition)
+    3. Return the rendition details and the image
+
+    Args:
+        input_data: GetImageInput instance
+
+    Returns:
+        tuple: (GetImageOutput instance, list of ImageContent)
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import GetImageOutput
+
+    customer_name = input_data.customer_name
+
+    # Import shared tool logic
+    from tools.create_environment import validate_customer_name
+
+    def failure(message: str):
+        return GetImageOutput(success=False, file=input_data.file, message=message), []
+
+    if not validate_customer_name(customer_name):
+        return failure(f"Invalid customer name: {customer_name}. Use alphanumeric characters, hyphens, and underscores only.")
+
+    if not _FILE_REGEX.fullmatch(input_data.file):
+        return failure(f"Invalid file name: {input_data.file}. Use e.g. ROUND03_04.png, TARGET_01.png or diffs/DIFF03_04.png.")
+
+    path = SCREENSHOTS_DIR / customer_name / input_data.file
+    if not path.exists():
+        return failure(f"{input_data.file} does not exist for {customer_name}.")
+
+    try:
+        details, images = await render_images(
+            [path], input_data.max_edge, input_data.region, input_data.format, input_data.quality
+        )
+        detail = details[0]
+        return GetImageOutput(
+            success=True,
+            file=input_data.file,
+            region=input_data.region,
+            width=detail["width"],
+            height=detail["height"],
+            source_size=detail["source_size"],
+            box=detail["box"],
+            bytes=detail["bytes"],
+            cache_hit=detail["cache_hit"],
+            message=(
+                f"{input_data.file} ({input_data.region}) as {detail['width']}x{detail['height']} "
+                f"{input_data.format}, {detail['bytes']} bytes"
+            )
+        ), images
+
+    except Exception as e:
+        logger.error(f"Error rendering {path}: {e}", exc_info=True)
+        return failure(f"Error rendering image: {str(e)}")
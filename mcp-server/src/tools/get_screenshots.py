@@ -3,14 +3,24 @@
 This tool captures UI screenshots for comparison with target designs.
 """
 
+import asyncio
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.constants import SCREENSHOTS_DIR
+from config.constants import (
+    SCREENSHOTS_DIR,
+    BROWSER_POOL_ENABLED,
+    SESSION_REUSE_ENABLED,
+    DETERMINISTIC_CAPTURE,
+    TRACES_DIRNAME,
+    TRACE_PATTERN,
+    TRACE_FORMAT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +30,26 @@ async def get_screenshots_handler(input_data):
 
     Steps:
     1. Verify environment is running
-    2. Determine current round number
-    3. Initialize Playwright browser
+    2. Reserve the next round number in the customer's round index
+    3. Check out a browser context (from the warm browser pool if enabled)
     4. Execute screenshot workflow:
        - Navigate to login page
        - Take screenshot (ROUNDXX_01.png)
-       - Enter credentials and submit
+       - Restore cached session, or enter credentials and submit
        - Wait for main page load
        - Select customer theme
        - Take screenshot (ROUNDXX_02.png)
        - Click "Create Person" button
        - Fill form with random data
        - Take screenshot (ROUNDXX_03.png)
-       - Click Save button
+       - Click Save button (deterministic mode: leave the form unsaved)
        - Wait for list page
        - Take screenshot (ROUNDXX_04.png)
-    5. Close browser
-    6. Return screenshot paths and round number
+    5. Close browser (or park it as a live session when hot_reload or
+       reuse_state is set)
+    6. Record the round's outcome in the round index and schedule the
+       similarity index update
+    7. Return screenshot paths and round number
 
     Args:
         input_data: GetScreenshotsInput instance
@@ -53,7 +66,6 @@ async def get_screenshots_handler(input_data):
     logger.info(f"Capturing screenshots for customer: {customer_name}")
 
     # Import services
-    from services.browser_automation import BrowserAutomation
     from services.process_manager import ProcessManager
 
     try:
@@ -67,43 +79,223 @@ async def get_screenshots_handler(input_data):
                 message="Environment is not running. Please create environment first using create_environment tool."
             )
 
-        # 2. Determine current round number
+        return await capture_customer_round(
+            customer_name,
+            hot_reload=input_data.hot_reload,
+            reuse_state=input_data.reuse_state
+        )
+
+    except Exception as e:
+        logger.error(f"Error capturing screenshots: {e}", exc_info=True)
+        return GetScreenshotsOutput(
+            success=False,
+            round_number=0,
+            screenshots=[],
+            screenshots_dir="",
+            message=f"Error capturing screenshots: {str(e)}"
+        )
+
+
+async def capture_customer_round(
+    customer_name: str,
+    hot_reload: bool = False,
+    reuse_state: bool = False
+):
+    """Capture one screenshot round for a customer in its own browser context.
+
+    Assumes the environment is already running. Used by get_screenshots and
+    get_screenshots_batch.
+
+    With hot_reload, the current theme file is pushed into the customer's
+    live session and the parked pages are re-captured in place. Without a
+    live session the full workflow runs and its browser is parked afterwards.
+
+    reuse_state additionally parks a page at the filled, unsaved person
+    form, so later rounds re-capture ROUNDXX_03 and ROUNDXX_04 from the
+    parked states without creating another person in the backend.
+
+    Every step is recorded as a timing span; the trace is written to
+    screenshots/<customer>/traces/ROUNDXX.trace.json (or .jsonl) and
+    summarized in the output.
+
+    The round number is reserved in the customer's round index before
+    capturing, so concurrent calls get distinct rounds; the outcome,
+    screenshot hashes and theme revision are recorded there afterwards.
+    The customer's similarity index is then updated in the background.
+
+    Args:
+        customer_name: Name of the customer/theme
+        hot_reload: Re-capture from the live session instead of a full run
+        reuse_state: Like hot_reload, with the form state parked as well
+
+    Returns:
+        GetScreenshotsOutput instance
+    """
+    from server import GetScreenshotsOutput
+    from services.round_index import RoundIndex, theme_revision
+    from services.screenshot_store import ScreenshotStore
+    from services.similarity_index import SimilarityIndex
+    from services.theme_manager import ThemeManager
+    from services.tracing import start_trace
+
+    # 2. Reserve the round number
+    screenshots_path = SCREENSHOTS_DIR / customer_name
+    revision = theme_revision(ThemeManager.get_theme_path(customer_name))
+    try:
+        round_number = await asyncio.to_thread(
+            RoundIndex.allocate, screenshots_path,
+            theme_revision=revision, hot_reload=hot_reload, reuse_state=reuse_state
+        )
+    except Exception as e:
+        logger.error(f"Could not allocate a round for {customer_name}: {e}", exc_info=True)
+        return GetScreenshotsOutput(
+            success=False,
+            round_number=0,
+            screenshots=[],
+            screenshots_dir="",
+            message=f"Error allocating screenshot round: {str(e)}"
+        )
+
+    with start_trace("get_screenshots", customer=customer_name, round=round_number) as trace:
+        result = await _capture_round(customer_name, round_number, hot_reload, reuse_state)
+
+    trace_path = trace.export(
+        screenshots_path / TRACES_DIRNAME / TRACE_PATTERN.format(round_number),
+        TRACE_FORMAT
+    )
+    result.trace_file = str(trace_path) if trace_path else None
+    result.trace_summary = trace.summary()
+
+    try:
+        screenshots = [
+            {"name": Path(path).name, "sha256": ScreenshotStore.digest_of(Path(path))}
+            for path in result.screenshots
+        ]
+        await asyncio.to_thread(
+            RoundIndex.finish, screenshots_path, round_number, result.success, screenshots,
+            trace_file=result.trace_file, message=result.message
+        )
+    except Exception as e:
+        logger.warning(f"Could not record round {round_number} of {customer_name}: {e}")
+
+    if result.success:
+        SimilarityIndex.schedule_update(screenshots_path)
+
+    return result
+
+
+def _nondeterministic_reason(automation) -> Optional[str]:
+    """Why a finished workflow's screenshots are not reproducible (None if they are)."""
+    if not automation.deterministic:
+        return "DETERMINISTIC_CAPTURE is off, so a random person is saved and the list grows every round"
+    return None
+
+
+async def _capture_round(customer_name: str, round_number: int, hot_reload: bool, reuse_state: bool):
+    """Run one round for capture_customer_round (see there)."""
+    from server import GetScreenshotsOutput
+    from services.browser_automation import BrowserAutomation
+    from services.live_session import LiveSessionManager
+
+    try:
         screenshots_path = SCREENSHOTS_DIR / customer_name
-        screenshots_path.mkdir(parents=True, exist_ok=True)
-        round_number = BrowserAutomation.get_next_round_number(screenshots_path)
         screenshots_dir = str(screenshots_path)
 
-        logger.info(f"Starting screenshot capture for round {round_number}")
+        keep_live = hot_reload or reuse_state
+        required_states = frozenset({3, 4}) if reuse_state else frozenset({4})
+
+        if keep_live:
+            screenshot_paths = await LiveSessionManager.recapture(
+                customer_name, round_number, required_states
+            )
+            if screenshot_paths is not None:
+                session = LiveSessionManager.get(customer_name)
+                readiness = session.automation.readiness if session else None
+                # The parked pages are re-captured as they are; nothing is written
+                deterministic = bool(session and session.automation.deterministic)
+                return GetScreenshotsOutput(
+                    success=True,
+                    round_number=round_number,
+                    screenshots=screenshot_paths,
+                    screenshots_dir=screenshots_dir,
+                    message=(
+                        f"Re-captured {len(screenshot_paths)} screenshots for round "
+                        f"{round_number} from the live session"
+                    ),
+                    wait_timings=readiness.summary() if readiness else {},
+                    deterministic=deterministic,
+                    nondeterministic_reason=None if deterministic else "DETERMINISTIC_CAPTURE is off"
+                )
+            logger.info(f"No usable live session for {customer_name}, running full workflow")
+
+        # A full run captures fresh state; drop any stale live session
+        await LiveSessionManager.close(customer_name)
+
+        logger.info(f"Starting screenshot capture for {customer_name}, round {round_number}")
 
         # 3. Run browser automation workflow
-        async with BrowserAutomation() as automation:
+        automation = BrowserAutomation(
+            use_pool=BROWSER_POOL_ENABLED,
+            reuse_session=SESSION_REUSE_ENABLED,
+            deterministic=DETERMINISTIC_CAPTURE
+        )
+        parked = False
+        try:
+            await automation.setup_browser()
             success, screenshot_paths = await automation.run_screenshot_workflow(
                 customer_name=customer_name,
                 round_number=round_number
             )
 
+            wait_timings = automation.readiness.summary() if automation.readiness else {}
+
             if not success:
                 return GetScreenshotsOutput(
                     success=False,
                     round_number=round_number,
                     screenshots=screenshot_paths,
                     screenshots_dir=screenshots_dir,
-                    message=f"Screenshot workflow failed. Captured {len(screenshot_paths)}/4 screenshots."
+                    message=f"Screenshot workflow failed. Captured {len(screenshot_paths)}/4 screenshots.",
+                    wait_timings=wait_timings
                 )
 
+            # Keep the list view (and with reuse_state the unsaved form) open
+            # for in-place re-captures of later rounds
+            if keep_live and automation.page:
+                pages = {4: automation.page}
+                if reuse_state:
+                    form_page = await automation.open_form_state()
+                    if form_page:
+                        pages[3] = form_page
+                await LiveSessionManager.park(customer_name, automation, pages)
+                parked = True
+
+            reason = _nondeterministic_reason(automation)
+            message = f"Successfully captured {len(screenshot_paths)} screenshots for round {round_number}"
+            if reason:
+                message += f" (not reproducible: {reason})"
+                logger.warning(f"Round {round_number} of {customer_name} is not reproducible: {reason}")
+
             return GetScreenshotsOutput(
                 success=True,
                 round_number=round_number,
                 screenshots=screenshot_paths,
                 screenshots_dir=screenshots_dir,
-                message=f"Successfully captured {len(screenshot_paths)} screenshots for round {round_number}"
+                message=message,
+                wait_timings=wait_timings,
+                deterministic=reason is None,
+                nondeterministic_reason=reason
             )
 
+        finally:
+            if not parked:
+                await automation.close_browser()
+
     except Exception as e:
-        logger.error(f"Error capturing screenshots: {e}", exc_info=True)
+        logger.error(f"Error capturing screenshots for {customer_name}: {e}", exc_info=True)
         return GetScreenshotsOutput(
             success=False,
-            round_number=0,
+            round_number=round_number,
             screenshots=[],
             screenshots_dir="",
             message=f"Error capturing screenshots: {str(e)}"
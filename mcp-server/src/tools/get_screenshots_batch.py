@@ -0,0 +1,98 @@
+"""get_screenshots_batch tool implementation.
+
+This tool captures screenshot rounds for several customers concurrently,
+one isolated browser context per theme.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+
+async def get_screenshots_batch_handler(input_data):
+    """Handle get_screenshots_batch tool calls.
+
+    Steps:
+    1. Validate customer names
+    2. Verify environment is running
+    3. Capture one round per customer, at most max_concurrency at a time
+    4. Return per-customer results and total wall time
+
+    Args:
+        input_data: GetScreenshotsBatchInput instance
+
+    Returns:
+        GetScreenshotsBatchOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import GetScreenshotsBatchOutput
+
+    # Preserve order but capture each customer only once
+    customer_names = list(dict.fromkeys(input_data.customer_names))
+    max_concurrency = input_data.max_concurrency
+
+    # Import services and shared tool logic
+    from services.process_manager import ProcessManager
+    from tools.create_environment import validate_customer_name
+    from tools.get_screenshots import capture_customer_round
+
+    invalid = [name for name in customer_names if not validate_customer_name(name)]
+    if invalid:
+        return GetScreenshotsBatchOutput(
+            success=False,
+            results={},
+            elapsed_seconds=0.0,
+            message=f"Invalid customer names: {', '.join(invalid)}. Use alphanumeric characters, hyphens, and underscores only."
+        )
+
+    logger.info(f"Capturing screenshots for {len(customer_names)} customers (concurrency: {max_concurrency})")
+
+    try:
+        if not await ProcessManager.is_environment_running():
+            return GetScreenshotsBatchOutput(
+                success=False,
+                results={},
+                elapsed_seconds=0.0,
+                message="Environment is not running. Please create environment first using create_environment tool."
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def capture(customer_name: str):
+            async with semaphore:
+                return await capture_customer_round(customer_name)
+
+        started = time.perf_counter()
+        outputs = await asyncio.gather(*(capture(name) for name in customer_names))
+        elapsed = round(time.perf_counter() - started, 2)
+
+        results = dict(zip(customer_names, outputs))
+        failed = [name for name, output in results.items() if not output.success]
+
+        return GetScreenshotsBatchOutput(
+            success=not failed,
+            results=results,
+            elapsed_seconds=elapsed,
+            message=(
+                f"Captured rounds for {len(customer_names) - len(failed)}/{len(customer_names)} customers "
+                f"in {elapsed}s"
+                + (f". Failed: {', '.join(failed)}" if failed else "")
+            )
+        )
+
+    except Exception as e:
+        logger.error(f"Error capturing screenshot batch: {e}", exc_info=True)
+        return GetScreenshotsBatchOutput(
+            success=False,
+            results={},
+            elapsed_seconds=0.0,
+            message=f"Error capturing screenshot batch: {str(e)}"
+        )
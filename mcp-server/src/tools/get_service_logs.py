@@ -0,0 +1,82 @@
+"""get_service_logs tool implementation.
+
+This tool returns recent output of the backend and frontend processes
+from the in-memory buffer of their log pumps.
+"""
+
+import logging
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+
+async def get_service_logs_handler(input_data):
+    """Handle get_service_logs tool calls.
+
+    Steps:
+    1. Look up the log pump of the requested service
+    2. Tail the buffered lines, filtered by pattern and stream
+    3. Return the lines and the path of the full log file
+
+    Args:
+        input_data: GetServiceLogsInput instance
+
+    Returns:
+        GetServiceLogsOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import GetServiceLogsOutput
+
+    service = input_data.service
+
+    # Import services
+    from services.process_manager import ProcessManager
+
+    pump = ProcessManager.get_log_pump(service)
+    if pump is None:
+        return GetServiceLogsOutput(
+            success=False,
+            service=service,
+            lines=[],
+            buffered_lines=0,
+            total_lines=0,
+            log_file=None,
+            message=(
+                f"No output captured for {service}. Logs are only available for "
+                f"services started by create_environment in this server process."
+            )
+        )
+
+    try:
+        lines = pump.tail(
+            lines=input_data.lines,
+            pattern=input_data.pattern,
+            ignore_case=input_data.ignore_case,
+            stream=input_data.stream
+        )
+    except re.error as e:
+        return GetServiceLogsOutput(
+            success=False,
+            service=service,
+            lines=[],
+            buffered_lines=len(pump.lines),
+            total_lines=pump.total_lines,
+            log_file=str(pump.log_path),
+            message=f"Invalid pattern: {str(e)}"
+        )
+
+    return GetServiceLogsOutput(
+        success=True,
+        service=service,
+        lines=lines,
+        buffered_lines=len(pump.lines),
+        total_lines=pump.total_lines,
+        log_file=str(pump.log_path) if pump.log_path.exists() else None,
+        message=f"Returned {len(lines)} of {len(pump.lines)} buffered {service} lines"
+    )
@@ -0,0 +1,44 @@
+"""list_jobs tool implementation.
+
+This tool shows the scheduler's running and queued tool calls and the
+recently finished ones.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+
+async def list_jobs_handler(input_data):
+    """Handle list_jobs tool calls.
+
+    Args:
+        input_data: ListJobsInput instance
+
+    Returns:
+        ListJobsOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import ListJobsOutput
+
+    from services.job_scheduler import JobScheduler
+
+    jobs = JobScheduler.jobs()
+    if input_data.state:
+        jobs = [job for job in jobs if job["state"] == input_data.state]
+    stats = JobScheduler.stats()
+
+    return ListJobsOutput(
+        success=True,
+        running=stats["running"],
+        queued=stats["queued"],
+        max_concurrency=stats["max_concurrency"],
+        jobs=jobs,
+        message=f"{stats['running']} running, {stats['queued']} queued (max {stats['max_concurrency']} at once)"
+    )
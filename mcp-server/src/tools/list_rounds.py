@@ -0,0 +1,86 @@
+"""list_rounds tool implementation.
+
+This tool returns the round metadata recorded in a customer's round index
+without touching the screenshot files.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import SCREENSHOTS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+async def list_rounds_handler(input_data):
+    """Handle list_rounds tool calls.
+
+    Steps:
+    1. Validate customer name
+    2. Read the customer's round index (rebuilt from the ROUND file names
+       if it does not exist yet)
+    3. Filter by status and limit to the most recent rounds
+
+    Args:
+        input_data: ListRoundsInput instance
+
+    Returns:
+        ListRoundsOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import ListRoundsOutput
+
+    customer_name = input_data.customer_name
+
+    # Import services and shared tool logic
+    from services.round_index import RoundIndex
+    from tools.create_environment import validate_customer_name
+
+    if not validate_customer_name(customer_name):
+        return ListRoundsOutput(
+            success=False,
+            customer_name=customer_name,
+            next_round=0,
+            message=f"Invalid customer name: {customer_name}. Use alphanumeric characters, hyphens, and underscores only."
+        )
+
+    customer_dir = SCREENSHOTS_DIR / customer_name
+    if not customer_dir.exists():
+        return ListRoundsOutput(
+            success=False,
+            customer_name=customer_name,
+            next_round=0,
+            message=f"No screenshots directory for {customer_name}. Run create_environment first."
+        )
+
+    try:
+        rounds = await asyncio.to_thread(RoundIndex.list_rounds, customer_dir)
+        next_round = await asyncio.to_thread(RoundIndex.next_round, customer_dir)
+
+        if input_data.status:
+            rounds = [entry for entry in rounds if entry.get("status") == input_data.status]
+        if input_data.limit:
+            rounds = rounds[-input_data.limit:]
+
+        return ListRoundsOutput(
+            success=True,
+            customer_name=customer_name,
+            next_round=next_round,
+            rounds=rounds,
+            message=f"{len(rounds)} round(s) for {customer_name}; next round is {next_round}"
+        )
+
+    except Exception as e:
+        logger.error(f"Error listing rounds: {e}", exc_info=True)
+        return ListRoundsOutput(
+            success=False,
+            customer_name=customer_name,
+            next_round=0,
+            message=f"Error listing rounds: {str(e)}"
+        )
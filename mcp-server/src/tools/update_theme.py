@@ -0,0 +1,112 @@
+"""update_theme tool implementation.
+
+This tool applies incremental patches to a customer's theme file instead
+of having the agent rewrite the whole file.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import SCREENSHOTS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+async def update_theme_handler(input_data):
+    """Handle update_theme tool calls.
+
+    Steps:
+    1. Validate customer name and theme file
+    2. Determine the round the changes belong to (the next round to capture)
+    3. Apply all patches atomically, validating touched subtrees against default.json
+    4. Append applied changes to the round's patch log
+    5. Return the applied changes
+
+    Args:
+        input_data: UpdateThemeInput instance
+
+    Returns:
+        UpdateThemeOutput instance
+    """
+    # Import output schema
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from server import UpdateThemeOutput
+
+    customer_name = input_data.customer_name
+
+    # Import services and shared tool logic
+    from services.browser_automation import BrowserAutomation
+    from services.theme_manager import ThemeManager
+    from tools.create_environment import validate_customer_name
+
+    if not validate_customer_name(customer_name):
+        return UpdateThemeOutput(
+            success=False,
+            theme_path="",
+            round_number=0,
+            applied=[],
+            warnings=[],
+            patch_log=None,
+            message=f"Invalid customer name: {customer_name}. Use alphanumeric characters, hyphens, and underscores only."
+        )
+
+    try:
+        if not ThemeManager.theme_exists(customer_name):
+            return UpdateThemeOutput(
+                success=False,
+                theme_path="",
+                round_number=0,
+                applied=[],
+                warnings=[],
+                patch_log=None,
+                message=f"Theme file for {customer_name} does not exist. Run create_environment first."
+            )
+
+        # Edits show up in the next captured round
+        round_number = BrowserAutomation.get_next_round_number(SCREENSHOTS_DIR / customer_name)
+
+        patches = [patch.model_dump(exclude_unset=True) for patch in input_data.patches]
+        result = ThemeManager.update_theme(customer_name, patches, round_number)
+
+        applied = result["applied"]
+        return UpdateThemeOutput(
+            success=True,
+            theme_path=result["theme_path"],
+            round_number=round_number,
+            applied=applied,
+            warnings=result["warnings"],
+            patch_log=result["patch_log"],
+            message=(
+                f"Applied {len(applied)} change(s) to {customer_name} theme for round {round_number}"
+                if applied else
+                "No values changed; theme file left untouched"
+            )
+        )
+
+    except ValueError as e:
+        logger.warning(f"Rejected theme patch for {customer_name}: {e}")
+        return UpdateThemeOutput(
+            success=False,
+            theme_path=str(ThemeManager.get_theme_path(customer_name)),
+            round_number=0,
+            applied=[],
+            warnings=[],
+            patch_log=None,
+            message=f"Patch rejected, theme unchanged: {str(e)}"
+        )
+
+    except Exception as e:
+        logger.error(f"Error updating theme: {e}", exc_info=True)
+        return UpdateThemeOutput(
+            success=False,
+            theme_path="",
+            round_number=0,
+            applied=[],
+            warnings=[],
+            patch_log=None,
+            message=f"Error updating theme: {str(e)}"
+        )
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Link existing ROUND screenshots to the content-addressed store.
+
+New captures are stored on save. Screenshots captured before the store
+existed stay separate files until this script links them to it, so
+identical ones share one object. TARGET files and ROUND files tracked by
+git are left alone.
+
+Usage:
+    python store_screenshots.py              # every customer
+    python store_screenshots.py acme globex  # only these customers
+    python store_screenshots.py --gc         # also delete unused objects
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from config.constants import SCREENSHOTS_DIR, SCREENSHOT_STORE_DIRNAME
+from services.screenshot_store import ScreenshotStore
+from tools.create_environment import validate_customer_name
+
+
+def main():
+    """Link the screenshots of the given (or all) customers to the store."""
+    args = [arg for arg in sys.argv[1:] if arg != "--gc"]
+    for name in args:
+        if not validate_customer_name(name):
+            print(f"Invalid customer name: {name}")
+            sys.exit(1)
+
+    if args:
+        customer_dirs = [SCREENSHOTS_DIR / name for name in args]
+    else:
+        customer_dirs = sorted(
+            path for path in SCREENSHOTS_DIR.iterdir()
+            if path.is_dir() and path.name != SCREENSHOT_STORE_DIRNAME
+        )
+
+    for customer_dir in customer_dirs:
+        linked = ScreenshotStore.ingest_directory(customer_dir)
+        print(f"{customer_dir.name}: {linked} screenshots linked to the store")
+
+    if "--gc" in sys.argv[1:]:
+        print(f"Removed {ScreenshotStore.garbage_collect()} unused objects")
+
+    stats = ScreenshotStore.stats()
+    print(f"Store: {stats['objects']} objects, {stats['stored_bytes']} bytes "
+          f"for {stats['screenshots']} screenshots ({stats['logical_bytes']} bytes)")
+
+
+if __name__ == "__main__":
+    main()
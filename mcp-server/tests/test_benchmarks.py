@@ -0,0 +1,78 @@
+"""Tests for the benchmark helpers and the stand-in A12 app."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from benchmarks.run_benchmarks import percentile, summarize, compare_to_baseline
+from benchmarks.stub_frontend import StubFrontend
+
+
+class TestBenchmarkStatistics:
+    """Test suite for percentiles and baseline comparison."""
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate linearly between ranks."""
+        values = [40.0, 10.0, 30.0, 20.0]
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 50) == 25.0
+        assert percentile(values, 100) == 40.0
+        assert percentile([], 50) == 0.0
+
+    def test_summarize(self):
+        """Summaries report count, spread and percentiles."""
+        stats = summarize([float(i) for i in range(1, 101)])
+        assert stats["n"] == 100
+        assert stats["min"] == 1.0 and stats["max"] == 100.0
+        assert stats["p50"] == 50.5
+        assert stats["p99"] == pytest.approx(99.01)
+        assert summarize([]) == {"n": 0}
+
+    def test_compare_to_baseline(self):
+        """Only medians slower by both the relative and absolute margin regress."""
+        baseline = {
+            "get_screenshots": summarize([1000.0]),
+            "round_scan": summarize([1.0]),
+            "theme_validation": summarize([10.0]),
+        }
+        results = {
+            "get_screenshots": summarize([1400.0]),  # +40%, +400 ms
+            "round_scan": summarize([2.0]),          # +100%, but only +1 ms
+            "theme_validation": summarize([11.0]),   # +10%
+            "new_case": summarize([5.0]),            # no baseline
+        }
+
+        regressions = compare_to_baseline(results, baseline, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("get_screenshots: p50 1400.0 ms")
+
+
+class TestStubFrontend:
+    """Test suite for the stand-in app's HTTP endpoints."""
+
+    def test_serves_app_themes_and_api(self, tmp_path):
+        """The app page, runtime themes and person API respond like the real app."""
+        (tmp_path / "arctic-light.json").write_text(json.dumps({"colors": {"primaryColor": "#fff"}}))
+        stub = StubFrontend(tmp_path)
+
+        async def scenario():
+            async with TestClient(TestServer(stub.create_app())) as client:
+                page = await (await client.get("/persons/1")).text()
+                themes = await (await client.get("/themes.json")).json()
+                created = await client.post("/api/persons", data=json.dumps({"FirstName": "Ada"}))
+                persons = await (await client.get("/api/persons")).json()
+                return page, themes, created.status, persons
+
+        page, themes, status, persons = asyncio.run(scenario())
+
+        assert 'class: "header-trigger"' in page and '"aria-label": "Add"' in page
+        assert themes == {"Arctic Light": {"colors": {"primaryColor": "#fff"}}}
+        assert status == 201
+        assert persons == [{"FirstName": "Ada"}]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""Tests for browser_automation's form driver and deterministic mode."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.browser_automation import BrowserAutomation, _FILL_FORM_SCRIPT, _READ_FORM_SCRIPT
+from src.services.person_fixtures import fixture_persons
+
+
+class StubField:
+    def __init__(self, page, prefix):
+        self.page = page
+        self.prefix = prefix
+
+    async def fill(self, value):
+        self.page.typed.append(self.prefix)
+        self.page.values[self.prefix] = value
+
+    async def input_value(self):
+        return self.page.values.get(self.prefix, "")
+
+
+class StubLocator:
+    def __init__(self, field):
+        self.first = field
+
+
+class StubPage:
+    """Form that ignores the batch fill for some fields and lacks others."""
+
+    def __init__(self, ignored=(), missing=()):
+        self.ignored = set(ignored)
+        self.missing = set(missing)
+        self.values = {}
+        self.typed = []
+        self.evaluations = []
+
+    async def evaluate(self, script, arg):
+        self.evaluations.append(script)
+        if script == _FILL_FORM_SCRIPT:
+            for prefix, value in arg:
+                if prefix not in self.ignored | self.missing:
+                    self.values[prefix] = value
+            return None
+        assert script == _READ_FORM_SCRIPT
+        return {prefix: self.values.get(prefix, "") for prefix in arg if prefix not in self.missing}
+
+    def locator(self, selector):
+        prefix = selector.split('"')[1]
+        return StubLocator(StubField(self, prefix))
+
+
+class StubReadiness:
+    async def wait_for_selector(self, step, selector, state="visible", timeout=None):
+        return True
+
+    async def wait_for_dom_stable(self, step, quiet_ms=None, timeout=None):
+        return True
+
+
+def _fill(page):
+    automation = BrowserAutomation(deterministic=True)
+    automation.page = page
+    automation.readiness = StubReadiness()
+    return asyncio.run(automation.fill_person_form())
+
+
+class TestFillPersonForm:
+    """Test suite for filling the person form."""
+
+    def test_one_batch_and_one_read_back(self):
+        """All fields are set by one evaluate and verified by another; nothing is typed."""
+        page = StubPage()
+
+        assert _fill(page) is True
+        assert page.evaluations == [_FILL_FORM_SCRIPT, _READ_FORM_SCRIPT]
+        assert page.typed == []
+        data = fixture_persons(1)[0]["Person"]["PersonalData"]
+        assert page.values["a12-FirstName"] == data["FirstName"]
+        assert page.values["a12-Nationality"] == data["Nationality"]
+
+    def test_fields_that_did_not_take_the_value_are_typed(self):
+        """Only fields the batch could not set fall back to the keyboard."""
+        page = StubPage(ignored=["a12-EmailAddress"], missing=["a12-PlaceOfBirth"])
+
+        assert _fill(page) is True
+        assert page.typed == ["a12-EmailAddress"]
+        assert page.values["a12-EmailAddress"] == fixture_persons(1)[0]["Person"]["PersonalData"]["EmailAddress"]
+
+    def test_no_field_filled(self):
+        """A form without any of the fields fails."""
+        prefixes = ["a12-FirstName", "a12-LastName", "a12-EmailAddress",
+                    "a12-DateOfBirth", "a12-PlaceOfBirth", "a12-Nationality"]
+        assert _fill(StubPage(missing=prefixes)) is False
+
+
+class StubClock:
+    def __init__(self):
+        self.calls = []
+
+    async def install(self, time=None):
+        self.calls.append(("install", time))
+
+    async def set_fixed_time(self, time):
+        self.calls.append(("set_fixed_time", time))
+
+
+class StubContext:
+    def __init__(self):
+        self.clock = StubClock()
+        self.init_scripts = 0
+
+    async def add_init_script(self, script=None):
+        self.init_scripts += 1
+
+    async def new_page(self):
+        return SimpleNamespace(set_default_timeout=lambda timeout: None)
+
+
+class TestDeterministicMode:
+    """Test suite for deterministic rounds."""
+
+    def test_clock_is_frozen(self, monkeypatch):
+        """The page clock is installed and fixed, not just started at a set time."""
+        context = StubContext()
+
+        async def new_context(**options):
+            return context
+
+        monkeypatch.setattr("src.services.browser_automation.BrowserPool.new_context", new_context)
+        automation = BrowserAutomation(use_pool=True, deterministic=True)
+        asyncio.run(automation.setup_browser())
+
+        (_, installed), (call, fixed) = context.clock.calls
+        assert call == "set_fixed_time" and fixed == installed
+
+    def test_form_is_not_saved(self, monkeypatch, tmp_path):
+        """A deterministic round leaves the form unsaved; a normal one saves it."""
+        monkeypatch.setattr("src.services.browser_automation.SCREENSHOTS_DIR", tmp_path)
+
+        def workflow(deterministic):
+            steps = []
+            automation = BrowserAutomation(deterministic=deterministic)
+            automation.readiness = StubReadiness()
+            automation.readiness.wait_for_network_idle = automation.readiness.wait_for_dom_stable
+
+            async def step(*args, name=None):
+                steps.append(name)
+                return True
+
+            for name in ("preselect_theme", "navigate_to_login", "ensure_logged_in", "select_theme",
+                         "create_new_person", "fill_person_form", "save_and_return", "return_to_list"):
+                monkeypatch.setattr(automation, name, lambda *args, name=name: step(name=name))
+
+            async def capture(path, *args, **kwargs):
+                return True
+
+            monkeypatch.setattr(automation, "capture_screenshot", capture)
+            success, screenshots = asyncio.run(automation.run_screenshot_workflow("acme", 1))
+            assert success and len(screenshots) == 2
+            return steps
+
+        deterministic = workflow(True)
+        assert "save_and_return" not in deterministic and "return_to_list" in deterministic
+        assert "save_and_return" in workflow(False)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,128 @@
+"""Tests for browser_pool service."""
+
+import asyncio
+
+import pytest
+
+from src.services.browser_pool import BrowserPool
+
+
+class StubContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class StubBrowser:
+    """Browser that hands out stub contexts and can be made to crash."""
+
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+        self.handlers = {}
+
+    def is_connected(self):
+        return self.connected
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def new_context(self, **options):
+        if not self.connected:
+            raise RuntimeError("Target closed")
+        context = StubContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+    def crash(self):
+        self.connected = False
+        self.handlers["disconnected"](self)
+
+
+class StubPlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+
+    async def launch(self, **options):
+        browser = StubBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    """Fresh pool state on a stub Playwright."""
+    stub = StubPlaywright()
+    monkeypatch.setattr("src.services.browser_pool.async_playwright", lambda: stub)
+    monkeypatch.setattr("src.services.browser_pool.BROWSER_POOL_MAX_USES", 3)
+    state = {
+        "_playwright": None, "_current": None, "_retired": [], "_contexts": {},
+        "_lock": None, "_launch_count": 0,
+    }
+    for attribute, value in state.items():
+        monkeypatch.setattr(BrowserPool, attribute, value)
+    return stub
+
+
+class TestBrowserPool:
+    """Test suite for the warm browser pool."""
+
+    def test_checkout_and_return(self, playwright):
+        """Contexts come from one warm browser and are closed on release."""
+        async def scenario():
+            first = await BrowserPool.new_context()
+            await BrowserPool.release_context(first)
+            second = await BrowserPool.new_context()
+            stats = BrowserPool.stats()
+            await BrowserPool.release_context(second)
+            return first, stats
+
+        first, stats = asyncio.run(scenario())
+
+        assert len(playwright.browsers) == 1
+        assert first.closed
+        assert stats == {"running": True, "launches": 1, "uses": 2, "active_contexts": 1, "retired_browsers": 0}
+
+    def test_recycled_after_max_uses(self, playwright):
+        """A browser is retired at the use limit and closed once its contexts are returned."""
+        async def scenario():
+            contexts = [await BrowserPool.new_context() for _ in range(3)]
+            retired_open = playwright.browsers[0].connected
+            for context in contexts:
+                await BrowserPool.release_context(context)
+            await BrowserPool.release_context(await BrowserPool.new_context())
+            return retired_open
+
+        assert asyncio.run(scenario()) is True
+        assert len(playwright.browsers) == 2
+        assert not playwright.browsers[0].connected
+        assert BrowserPool.stats()["retired_browsers"] == 0
+
+    def test_relaunch_after_crash(self, playwright):
+        """A crashed browser is replaced on the next checkout."""
+        async def scenario():
+            await BrowserPool.release_context(await BrowserPool.new_context())
+            playwright.browsers[0].crash()
+            return await BrowserPool.new_context()
+
+        context = asyncio.run(scenario())
+
+        assert len(playwright.browsers) == 2
+        assert context in playwright.browsers[1].contexts
+        assert BrowserPool.stats()["launches"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
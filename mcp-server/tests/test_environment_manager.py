@@ -0,0 +1,75 @@
+"""Tests for environment_manager service."""
+
+import asyncio
+
+import pytest
+
+from src.services import environment_manager
+from src.services.environment_manager import EnvironmentManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """EnvironmentManager with its checkpoint in a temp dir and no real processes."""
+    monkeypatch.setattr(environment_manager, "ENVIRONMENT_CHECKPOINT_FILE", tmp_path / "environment.json")
+    monkeypatch.setattr(environment_manager, "WEBPACK_CACHE_DIR", tmp_path / "webpack")
+    spawned = []
+    monkeypatch.setattr(EnvironmentManager, "_spawn", classmethod(lambda cls, coro: spawned.append(coro.close())))
+    return spawned
+
+
+def _health(monkeypatch, backend, frontend):
+    async def backend_check():
+        return backend
+
+    async def frontend_check():
+        return frontend
+
+    monkeypatch.setattr(environment_manager.ProcessManager, "is_backend_healthy", backend_check)
+    monkeypatch.setattr(environment_manager.ProcessManager, "is_frontend_healthy", frontend_check)
+
+
+class TestEnvironmentManager:
+    """Test suite for warm-standby startup decisions."""
+
+    def test_reattaches_running_services(self, manager, monkeypatch):
+        """Healthy services are reused without starting anything."""
+        _health(monkeypatch, True, True)
+
+        modes = asyncio.run(EnvironmentManager.start())
+
+        assert modes == {"backend": "reattached", "frontend": "reattached"}
+        assert manager == []
+
+    def test_warm_start_from_checkpointed_containers(self, manager, monkeypatch):
+        """Checkpointed containers that still exist are restarted warm."""
+        _health(monkeypatch, False, False)
+        EnvironmentManager.save_checkpoint({"backend": {"containers": ["ai-theming_server", "gone"]}})
+
+        async def containers():
+            return {"ai-theming_server": "exited"}
+
+        monkeypatch.setattr(EnvironmentManager, "list_backend_containers", staticmethod(containers))
+
+        modes = asyncio.run(EnvironmentManager.start())
+
+        assert modes == {"backend": "warm_start", "frontend": "cold_start"}
+        assert len(manager) == 2
+
+    def test_cold_start_without_checkpoint(self, manager, monkeypatch, tmp_path):
+        """Without a checkpoint the backend starts cold; a webpack cache makes the frontend warm."""
+        _health(monkeypatch, False, False)
+        (tmp_path / "webpack").mkdir()
+
+        async def containers():
+            return {"ai-theming_server": "exited"}
+
+        monkeypatch.setattr(EnvironmentManager, "list_backend_containers", staticmethod(containers))
+
+        modes = asyncio.run(EnvironmentManager.start())
+
+        assert modes == {"backend": "cold_start", "frontend": "warm_start"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,25 @@
+"""Tests for the get_screenshots tool's reproducibility report."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools.get_screenshots import _nondeterministic_reason
+
+
+class TestNondeterministicReason:
+    """Test suite for reporting non-reproducible rounds."""
+
+    def test_deterministic_round(self):
+        """A deterministic round writes nothing and is reproducible."""
+        assert _nondeterministic_reason(SimpleNamespace(deterministic=True)) is None
+
+    def test_mode_off(self):
+        """Without deterministic mode a saved person makes the list grow."""
+        reason = _nondeterministic_reason(SimpleNamespace(deterministic=False))
+        assert reason.startswith("DETERMINISTIC_CAPTURE is off")
+        assert "list grows" in reason
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
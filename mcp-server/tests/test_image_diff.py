@@ -0,0 +1,109 @@
+"""Tests for image_diff service."""
+
+import pytest
+import numpy as np
+from PIL import Image
+
+from src.services.image_diff import (
+    ImageComparator,
+    compare_arrays,
+    region_heatmap,
+)
+
+
+def _solid(width, height, color):
+    """Create a solid-color float32 RGB array."""
+    return np.full((height, width, 3), color, dtype=np.float32)
+
+
+class TestImageDiff:
+    """Test suite for the screenshot diff engine."""
+
+    def test_identical_arrays(self):
+        """Identical images are fully similar with an all-zero heatmap."""
+        image = _solid(64, 48, (10, 120, 200))
+        result = compare_arrays(image, image.copy(), grid=4)
+
+        assert result["similarity"] == 1.0
+        assert result["changed_ratio"] == 0.0
+        assert np.array(result["heatmap"]).shape == (4, 4)
+        assert not np.array(result["heatmap"]).any()
+
+    def test_difference_is_localized(self):
+        """A change in one corner shows up in that heatmap region only."""
+        target = _solid(80, 80, (255, 255, 255))
+        actual = target.copy()
+        actual[:20, :20] = 0
+
+        result = compare_arrays(actual, target, grid=4)
+        heatmap = np.array(result["heatmap"])
+
+        assert result["similarity"] < 1.0
+        assert result["changed_ratio"] == pytest.approx(400 / 6400)
+        assert heatmap[0, 0] == pytest.approx(1.0)
+        assert heatmap.sum() == pytest.approx(1.0)
+        assert result["worst_regions"][0] == {"row": 0, "col": 0, "score": 1.0}
+
+    def test_heatmap_uneven_grid(self):
+        """Regions cover the whole image when the size is not a grid multiple."""
+        per_pixel = np.full((7, 5), 255.0)
+        heatmap = region_heatmap(per_pixel, grid=3)
+
+        assert heatmap.shape == (3, 3)
+        assert np.allclose(heatmap, 1.0)
+
+    def test_shape_mismatch(self):
+        """Arrays of different shapes cannot be compared."""
+        with pytest.raises(ValueError):
+            compare_arrays(_solid(10, 10, 0), _solid(12, 10, 0))
+
+    def test_compare_files_different_resolutions(self, tmp_path):
+        """A capture at a different resolution is scaled to the target before diffing."""
+        target_path = tmp_path / "TARGET_03.png"
+        round_path = tmp_path / "ROUND01_03.png"
+        diff_path = tmp_path / "diffs" / "DIFF01_03.png"
+
+        Image.new("RGB", (1200, 800), (30, 60, 90)).save(target_path)
+        Image.new("RGB", (600, 400), (30, 60, 90)).save(round_path)
+
+        result = ImageComparator.compare_files(round_path, target_path, diff_path, grid=4)
+
+        assert result["similarity"] == 1.0
+        assert diff_path.exists()
+        with Image.open(diff_path) as diff_image:
+            assert max(diff_image.size) <= 384
+
+    def test_compare_files_taller_capture(self, tmp_path):
+        """A taller full-page capture is compared over the overlap, not squashed onto the target."""
+        target_path = tmp_path / "TARGET_04.png"
+        round_path = tmp_path / "ROUND01_04.png"
+
+        target = Image.new("RGB", (400, 400), (255, 255, 255))
+        target.paste((0, 0, 0), (0, 200, 400, 400))
+        target.save(target_path)
+        capture = Image.new("RGB", (400, 600), (255, 255, 255))
+        capture.paste((0, 0, 0), (0, 200, 400, 400))
+        capture.save(round_path)
+
+        result = ImageComparator.compare_files(round_path, target_path, grid=4)
+
+        assert result["similarity"] == 1.0
+        assert result["round_size"] == [400, 600]
+        assert result["target_size"] == [400, 400]
+        assert result["compared_size"] == [400, 400]
+        assert result["height_mismatch"] == pytest.approx(1 / 3, abs=1e-4)
+
+    def test_find_pairs(self, tmp_path):
+        """Only round screenshots with a matching target are paired."""
+        for name in ["TARGET_03.png", "ROUND02_03.png", "ROUND02_04.png", "ROUND01_03.png"]:
+            Image.new("RGB", (4, 4)).save(tmp_path / name)
+
+        pairs = ImageComparator.find_pairs(tmp_path, 2)
+
+        assert [(index, r.name, t.name) for index, r, t in pairs] == [
+            (3, "ROUND02_03.png", "TARGET_03.png")
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
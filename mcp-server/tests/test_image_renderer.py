@@ -0,0 +1,98 @@
+"""Tests for image_renderer service."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from src.services.image_renderer import ImageRenderer, fallback_region_box
+from src.services.screenshot_store import ScreenshotStore
+
+
+def _png(size=(400, 1000)) -> bytes:
+    """Encode a PNG with a red header band and a blue body."""
+    img = Image.new("RGB", size, "blue")
+    img.paste((255, 0, 0), (0, 0, size[0], 100))
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def store_settings(monkeypatch):
+    """Enable the store without eager variants."""
+    monkeypatch.setattr("src.services.screenshot_store.SCREENSHOT_STORE_ENABLED", True)
+    monkeypatch.setattr("src.services.screenshot_store.SCREENSHOT_VARIANTS", [])
+
+
+class TestImageRenderer:
+    """Test suite for cached, cropped and downscaled renditions."""
+
+    def test_downscales_to_max_edge(self, tmp_path):
+        """The longest edge is bounded and the aspect ratio kept."""
+        path = tmp_path / "acme" / "ROUND01_01.png"
+        ScreenshotStore.save(path, _png(), tmp_path)
+
+        rendition = ImageRenderer.render(path, max_edge=200, cache_dir=tmp_path / "cache", screenshots_dir=tmp_path)
+
+        assert (rendition["width"], rendition["height"]) == (80, 200)
+        assert rendition["source_size"] == [400, 1000]
+        assert rendition["mime_type"] == "image/jpeg"
+        assert Image.open(io.BytesIO(rendition["data"])).format == "JPEG"
+
+    def test_crops_to_recorded_region(self, tmp_path):
+        """Region boxes recorded on capture select the crop."""
+        path = tmp_path / "acme" / "ROUND01_01.png"
+        ScreenshotStore.save(path, _png(), tmp_path, regions={"header": [0, 0, 400, 100]})
+
+        rendition = ImageRenderer.render(
+            path, region="header", fmt="png", cache_dir=tmp_path / "cache", screenshots_dir=tmp_path
+        )
+
+        assert rendition["box"] == [0, 0, 400, 100]
+        img = Image.open(io.BytesIO(rendition["data"])).convert("RGB")
+        assert img.size == (400, 100)
+        assert img.getpixel((200, 99)) == (255, 0, 0)
+
+    def test_falls_back_without_recorded_regions(self, tmp_path):
+        """TARGET files are cropped by the layout estimate."""
+        path = tmp_path / "acme" / "TARGET_01.png"
+        path.parent.mkdir()
+        path.write_bytes(_png())
+
+        rendition = ImageRenderer.render(
+            path, region="form", cache_dir=tmp_path / "cache", screenshots_dir=tmp_path
+        )
+
+        assert rendition["box"] == list(fallback_region_box((400, 1000), "form"))
+        assert rendition["box"][1] > 0 and rendition["box"][3] == 1000
+
+    def test_second_render_is_cached(self, tmp_path):
+        """Identical requests are served from the rendition cache."""
+        path = tmp_path / "acme" / "ROUND01_01.png"
+        ScreenshotStore.save(path, _png(), tmp_path)
+        options = dict(max_edge=300, fmt="webp", quality=60, cache_dir=tmp_path / "cache", screenshots_dir=tmp_path)
+
+        first = ImageRenderer.render(path, **options)
+        second = ImageRenderer.render(path, **options)
+        other = ImageRenderer.render(path, **{**options, "quality": 40})
+
+        assert not first["cache_hit"] and second["cache_hit"] and not other["cache_hit"]
+        assert second["data"] == first["data"]
+        assert second["width"] == first["width"]
+
+    def test_rejects_unknown_options_and_missing_files(self, tmp_path):
+        """Unknown regions/formats and missing files raise."""
+        path = tmp_path / "acme" / "ROUND01_01.png"
+        ScreenshotStore.save(path, _png(), tmp_path)
+
+        with pytest.raises(ValueError):
+            ImageRenderer.render(path, region="footer", cache_dir=tmp_path / "cache")
+        with pytest.raises(ValueError):
+            ImageRenderer.render(path, fmt="gif", cache_dir=tmp_path / "cache")
+        with pytest.raises(FileNotFoundError):
+            ImageRenderer.render(tmp_path / "acme" / "ROUND09_01.png", cache_dir=tmp_path / "cache")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
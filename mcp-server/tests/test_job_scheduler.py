@@ -0,0 +1,123 @@
+"""Tests for job_scheduler service."""
+
+import asyncio
+from collections import deque
+
+import pytest
+
+from src.services.job_scheduler import JobScheduler, JobCancelledError
+
+
+@pytest.fixture(autouse=True)
+def fresh_scheduler(monkeypatch):
+    """Give every test an empty scheduler with two slots."""
+    monkeypatch.setattr(JobScheduler, "_queue", deque())
+    monkeypatch.setattr(JobScheduler, "_running", {})
+    monkeypatch.setattr(JobScheduler, "_history", deque(maxlen=50))
+    monkeypatch.setattr(JobScheduler, "max_concurrency", 2)
+
+
+def _job(log, name, delay=0.02):
+    """Tool call stand-in that records its start and end."""
+    async def run():
+        log.append(f"start {name}")
+        await asyncio.sleep(delay)
+        log.append(f"end {name}")
+        return name
+    return run
+
+
+class TestJobScheduler:
+    """Test suite for queueing, key exclusion and cancellation."""
+
+    def test_same_customer_runs_in_order(self):
+        """Calls for one customer never overlap; other customers run alongside."""
+        log = []
+
+        async def scenario():
+            return await asyncio.gather(
+                JobScheduler.run("get_screenshots", _job(log, "a1"), exclusive=["customer:a"]),
+                JobScheduler.run("update_theme", _job(log, "a2"), exclusive=["customer:a"]),
+                JobScheduler.run("get_screenshots", _job(log, "b1"), exclusive=["customer:b"]),
+            )
+
+        assert asyncio.run(scenario()) == ["a1", "a2", "b1"]
+        assert log.index("end a1") < log.index("start a2")
+        assert log.index("start b1") < log.index("end a1")
+
+    def test_bounded_concurrency_reports_positions(self):
+        """Beyond max_concurrency calls queue and learn their position."""
+        log, positions = [], []
+
+        async def on_queued(job):
+            positions.append((job.tool, job.position))
+
+        async def scenario():
+            await asyncio.gather(*(
+                JobScheduler.run(f"job{i}", _job(log, str(i), delay), exclusive=[f"customer:{i}"], on_queued=on_queued)
+                for i, delay in enumerate([0.02, 0.2, 0.02, 0.02])
+            ))
+
+        asyncio.run(scenario())
+
+        assert ("job2", 1) in positions and ("job3", 2) in positions and ("job3", 1) in positions
+        assert max(
+            sum(1 for entry in log[:i + 1] if entry.startswith("start")) -
+            sum(1 for entry in log[:i + 1] if entry.startswith("end"))
+            for i in range(len(log))
+        ) == 2
+        assert [job["state"] for job in JobScheduler.jobs()] == ["done"] * 4
+
+    def test_exclusive_environment_waits_for_shared_holders(self):
+        """create_environment waits for screenshot calls; later ones wait for it."""
+        log = []
+
+        async def scenario():
+            first = asyncio.create_task(
+                JobScheduler.run("get_screenshots", _job(log, "shot1"), exclusive=["customer:a"], shared=["environment"])
+            )
+            await asyncio.sleep(0)
+            env = asyncio.create_task(
+                JobScheduler.run("create_environment", _job(log, "env"), exclusive=["environment", "customer:b"])
+            )
+            await asyncio.sleep(0)
+            second = asyncio.create_task(
+                JobScheduler.run("get_screenshots", _job(log, "shot2"), exclusive=["customer:c"], shared=["environment"])
+            )
+            await asyncio.gather(first, env, second)
+
+        asyncio.run(scenario())
+
+        assert log == ["start shot1", "end shot1", "start env", "end env", "start shot2", "end shot2"]
+
+    def test_cancel_queued_and_running_jobs(self):
+        """Cancelled jobs raise JobCancelledError and free their slot."""
+        log = []
+
+        async def scenario():
+            running = asyncio.create_task(
+                JobScheduler.run("get_screenshots", _job(log, "long", delay=10), exclusive=["customer:a"])
+            )
+            queued = asyncio.create_task(
+                JobScheduler.run("get_screenshots", _job(log, "next"), exclusive=["customer:a"])
+            )
+            await asyncio.sleep(0.01)
+            jobs = {job["state"]: job["job_id"] for job in JobScheduler.jobs()}
+
+            assert JobScheduler.cancel(jobs["queued"]) == "queued"
+            assert JobScheduler.cancel(jobs["running"]) == "running"
+            assert JobScheduler.cancel("unknown") is None
+
+            for task in (running, queued):
+                with pytest.raises(JobCancelledError):
+                    await task
+
+        asyncio.run(scenario())
+
+        assert log == ["start long"]
+        assert JobScheduler.stats() == {"running": 0, "queued": 0, "max_concurrency": 2}
+        assert [job["state"] for job in JobScheduler.jobs()] == ["cancelled", "cancelled"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
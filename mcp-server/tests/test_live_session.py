@@ -0,0 +1,76 @@
+"""Tests for live_session service."""
+
+import asyncio
+
+import pytest
+
+from src.services.live_session import LiveSessionManager
+
+
+class StubPage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class StubAutomation:
+    """Owns one page; closing the browser closes it."""
+
+    def __init__(self):
+        self.page = StubPage()
+
+    async def close_browser(self):
+        self.page.closed = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Empty session registry, without the background reaper."""
+    monkeypatch.setattr(LiveSessionManager, "_sessions", {})
+    monkeypatch.setattr(LiveSessionManager, "_reaper", None)
+    monkeypatch.setattr("src.services.live_session.LIVE_SESSION_IDLE_TIMEOUT", 60)
+    monkeypatch.setattr("src.services.live_session.LIVE_SESSION_MAX", 2)
+    return LiveSessionManager
+
+
+def _park(manager, customer_name):
+    automation = StubAutomation()
+    session = asyncio.run(manager.park(customer_name, automation, {4: automation.page}))
+    manager._reaper = None
+    return session
+
+
+class TestLiveSessionManager:
+    """Test suite for parking and expiring live sessions."""
+
+    def test_idle_sessions_are_closed(self, manager):
+        """Sessions unused for longer than the idle timeout are closed."""
+        idle = _park(manager, "idle")
+        busy = _park(manager, "busy")
+        idle.last_used -= 120
+
+        assert asyncio.run(manager.expire_idle()) == ["idle"]
+        assert idle.automation.page.is_closed()
+        assert manager.get("idle") is None
+        assert manager.get("busy") is busy
+
+    def test_least_recently_used_session_is_closed_at_limit(self, manager):
+        """Parking beyond the limit closes the least recently used session."""
+        first = _park(manager, "first")
+        second = _park(manager, "second")
+        second.last_used -= 10
+        first.last_used -= 5
+
+        _park(manager, "third")
+
+        assert sorted(manager._sessions) == ["first", "third"]
+        assert second.automation.page.is_closed()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
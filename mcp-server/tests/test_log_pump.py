@@ -0,0 +1,76 @@
+"""Tests for log_pump service."""
+
+import asyncio
+import sys
+
+import pytest
+
+from src.services.log_pump import LogPump
+
+
+async def _pump_script(pump, script):
+    """Run a Python child process and drain its output into the pump."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    pump.attach(process)
+    await process.wait()
+    await pump.wait_closed()
+    pump.stop()
+
+
+class TestLogPump:
+    """Test suite for draining and querying service output."""
+
+    def test_drains_output_larger_than_pipe_buffer(self, tmp_path):
+        """A child writing far more than a pipe buffer holds runs to completion."""
+        pump = LogPump("test", log_dir=tmp_path, max_lines=50)
+        script = "import sys\nfor i in range(20000): print('x' * 40, i); print('err', i, file=sys.stderr)"
+
+        asyncio.run(asyncio.wait_for(_pump_script(pump, script), timeout=30))
+
+        assert pump.total_lines == 40000
+        assert len(pump.lines) == 50
+        assert (tmp_path / "test.log").exists()
+
+    def test_tail_and_grep(self, tmp_path):
+        """Recent lines can be filtered by pattern and stream."""
+        pump = LogPump("test", log_dir=tmp_path)
+        script = (
+            "import sys\n"
+            "for i in range(10): print(f'line {i}')\n"
+            "print('ERROR boom', file=sys.stderr)"
+        )
+        asyncio.run(_pump_script(pump, script))
+
+        assert [line.split(" ", 1)[1] for line in pump.tail(lines=2, stream="stdout")] == [
+            "[stdout] line 8",
+            "[stdout] line 9",
+        ]
+        assert pump.tail(pattern="error", ignore_case=True)[0].endswith("[stderr] ERROR boom")
+        assert pump.tail(pattern="missing") == []
+
+    def test_ready_pattern(self, tmp_path):
+        """The first matching line sets the ready event and calls back once."""
+        seen = []
+        pump = LogPump("test", r"Started \S+ in", seen.append, log_dir=tmp_path)
+        script = "print('Started App in 1.2 seconds'); print('Started App in 3.4 seconds')"
+        asyncio.run(_pump_script(pump, script))
+
+        assert pump.ready.is_set()
+        assert seen == ["Started App in 1.2 seconds"]
+
+    def test_log_file_rotation(self, tmp_path, monkeypatch):
+        """The on-disk log is rotated instead of growing without bound."""
+        monkeypatch.setattr("src.services.log_pump.LOG_MAX_BYTES", 2000)
+        pump = LogPump("test", log_dir=tmp_path)
+        asyncio.run(_pump_script(pump, "for i in range(500): print('y' * 20, i)"))
+
+        assert (tmp_path / "test.log.1").exists()
+        assert (tmp_path / "test.log").stat().st_size <= 2000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""Tests for page_readiness service."""
+
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.services.page_readiness import PageReadiness
+
+
+class StubHandle:
+    def __init__(self, value):
+        self.value = value
+
+    async def json_value(self):
+        return self.value
+
+
+class StubPage:
+    """Page whose waits succeed for the selectors it is said to show."""
+
+    def __init__(self, visible=(), match=None):
+        self.visible = set(visible)
+        self.match = match
+        self.timeouts = []
+
+    async def wait_for_selector(self, selector, state="visible", timeout=None):
+        self.timeouts.append(timeout)
+        if selector not in self.visible:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def wait_for_load_state(self, state, timeout=None):
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        if self.match is None:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+        return StubHandle(self.match)
+
+
+@pytest.fixture(autouse=True)
+def timeouts(monkeypatch):
+    monkeypatch.setattr(
+        "src.services.page_readiness.READINESS_TIMEOUTS", {"default": 1000, "login": 250}
+    )
+
+
+class TestPageReadiness:
+    """Test suite for recorded readiness waits."""
+
+    def test_timeout_is_recorded(self):
+        """A wait that times out returns False and records the limit it hit."""
+        readiness = PageReadiness(StubPage())
+
+        assert asyncio.run(readiness.wait_for_selector("login", "#username")) is False
+
+        timing = readiness.timings[0]
+        assert timing["step"] == "login"
+        assert timing["signal"] == "selector #username visible"
+        assert timing["timeout_ms"] == 250
+        assert timing["satisfied"] is False
+
+    def test_step_limits(self):
+        """Explicit timeouts override the step limit; unknown steps use the default."""
+        page = StubPage(visible=["#username"])
+        readiness = PageReadiness(page)
+
+        async def scenario():
+            await readiness.wait_for_selector("login", "#username", timeout=50)
+            await readiness.wait_for_selector("person_list", "#username")
+
+        asyncio.run(scenario())
+
+        assert page.timeouts == [50, 1000]
+        assert [t["satisfied"] for t in readiness.timings] == [True, True]
+
+    def test_summary_adds_up_per_step(self):
+        """The summary totals the time waited per step, whether or not the signal came."""
+        readiness = PageReadiness(StubPage(visible=["#username"]))
+
+        async def scenario():
+            await readiness.wait_for_selector("login", "#username")
+            await readiness.wait_for_network_idle("login")
+            await readiness.wait_for_network_idle("person_list")
+
+        asyncio.run(scenario())
+
+        summary = readiness.summary()
+        assert set(summary) == {"login", "person_list"}
+        login = sum(t["waited_ms"] for t in readiness.timings if t["step"] == "login")
+        assert summary["login"] == round(login, 1)
+
+    def test_wait_for_any(self):
+        """The probe's match is returned, and a timeout returns None."""
+        candidates = [{"css": "#add"}, {"css": "button", "text": ["add"]}]
+        found = PageReadiness(StubPage(match={"index": 1, "nth": 3}))
+        missing = PageReadiness(StubPage())
+
+        assert asyncio.run(found.wait_for_any("person_list", "add_button", candidates)) == {"index": 1, "nth": 3}
+        assert asyncio.run(missing.wait_for_any("person_list", "add_button", candidates)) is None
+        assert missing.timings[0]["signal"] == "add_button visible"
+        assert missing.timings[0]["satisfied"] is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""Tests for palette_extractor service."""
+
+import pytest
+import numpy as np
+from PIL import Image
+
+from src.services.palette_extractor import (
+    PaletteExtractor,
+    kmeans_palette,
+    propose_theme_colors,
+)
+
+
+def _striped_image(path):
+    """Save an image that is 70% white, 20% blue and 10% near-black."""
+    pixels = np.zeros((100, 100, 3), dtype=np.uint8)
+    pixels[:70] = (255, 255, 255)
+    pixels[70:90] = (0, 90, 200)
+    pixels[90:] = (20, 20, 20)
+    Image.fromarray(pixels).save(path)
+
+
+class TestPaletteExtractor:
+    """Test suite for dominant-color extraction."""
+
+    def test_kmeans_palette_coverage(self):
+        """Dominant colors are ranked by the area they cover."""
+        pixels = np.array(
+            [(255, 255, 255)] * 70 + [(0, 90, 200)] * 20 + [(20, 20, 20)] * 10,
+            dtype=np.float64
+        )
+        palette = kmeans_palette(pixels, k=4)
+
+        assert [color["hex"] for color in palette] == ["#ffffff", "#005ac8", "#141414"]
+        assert [color["coverage"] for color in palette] == pytest.approx([0.7, 0.2, 0.1])
+
+    def test_kmeans_palette_empty(self):
+        """An empty image has no palette."""
+        assert kmeans_palette(np.zeros((0, 3))) == []
+
+    def test_propose_theme_colors(self):
+        """Background, primary and text colors are mapped to theme paths."""
+        palette = [
+            {"hex": "#ffffff", "rgb": [255, 255, 255], "coverage": 0.7},
+            {"hex": "#005ac8", "rgb": [0, 90, 200], "coverage": 0.2},
+            {"hex": "#141414", "rgb": [20, 20, 20], "coverage": 0.1},
+        ]
+        proposal = propose_theme_colors(palette)
+
+        assert proposal["colors.background.primaryBackground"] == "#ffffff"
+        assert proposal["colors.primaryColor"] == "#005ac8"
+        assert proposal["colors.interaction.primaryInteractionColor"] == "#005ac8"
+        assert proposal["colors.text.color"] == "#141414"
+
+    def test_extract_uses_cache(self, tmp_path):
+        """A second extraction of the same file is served from the hash cache."""
+        image_path = tmp_path / "TARGET_01.png"
+        cache_dir = tmp_path / "cache"
+        _striped_image(image_path)
+
+        palette = PaletteExtractor.extract(image_path, k=4, cache_dir=cache_dir)
+        cached_files = list(cache_dir.glob("*.json"))
+
+        assert len(cached_files) == 1
+        assert cached_files[0].name.startswith(PaletteExtractor.file_hash(image_path))
+        assert PaletteExtractor.extract(image_path, k=4, cache_dir=cache_dir) == palette
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,26 @@
+"""Tests for person_fixtures service."""
+
+import pytest
+
+from src.services.person_fixtures import fixture_persons
+
+
+class TestFixturePersons:
+    """Test suite for the deterministic person set."""
+
+    def test_same_seed_same_persons(self):
+        """Persons depend only on count and seed."""
+        assert fixture_persons(3) == fixture_persons(3)
+        assert fixture_persons(3, seed=1) != fixture_persons(3, seed=2)
+        data = fixture_persons(1)[0]["Person"]["PersonalData"]
+        assert set(data) == {"FirstName", "LastName", "EmailAddress", "DateOfBirth", "Nationality", "PlaceOfBirth"}
+
+    def test_birth_dates_do_not_depend_on_today(self):
+        """Ages are drawn relative to the fixed reference date."""
+        for person in fixture_persons(20):
+            born = person["Person"]["PersonalData"]["DateOfBirth"]
+            assert "1944-01-15" <= born <= "2006-01-15"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""Tests for process_manager readiness detection."""
+
+import asyncio
+import functools
+import sys
+import time
+
+import pytest
+from aiohttp import web
+
+from src.services.log_pump import LogPump
+from src.services.process_manager import ProcessManager
+
+
+async def _spawn(script):
+    """Start a Python child process with piped output."""
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _log_dir(tmp_path, monkeypatch):
+    """Keep service log files and traces out of the real cache directory."""
+    monkeypatch.setattr(
+        "src.services.process_manager.LogPump",
+        functools.partial(LogPump, log_dir=tmp_path)
+    )
+    monkeypatch.setattr("src.services.process_manager.TRACE_DIR", tmp_path)
+
+
+async def _ok(request):
+    """Health endpoint that always answers 200."""
+    return web.Response(text="ok")
+
+
+class TestProcessManagerReadiness:
+    """Test suite for log-driven readiness and health probing."""
+
+    def test_watch_output_detects_ready_line(self):
+        """The ready line on stderr sets the event and records its time."""
+        async def run():
+            started_at = time.monotonic()
+            process = await _spawn(
+                "import sys; print('starting'); "
+                "print('webpack 5.90.0 compiled successfully in 812 ms', file=sys.stderr)"
+            )
+            ready = ProcessManager._watch_output("test", process, r"compiled successfully", started_at)
+            await asyncio.wait_for(ready.wait(), timeout=10)
+            await process.wait()
+            ProcessManager._stop_output_watchers("test")
+            return ProcessManager.get_startup_metrics()["test"]
+
+        metrics = asyncio.run(run())
+
+        assert metrics["log_ready_s"] is not None
+        assert metrics["ready"] is False
+
+    def test_wait_for_ready_probes_until_healthy(self):
+        """A healthy endpoint is detected and the startup phases are reported."""
+        async def run():
+            app = web.Application()
+            app.router.add_get("/", _ok)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            started_at = time.monotonic()
+            process = await _spawn("import time; print('Started App in 0.1 seconds'); time.sleep(2)")
+            ready = ProcessManager._watch_output("test", process, r"Started \S+ in", started_at)
+            try:
+                return await ProcessManager._wait_for_ready(
+                    "test", f"http://127.0.0.1:{port}/", 10, process, ready, started_at
+                )
+            finally:
+                process.kill()
+                await process.wait()
+                ProcessManager._stop_output_watchers("test")
+                await ProcessManager.close_http_session()
+                await runner.cleanup()
+
+        assert asyncio.run(run()) is True
+        metrics = ProcessManager.get_startup_metrics()["test"]
+        assert metrics["ready"] is True
+        assert metrics["probes"] >= 1
+        assert metrics["http_ready_s"] >= metrics["spawn_s"]
+
+    def test_wait_for_ready_stops_when_process_exits(self):
+        """Waiting ends as soon as the service process has exited."""
+        async def run():
+            started_at = time.monotonic()
+            process = await _spawn("raise SystemExit(3)")
+            await process.wait()
+            ready = ProcessManager._watch_output("test", process, r"never", started_at)
+            try:
+                return await ProcessManager._wait_for_ready(
+                    "test", "http://127.0.0.1:9/", 30, process, ready, started_at
+                )
+            finally:
+                ProcessManager._stop_output_watchers("test")
+                await ProcessManager.close_http_session()
+
+        started = time.monotonic()
+        assert asyncio.run(run()) is False
+        assert time.monotonic() - started < 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""Tests for round_index service."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services.round_index import RoundIndex, theme_revision
+
+
+class TestRoundIndex:
+    """Test suite for the per-customer round manifest."""
+
+    def test_rebuilds_from_existing_files(self, tmp_path):
+        """Without a manifest, rounds are recovered from the ROUND file names once."""
+        for name in ("ROUND01_03.png", "ROUND01_04.png", "ROUND07_04.png", "TARGET_01.png"):
+            (tmp_path / name).touch()
+
+        assert RoundIndex.next_round(tmp_path) == 8
+        assert RoundIndex.manifest_path(tmp_path).exists()
+
+        rounds = RoundIndex.list_rounds(tmp_path)
+        assert [entry["round"] for entry in rounds] == [1, 7]
+        assert [s["name"] for s in rounds[0]["screenshots"]] == ["ROUND01_03.png", "ROUND01_04.png"]
+
+    def test_files_written_outside_the_index(self, tmp_path):
+        """ROUND files written without allocate() are never handed out again."""
+        assert RoundIndex.allocate(tmp_path) == 1
+        RoundIndex.finish(tmp_path, 1, True, [{"name": "ROUND01_04.png"}])
+        for name in ("ROUND02_03.png", "ROUND02_04.png"):
+            (tmp_path / name).touch()
+
+        assert RoundIndex.next_round(tmp_path) == 3
+        assert RoundIndex.latest_complete(tmp_path) == 2
+        assert RoundIndex.allocate(tmp_path) == 3
+        assert json.loads(RoundIndex.manifest_path(tmp_path).read_text())["rounds"]["2"]["recovered"]
+
+    def test_directory_is_scanned_only_after_changes(self, tmp_path, monkeypatch):
+        """Allocating, finishing and listing do not glob the directory again until it changes."""
+        scans = []
+        scan = RoundIndex._scan
+        monkeypatch.setattr(RoundIndex, "_synced_mtimes", {})
+        monkeypatch.setattr(RoundIndex, "_scan", staticmethod(lambda d: scans.append(d) or scan(d)))
+
+        assert RoundIndex.allocate(tmp_path) == 1
+        assert len(scans) == 1
+        assert RoundIndex.allocate(tmp_path) == 2
+        RoundIndex.finish(tmp_path, 1, True, [])
+        RoundIndex.list_rounds(tmp_path)
+        assert RoundIndex.next_round(tmp_path) == 3
+        assert len(scans) == 1
+
+        (tmp_path / "ROUND05_04.png").touch()
+        assert RoundIndex.allocate(tmp_path) == 6
+        assert len(scans) == 2
+
+    def test_missing_directory(self, tmp_path):
+        """A customer without screenshots starts at round 1."""
+        assert RoundIndex.next_round(tmp_path / "missing") == 1
+        assert RoundIndex.list_rounds(tmp_path / "missing") == []
+
+    def test_concurrent_allocation_is_unique(self, tmp_path):
+        """Concurrent callers never receive the same round."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            numbers = list(pool.map(lambda _: RoundIndex.allocate(tmp_path), range(40)))
+
+        assert sorted(numbers) == list(range(1, 41))
+        assert RoundIndex.next_round(tmp_path) == 41
+
+    def test_finish_records_outcome(self, tmp_path):
+        """Finished rounds carry status, screenshots and duration."""
+        first = RoundIndex.allocate(tmp_path, theme_revision="abc")
+        second = RoundIndex.allocate(tmp_path)
+        RoundIndex.finish(tmp_path, first, True, [{"name": "ROUND01_04.png", "sha256": "f" * 64}])
+        RoundIndex.finish(tmp_path, second, False, [], message="boom")
+
+        first_entry, second_entry = RoundIndex.list_rounds(tmp_path)
+        assert first_entry["status"] == "complete"
+        assert first_entry["theme_revision"] == "abc"
+        assert first_entry["duration_s"] >= 0
+        assert second_entry["status"] == "failed"
+        assert RoundIndex.latest_complete(tmp_path) == first
+
+    def test_corrupt_manifest_is_rebuilt(self, tmp_path):
+        """An unreadable manifest falls back to the directory scan."""
+        (tmp_path / "ROUND03_04.png").touch()
+        RoundIndex.manifest_path(tmp_path).write_text("{not json")
+
+        assert RoundIndex.allocate(tmp_path) == 4
+        assert json.loads(RoundIndex.manifest_path(tmp_path).read_text())["next_round"] == 5
+
+    def test_theme_revision(self, tmp_path):
+        """Revisions change with the theme content."""
+        theme = tmp_path / "acme.json"
+        theme.write_text('{"a": 1}')
+        before = theme_revision(theme)
+        theme.write_text('{"a": 2}')
+
+        assert before != theme_revision(theme)
+        assert theme_revision(tmp_path / "missing.json") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+"""Tests for screenshot_store service."""
+
+import io
+import os
+import shutil
+import subprocess
+
+import pytest
+from PIL import Image
+
+from src.services.screenshot_store import ScreenshotStore
+
+
+def _png(color, size=(64, 48)) -> bytes:
+    """Encode a solid-color PNG."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def store_settings(monkeypatch):
+    """Enable the store without eager variants."""
+    monkeypatch.setattr("src.services.screenshot_store.SCREENSHOT_STORE_ENABLED", True)
+    monkeypatch.setattr("src.services.screenshot_store.SCREENSHOT_VARIANTS", [])
+
+
+class TestScreenshotStore:
+    """Test suite for content-addressed screenshot storage."""
+
+    def test_identical_captures_share_one_object(self, tmp_path):
+        """Equal bytes are stored once; the ROUND names stay regular files."""
+        data = _png("red")
+        first = ScreenshotStore.save(tmp_path / "acme" / "ROUND01_04.png", data, tmp_path)
+        second = ScreenshotStore.save(tmp_path / "acme" / "ROUND02_04.png", data, tmp_path)
+
+        assert first == second
+        path = tmp_path / "acme" / "ROUND02_04.png"
+        assert not path.is_symlink() and path.samefile(first)
+        assert path.read_bytes() == data
+        assert ScreenshotStore.stats(tmp_path) == {
+            "objects": 1,
+            "stored_bytes": len(data),
+            "screenshots": 2,
+            "logical_bytes": 2 * len(data),
+        }
+
+    def test_overwrite_does_not_touch_shared_object(self, tmp_path):
+        """Saving over a linked name replaces it instead of writing through."""
+        red, blue = _png("red"), _png("blue")
+        ScreenshotStore.save(tmp_path / "a" / "ROUND01_03.png", red, tmp_path)
+        ScreenshotStore.save(tmp_path / "b" / "ROUND01_03.png", red, tmp_path)
+        ScreenshotStore.save(tmp_path / "b" / "ROUND01_03.png", blue, tmp_path)
+
+        assert (tmp_path / "a" / "ROUND01_03.png").read_bytes() == red
+        assert (tmp_path / "b" / "ROUND01_03.png").read_bytes() == blue
+
+    def test_ingest_directory_skips_targets(self, tmp_path):
+        """Existing ROUND files are linked to the store, TARGET files stay."""
+        customer_dir = tmp_path / "acme"
+        customer_dir.mkdir()
+        (customer_dir / "ROUND01_03.png").write_bytes(_png("green"))
+        (customer_dir / "TARGET_03.png").write_bytes(_png("green"))
+
+        assert ScreenshotStore.ingest_directory(customer_dir, tmp_path) == 1
+        assert ScreenshotStore.ingest_directory(customer_dir, tmp_path) == 0
+        assert (customer_dir / "ROUND01_03.png").stat().st_nlink == 2
+        assert (customer_dir / "TARGET_03.png").stat().st_nlink == 1
+
+    def test_ingest_directory_skips_git_tracked(self, tmp_path):
+        """ROUND files committed to git are left alone."""
+        customer_dir = tmp_path / "acme"
+        customer_dir.mkdir()
+        (customer_dir / "ROUND01_03.png").write_bytes(_png("green"))
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "acme/ROUND01_03.png"], cwd=tmp_path, check=True)
+        (customer_dir / "ROUND02_03.png").write_bytes(_png("blue"))
+
+        assert ScreenshotStore.ingest_directory(customer_dir, tmp_path) == 1
+        assert (customer_dir / "ROUND01_03.png").stat().st_nlink == 1
+        assert (customer_dir / "ROUND02_03.png").stat().st_nlink == 2
+
+    def test_variants_on_demand(self, tmp_path):
+        """WebP is lossless, previews are downscaled."""
+        path = tmp_path / "acme" / "ROUND01_04.png"
+        ScreenshotStore.save(path, _png((10, 20, 30), size=(1200, 900)), tmp_path)
+
+        webp = ScreenshotStore.variant(path, "webp", tmp_path)
+        preview = ScreenshotStore.variant(path, "preview", tmp_path)
+
+        with Image.open(webp) as img:
+            assert img.size == (1200, 900)
+            assert img.convert("RGB").getpixel((5, 5)) == (10, 20, 30)
+        with Image.open(preview) as img:
+            assert max(img.size) == 480
+
+    def test_store_can_be_deleted(self, tmp_path):
+        """Screenshots do not depend on the store (it is not committed)."""
+        path = tmp_path / "acme" / "ROUND01_04.png"
+        ScreenshotStore.save(path, _png("red"), tmp_path)
+        shutil.rmtree(ScreenshotStore.store_dir(tmp_path))
+
+        assert path.read_bytes() == _png("red")
+
+    def test_variant_of_a_file_outside_the_store(self, tmp_path):
+        """A variant is encoded from the file itself; the file is not linked to the store."""
+        path = tmp_path / "acme" / "ROUND01_04.png"
+        path.parent.mkdir()
+        path.write_bytes(_png("green"))
+
+        assert ScreenshotStore.variant(path, "preview", tmp_path).exists()
+        assert path.stat().st_nlink == 1
+
+    def test_garbage_collect(self, tmp_path):
+        """Objects without a screenshot linking to them are removed."""
+        kept = tmp_path / "acme" / "ROUND01_04.png"
+        dropped = tmp_path / "acme" / "ROUND02_04.png"
+        ScreenshotStore.save(kept, _png("red"), tmp_path)
+        object_path = ScreenshotStore.save(dropped, _png("blue"), tmp_path)
+        ScreenshotStore.variant(dropped, "preview", tmp_path)
+        os.unlink(dropped)
+
+        assert ScreenshotStore.garbage_collect(tmp_path) == 1
+        assert not object_path.exists()
+        assert kept.read_bytes() == _png("red")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
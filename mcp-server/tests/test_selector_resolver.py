@@ -0,0 +1,121 @@
+"""Tests for selector_resolver service."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.services.selector_resolver import SelectorResolver, order_candidates
+
+
+CANDIDATES = [
+    {"css": 'button[aria-label="Add"]'},
+    {"css": "button", "text": ["Add"]},
+    {"css": "button", "text": ["+", "new"]},
+]
+
+
+class StubLocator:
+    """Records how the locator was built."""
+
+    def __init__(self, selector):
+        self.selector = selector
+        self.index = None
+
+    def nth(self, index):
+        self.index = index
+        return self
+
+
+class StubPage:
+    def locator(self, selector):
+        return StubLocator(selector)
+
+
+class StubReadiness:
+    """Answers the probe with the first candidate the page is said to contain."""
+
+    def __init__(self, present):
+        self.page = StubPage()
+        self.present = present
+        self.probes = []
+
+    async def wait_for_any(self, step, name, candidates, timeout=None):
+        self.probes.append(candidates)
+        for index, candidate in enumerate(candidates):
+            if candidate in self.present:
+                return {"index": index, "nth": 2}
+        return None
+
+
+@pytest.fixture
+def cache_file(monkeypatch, tmp_path):
+    """Point the resolver at an empty selector cache."""
+    path = tmp_path / "selectors.json"
+    monkeypatch.setattr("src.services.selector_resolver.SELECTOR_CACHE_FILE", path)
+    monkeypatch.setattr(SelectorResolver, "_cache", None)
+    return path
+
+
+def _resolve(readiness, build="build-a"):
+    resolver = SelectorResolver(readiness)
+    resolver._build = build
+    return asyncio.run(resolver.resolve("create_new_person", "add_button", CANDIDATES))
+
+
+class TestOrderCandidates:
+    """Test suite for candidate ordering."""
+
+    def test_learned_strategy_first(self):
+        """The learned strategy is probed first and not twice."""
+        ordered = order_candidates(CANDIDATES, {"css": "button", "text": ["+", "NEW"]})
+        assert ordered[0] == {"css": "button", "text": ["+", "new"]}
+        assert len(ordered) == len(CANDIDATES)
+        # Text is normalized to lower case for the in-page match
+        assert ordered[2] == {"css": "button", "text": ["add"]}
+
+    def test_without_learned_strategy(self):
+        """Without a learned strategy the given order is kept."""
+        assert [c["css"] for c in order_candidates(CANDIDATES, None)] == [c["css"] for c in CANDIDATES]
+
+
+class TestSelectorResolver:
+    """Test suite for resolving and learning selectors."""
+
+    def test_winner_is_learned_and_probed_first(self, cache_file):
+        """A fallback winner is persisted and tried first on the next lookup."""
+        fallback = {"css": "button", "text": ["+", "new"]}
+
+        locator = _resolve(StubReadiness([fallback]))
+        # The element the probe matched, also when it matched on aria-label or value
+        assert (locator.selector, locator.index) == ("button", 2)
+        assert json.loads(cache_file.read_text()) == {"build-a": {"add_button": fallback}}
+
+        # A new process reads the cache from disk
+        SelectorResolver._cache = None
+        readiness = StubReadiness([fallback])
+        _resolve(readiness)
+        assert readiness.probes[0][0] == fallback
+
+    def test_stale_strategy_is_replaced(self, cache_file):
+        """A learned strategy that no longer matches is outranked by the new winner."""
+        _resolve(StubReadiness([{"css": "button", "text": ["add"]}]))
+        _resolve(StubReadiness([{"css": 'button[aria-label="Add"]'}]))
+        assert SelectorResolver.learned("build-a", "add_button") == {"css": 'button[aria-label="Add"]'}
+
+    def test_no_match(self, cache_file):
+        """No candidate matching resolves to None and learns nothing."""
+        assert _resolve(StubReadiness([])) is None
+        assert not cache_file.exists()
+
+    def test_keeps_newest_builds(self, cache_file, monkeypatch):
+        """Only the most recently used builds are kept."""
+        monkeypatch.setattr("src.services.selector_resolver.SELECTOR_CACHE_BUILDS", 2)
+        present = [{"css": 'button[aria-label="Add"]'}]
+        for build in ("b1", "b2", "b3"):
+            _resolve(StubReadiness(present), build)
+        assert list(json.loads(cache_file.read_text())) == ["b2", "b3"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
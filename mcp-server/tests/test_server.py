@@ -0,0 +1,41 @@
+"""Tests for the server's tool scheduling keys."""
+
+import pytest
+
+from src.server import _job_keys
+
+
+class TestJobKeys:
+    """Test suite for the scheduler keys of tool calls."""
+
+    def test_captures_share_the_environment(self):
+        """Captures hold their customer alone and the environment shared."""
+        exclusive, shared = _job_keys("get_screenshots", {"customer_name": "acme"})
+        assert exclusive == ["customer:acme"]
+        assert shared == ["environment"]
+
+    def test_batch_holds_every_customer(self):
+        """A batch holds each of its customers alone and the environment shared."""
+        exclusive, shared = _job_keys("get_screenshots_batch", {"customer_names": ["acme", "globex"]})
+        assert exclusive == ["customer:acme", "customer:globex"]
+        assert shared == ["environment"]
+
+        # A batch conflicts with a single capture of one of its customers
+        single, _ = _job_keys("get_screenshots", {"customer_name": "globex"})
+        assert set(single) & set(exclusive)
+
+        # Creating the environment waits for the batch, whichever customer it is for
+        create, _ = _job_keys("create_environment", {"customer_name": "initech"})
+        assert "environment" in create and "environment" in shared
+
+    def test_batch_without_customers(self):
+        """A batch without customer names holds no customer key."""
+        assert _job_keys("get_screenshots_batch", {}) == ([], ["environment"])
+
+    def test_read_only_tools_are_not_scheduled(self):
+        """Tools that only read run right away."""
+        assert _job_keys("list_rounds", {}) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
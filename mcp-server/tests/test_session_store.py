@@ -0,0 +1,70 @@
+"""Tests for session_store service."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.services.session_store import SessionStore
+
+
+STATE = {"cookies": [{"name": "KEYCLOAK_SESSION", "value": "abc"}], "origins": []}
+
+
+class StubContext:
+    def __init__(self, state=None):
+        self.state = state
+
+    async def storage_state(self):
+        if self.state is None:
+            raise RuntimeError("Target closed")
+        return self.state
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """Point the session store at an empty cache directory."""
+    path = tmp_path / "sessions"
+    monkeypatch.setattr("src.services.session_store.SESSION_CACHE_DIR", path)
+    monkeypatch.setattr("src.services.session_store.SESSION_MAX_AGE", 60)
+    return path
+
+
+class TestSessionStore:
+    """Test suite for the storage state cache."""
+
+    def test_save_and_load(self, cache_dir):
+        """Saved state loads back for the same user and frontend only."""
+        path = asyncio.run(SessionStore.save(StubContext(STATE), "admin", "http://a"))
+
+        assert path.parent == cache_dir
+        assert SessionStore.load("admin", "http://a") == STATE
+        assert SessionStore.load("admin", "http://b") is None
+        assert SessionStore.load("other", "http://a") is None
+
+    def test_expired_session_is_removed(self, cache_dir):
+        """State older than the maximum age is not used and deleted."""
+        path = asyncio.run(SessionStore.save(StubContext(STATE), "admin", "http://a"))
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+
+        assert SessionStore.load("admin", "http://a") is None
+        assert not path.exists()
+
+    def test_failed_save_leaves_no_files(self, cache_dir):
+        """A context that cannot report its state caches nothing."""
+        assert asyncio.run(SessionStore.save(StubContext(), "admin", "http://a")) is None
+        assert not cache_dir.exists() or list(cache_dir.iterdir()) == []
+
+    def test_invalidate(self, cache_dir):
+        """Invalidating deletes the cached state once."""
+        asyncio.run(SessionStore.save(StubContext(STATE), "admin", "http://a"))
+
+        assert SessionStore.invalidate("admin", "http://a") is True
+        assert SessionStore.invalidate("admin", "http://a") is False
+        assert SessionStore.load("admin", "http://a") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""Tests for similarity_index service."""
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.services.similarity_index import SimilarityIndex, compute_signature, compare_signatures
+
+
+def _page(path, accent, shift=0):
+    """Save a page-like image: header bar, form rows, accent button."""
+    img = Image.new("RGB", (320, 640), "white")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, 320, 48), fill=accent)
+    for row in range(6):
+        top = 80 + row * 60 + shift
+        draw.rectangle((24, top, 296, top + 28), outline="gray", width=2)
+    draw.rectangle((24, 560, 140, 600), fill=accent)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    img.save(path)
+    return path
+
+
+class TestSignatures:
+    """Test suite for perceptual hashes and their comparison."""
+
+    def test_identical_images_match_exactly(self, tmp_path):
+        """An image compared with itself has zero distance."""
+        signature = compute_signature(_page(tmp_path / "a.png", "navy"))
+        result = compare_signatures(signature, signature)
+
+        assert result["similarity"] == 1.0
+        assert result["phash_distance"] == 0 and result["dhash_distance"] == 0
+
+    def test_similar_layout_beats_different_image(self, tmp_path):
+        """A recolored page stays closer than an unrelated image."""
+        target = compute_signature(_page(tmp_path / "t.png", "navy"))
+        recolored = compute_signature(_page(tmp_path / "r.png", "darkblue"))
+        Image.new("RGB", (320, 640), "orange").save(tmp_path / "o.png")
+        other = compute_signature(tmp_path / "o.png")
+
+        assert compare_signatures(target, recolored)["similarity"] > compare_signatures(target, other)["similarity"]
+
+
+class TestSimilarityIndex:
+    """Test suite for the incremental index and nearest-match queries."""
+
+    def test_update_is_incremental(self, tmp_path):
+        """Unchanged files are not hashed again; deleted files drop out."""
+        customer_dir = tmp_path / "acme"
+        _page(customer_dir / "TARGET_01.png", "navy")
+        _page(customer_dir / "ROUND01_01.png", "red")
+        (customer_dir / "notes.png").write_bytes(b"")
+
+        assert SimilarityIndex.update(customer_dir) == 2
+        assert SimilarityIndex.update(customer_dir) == 0
+
+        (customer_dir / "ROUND01_01.png").unlink()
+        _page(customer_dir / "ROUND02_01.png", "green")
+
+        assert SimilarityIndex.update(customer_dir) == 1
+        assert set(SimilarityIndex._read(customer_dir)) == {"TARGET_01.png", "ROUND02_01.png"}
+
+    def test_find_similar_ranks_rounds(self, tmp_path):
+        """The round closest to the target comes first; targets are skipped."""
+        customer_dir = tmp_path / "acme"
+        query = _page(customer_dir / "TARGET_01.png", "navy")
+        _page(customer_dir / "TARGET_02.png", "navy")
+        _page(customer_dir / "ROUND01_01.png", "orange", shift=20)
+        _page(customer_dir / "ROUND02_01.png", "darkblue")
+
+        matches, searched = SimilarityIndex.find_similar(query, ["acme"], screenshots_dir=tmp_path)
+
+        assert searched == 2
+        assert [match["file"] for match in matches] == ["ROUND02_01.png", "ROUND01_01.png"]
+        assert matches[0]["round"] == 2 and matches[0]["customer"] == "acme"
+
+    def test_find_similar_across_customers(self, tmp_path):
+        """Scope "all" searches every customer directory."""
+        query = _page(tmp_path / "acme" / "TARGET_01.png", "navy")
+        _page(tmp_path / "globex" / "ROUND03_01.png", "navy")
+        (tmp_path / ".store").mkdir()
+
+        matches, _ = SimilarityIndex.find_similar(query, kind="all", screenshots_dir=tmp_path)
+
+        assert matches[0]["customer"] == "globex" and matches[0]["similarity"] == 1.0
+
+    def test_missing_query_raises(self, tmp_path):
+        """A query image that does not exist raises."""
+        with pytest.raises(FileNotFoundError):
+            SimilarityIndex.find_similar(tmp_path / "acme" / "TARGET_09.png", screenshots_dir=tmp_path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""Tests for static_frontend service."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.services.static_frontend import StaticFrontendServer, bundle_fingerprint
+
+
+class TestStaticFrontend:
+    """Test suite for the static bundle server."""
+
+    def test_serves_bundle_with_history_fallback(self, tmp_path):
+        """Bundle files are served as is; unknown routes get index.html."""
+        (tmp_path / "index.html").write_text("<html>app</html>")
+        (tmp_path / "main.bundle.js").write_text("console.log(1)")
+        (tmp_path.parent / "secret.txt").write_text("no")
+
+        async def run():
+            client = TestClient(TestServer(StaticFrontendServer.create_app(tmp_path)))
+            await client.start_server()
+            try:
+                bundle = await (await client.get("/main.bundle.js")).text()
+                route = await (await client.get("/persons/42")).text()
+                escaped = await (await client.get("/../secret.txt")).text()
+                return bundle, route, escaped
+            finally:
+                await client.close()
+
+        bundle, route, escaped = asyncio.run(run())
+
+        assert bundle == "console.log(1)"
+        assert route == "<html>app</html>"
+        assert escaped == "<html>app</html>"
+
+    def test_runtime_themes_use_display_names(self, tmp_path):
+        """Theme files are keyed like the client's bundled THEMES map."""
+        (tmp_path / "arctic-light.json").write_text(json.dumps({"colors": {"primaryColor": "#123456"}}))
+        (tmp_path / "broken.json").write_text("{")
+
+        themes = StaticFrontendServer.load_runtime_themes(tmp_path)
+
+        assert themes == {"Arctic Light": {"colors": {"primaryColor": "#123456"}}}
+
+    def test_fingerprint_ignores_theme_files(self, tmp_path):
+        """Editing a theme does not invalidate the bundle; editing a source does."""
+        themes_dir = tmp_path / "src" / "themes"
+        themes_dir.mkdir(parents=True)
+        (themes_dir / "acme.json").write_text("{}")
+        (tmp_path / "src" / "index.tsx").write_text("a")
+
+        before = bundle_fingerprint(tmp_path, themes_dir)
+        (themes_dir / "acme.json").write_text('{"changed": true}')
+        assert bundle_fingerprint(tmp_path, themes_dir) == before
+
+        (tmp_path / "src" / "index.tsx").write_text("ab")
+        assert bundle_fingerprint(tmp_path, themes_dir) != before
+
+    def test_build_id_is_not_recomputed(self, monkeypatch, tmp_path):
+        """The build id comes from the stamp file, or is fingerprinted once."""
+        calls = []
+
+        def fingerprint():
+            calls.append(1)
+            return f"fingerprint-{len(calls)}"
+
+        monkeypatch.setattr("src.services.static_frontend.bundle_fingerprint", fingerprint)
+        monkeypatch.setattr("src.services.static_frontend.FRONTEND_MODE", "static")
+        monkeypatch.setattr(StaticFrontendServer, "_build_id", None)
+        (tmp_path / ".bundle-stamp").write_text("stamped\n")
+
+        assert StaticFrontendServer.build_id(tmp_path) == "stamped"
+        assert calls == []
+
+        StaticFrontendServer.mark_bundle_built(tmp_path)
+        assert StaticFrontendServer.build_id(tmp_path) == "fingerprint-1"
+
+        monkeypatch.setattr("src.services.static_frontend.FRONTEND_MODE", "dev")
+        StaticFrontendServer.forget_build_id()
+        assert StaticFrontendServer.build_id(tmp_path) == "fingerprint-2"
+        assert StaticFrontendServer.build_id(tmp_path) == "fingerprint-2"
+        assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
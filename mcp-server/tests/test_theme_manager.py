@@ -6,7 +6,7 @@ import json
 import tempfile
 import shutil
 
-from src.services.theme_manager import ThemeManager
+from src.services.theme_manager import ThemeManager, parse_theme_path
 from src.config.constants import THEMES_DIR, BASE_THEME_FILE
 
 
@@ -95,5 +95,144 @@ class TestThemeManager:
         assert result is False
 
 
+
+class TestThemePatches:
+    """Test suite for incremental theme patches."""
+
+    SCHEMA = {
+        "colors": {
+            "primaryColor": "#4e5965",
+            "interaction": {"hover": {"color": "#d50075", "colorInverted": "#fff"}},
+        },
+        "typography": {"font": {"BASE_FONT_SIZE": 1}},
+    }
+
+    def test_parse_theme_path(self):
+        """JSON pointers and dotted paths address the same keys."""
+        expected = ["colors", "interaction", "hover", "color"]
+        assert parse_theme_path("colors.interaction.hover.color") == expected
+        assert parse_theme_path("/colors/interaction/hover/color") == expected
+        assert parse_theme_path("/a~1b/c~0d/0") == ["a/b", "c~d", 0]
+
+        with pytest.raises(ValueError):
+            parse_theme_path("colors..primaryColor")
+
+    def test_apply_patches(self):
+        """Patches change only the touched keys and report old/new values."""
+        theme = json.loads(json.dumps(self.SCHEMA))
+        patched, applied, warnings = ThemeManager.apply_patches(
+            theme,
+            [
+                {"path": "colors.interaction.hover.color", "value": "#ff0000"},
+                {"path": "/typography/font/BASE_FONT_SIZE", "value": 1.2},
+            ],
+            self.SCHEMA
+        )
+
+        assert patched["colors"]["interaction"]["hover"]["color"] == "#ff0000"
+        assert patched["typography"]["font"]["BASE_FONT_SIZE"] == 1.2
+        assert theme == self.SCHEMA  # input is not modified
+        assert applied[0] == {
+            "path": "colors.interaction.hover.color", "op": "replace", "old": "#d50075", "new": "#ff0000"
+        }
+        assert warnings == []
+
+    def test_apply_patches_copies_only_touched_paths(self):
+        """Untouched subtrees are shared with the input instead of copied."""
+        theme = json.loads(json.dumps(self.SCHEMA))
+        value = {"color": "#000000", "colorInverted": "#ffffff"}
+        patched, _, _ = ThemeManager.apply_patches(
+            theme,
+            [
+                {"path": "colors.interaction.hover", "value": value},
+                {"path": "colors.interaction.hover.color", "value": "#111111"},
+            ],
+            self.SCHEMA
+        )
+
+        assert patched["typography"] is theme["typography"]
+        assert patched["colors"] is not theme["colors"]
+        assert patched["colors"]["interaction"]["hover"]["color"] == "#111111"
+        assert value["color"] == "#000000"  # patch values are not modified either
+        assert theme == self.SCHEMA
+
+    def test_apply_patches_unchanged_value(self):
+        """Setting a value to what it already is reports no change."""
+        _, applied, _ = ThemeManager.apply_patches(
+            self.SCHEMA,
+            [{"path": "colors.primaryColor", "value": "#4e5965"}],
+            self.SCHEMA
+        )
+        assert applied == []
+
+    def test_apply_patches_is_atomic(self):
+        """One invalid patch rejects the whole batch."""
+        with pytest.raises(ValueError, match="not a valid color"):
+            ThemeManager.apply_patches(
+                self.SCHEMA,
+                [
+                    {"path": "colors.primaryColor", "value": "#000"},
+                    {"path": "colors.interaction.hover.color", "value": "not a color"},
+                ],
+                self.SCHEMA
+            )
+
+    def test_apply_patches_validates_subtree(self):
+        """Replacing an object must keep the keys the default theme defines."""
+        with pytest.raises(ValueError, match="colorInverted: missing"):
+            ThemeManager.apply_patches(
+                self.SCHEMA,
+                [{"path": "colors.interaction.hover", "value": {"color": "#000"}}],
+                self.SCHEMA
+            )
+
+        with pytest.raises(ValueError, match="expected number"):
+            ThemeManager.apply_patches(
+                self.SCHEMA,
+                [{"path": "typography.font.BASE_FONT_SIZE", "value": "16px"}],
+                self.SCHEMA
+            )
+
+    def test_apply_patches_add_and_remove(self):
+        """New keys need op 'add'; unknown keys are reported as warnings."""
+        with pytest.raises(ValueError, match="use op 'add'"):
+            ThemeManager.apply_patches(self.SCHEMA, [{"path": "colors.brand", "value": "#123456"}])
+
+        with pytest.raises(ValueError, match="requires a value"):
+            ThemeManager.apply_patches(self.SCHEMA, [{"path": "colors.brand", "op": "add", "value": None}])
+
+        patched, _, warnings = ThemeManager.apply_patches(
+            self.SCHEMA,
+            [
+                {"path": "colors.brand", "op": "add", "value": "#123456"},
+                {"path": "colors.accent", "op": "add", "value": "#654321"},
+                {"path": "colors.accent", "op": "remove"},
+            ],
+            self.SCHEMA
+        )
+
+        assert patched["colors"]["brand"] == "#123456"
+        assert "accent" not in patched["colors"]
+        assert warnings == [
+            "colors.brand: not defined in default theme, not validated",
+            "colors.accent: not defined in default theme, not validated",
+        ]
+
+    def test_apply_patches_keeps_default_keys(self):
+        """Keys the default theme defines cannot be removed."""
+        with pytest.raises(ValueError, match="colors.primaryColor: defined in default theme"):
+            ThemeManager.apply_patches(self.SCHEMA, [{"path": "colors.primaryColor", "op": "remove"}], self.SCHEMA)
+
+    def test_apply_patches_validates_colors(self):
+        """Named colors and keywords are colors; other words are not."""
+        for color in ("rebeccapurple", "Transparent", "currentColor"):
+            patched, _, _ = ThemeManager.apply_patches(
+                self.SCHEMA, [{"path": "colors.primaryColor", "value": color}], self.SCHEMA
+            )
+            assert patched["colors"]["primaryColor"] == color
+
+        with pytest.raises(ValueError, match="'banana' is not a valid color"):
+            ThemeManager.apply_patches(self.SCHEMA, [{"path": "colors.primaryColor", "value": "banana"}], self.SCHEMA)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
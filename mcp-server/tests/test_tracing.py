@@ -0,0 +1,96 @@
+"""Tests for tracing service."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.services.tracing import current_trace, span, start_trace, traced
+
+
+@traced()
+async def _step(result):
+    """Traced async step returning a bool."""
+    with span("inner"):
+        await asyncio.sleep(0)
+    return result
+
+
+class TestTracing:
+    """Test suite for timing spans and trace export."""
+
+    def test_nested_spans_and_status(self):
+        """Spans link to their parent and failed steps are marked as errors."""
+        async def run():
+            with start_trace("round", customer="acme") as trace:
+                await _step(True)
+                await _step(False)
+            return trace
+
+        trace = asyncio.run(run())
+        by_name = {}
+        for span_data in trace.spans:
+            by_name.setdefault(span_data["name"], []).append(span_data)
+
+        root = by_name["round"][0]
+        steps = by_name["_step"]
+        assert root["parent_id"] is None
+        assert all(step["parent_id"] == root["span_id"] for step in steps)
+        assert {inner["parent_id"] for inner in by_name["inner"]} == {step["span_id"] for step in steps}
+        assert [step["status"] for step in steps] == ["ok", "error"]
+        assert list(trace.summary()) == ["round", "_step", "inner"]
+
+    def test_exception_marks_span_as_error(self):
+        """An exception escaping a span is recorded and re-raised."""
+        with start_trace("round") as trace:
+            with pytest.raises(ValueError):
+                with span("boom"):
+                    raise ValueError("bad")
+
+        boom = next(s for s in trace.spans if s["name"] == "boom")
+        assert boom["status"] == "error"
+        assert "bad" in boom["attributes"]["error"]
+
+    def test_no_active_trace_is_noop(self):
+        """Spans outside a trace are not recorded anywhere."""
+        assert asyncio.run(_step(True)) is True
+        assert current_trace() is None
+
+    def test_concurrent_traces_stay_separate(self):
+        """Concurrent rounds each get only their own spans."""
+        async def round_(name):
+            with start_trace(name) as trace:
+                await _step(True)
+                await asyncio.sleep(0.01)
+                await _step(True)
+            return trace
+
+        async def run():
+            return await asyncio.gather(round_("a"), round_("b"))
+
+        first, second = asyncio.run(run())
+        assert len(first.spans) == len(second.spans) == 5
+        assert not {s["span_id"] for s in first.spans} & {s["span_id"] for s in second.spans}
+
+    def test_export_formats(self, tmp_path):
+        """Traces export as Chrome trace events and OpenTelemetry-style JSONL."""
+        with start_trace("round", customer="acme") as trace:
+            with span("capture_screenshot:ROUND01_03.png"):
+                pass
+
+        chrome_path = trace.export(tmp_path / "ROUND01.trace", "chrome")
+        otel_path = trace.export(tmp_path / "ROUND01.trace", "otel")
+
+        chrome = json.loads(chrome_path.read_text())
+        assert chrome_path.suffix == ".json"
+        assert {event["ph"] for event in chrome["traceEvents"]} == {"X"}
+        assert chrome["metadata"]["customer"] == "acme"
+
+        spans = [json.loads(line) for line in otel_path.read_text().splitlines()]
+        assert otel_path.suffix == ".jsonl"
+        assert {s["traceId"] for s in spans} == {trace.trace_id}
+        assert all(s["endTimeUnixNano"] >= s["startTimeUnixNano"] for s in spans)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])